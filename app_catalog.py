@@ -0,0 +1,143 @@
+"""설치된 앱 목록 캐시
+
+앱 선택 창을 열 때마다 /Applications를 다시 읽지 않도록
+설치된 앱 목록(이름, 번들 경로, 실행 파일 이름, 수정 시각)을
+디스크에 저장해 두고, 폴더 수정 시각이 바뀐 경우에만 다시 읽는다.
+갱신은 시작할 때 백그라운드 스레드에서 한다.
+"""
+import json
+import os
+import plistlib
+import threading
+
+from app_rules import normalize_name
+
+APP_DIRS = ['/Applications', os.path.expanduser('~/Applications')]
+CACHE_FILE = os.path.expanduser("~/.focus_mode_app_cache.json")
+CACHE_VERSION = 1
+
+
+def read_bundle_executable(bundle_path):
+    """번들의 Info.plist에서 실행 파일 이름 읽기 (없으면 None)"""
+    try:
+        with open(os.path.join(bundle_path, 'Contents', 'Info.plist'), 'rb') as f:
+            info = plistlib.load(f)
+    except (OSError, plistlib.InvalidFileException, ValueError):
+        return None
+    executable = info.get('CFBundleExecutable')
+    return normalize_name(executable) if isinstance(executable, str) else None
+
+
+class AppCatalog:
+    """설치된 앱 목록 (디스크 캐시 + 폴더 수정 시각 기반 무효화)
+
+    apps 형태: {번들 경로: {'name', 'path', 'executable', 'mtime'}}
+    """
+
+    def __init__(self, cache_file=CACHE_FILE, app_dirs=None):
+        self.cache_file = cache_file
+        self.app_dirs = list(app_dirs if app_dirs is not None else APP_DIRS)
+        self.apps = {}
+        self.dir_mtimes = {}
+        self.ready = threading.Event()  # 한 번이라도 목록을 가지고 있으면 설정
+        self.lock = threading.Lock()  # 갱신은 한 번에 하나만
+        self.thread = None
+
+    def load(self):
+        """디스크 캐시 불러오기 (없거나 깨졌으면 무시)"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != CACHE_VERSION:
+                return
+            self.apps = {entry['path']: entry for entry in data.get('apps', [])}
+            self.dir_mtimes = data.get('dir_mtimes', {})
+            self.ready.set()
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+
+    def save(self):
+        data = {
+            'version': CACHE_VERSION,
+            'dir_mtimes': self.dir_mtimes,
+            'apps': list(self.apps.values()),
+        }
+        tmp_path = self.cache_file + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_file)
+        except OSError:
+            pass
+
+    def _scan_dir(self, app_dir, previous):
+        """폴더의 .app 번들 목록 (수정 시각이 같은 번들은 이전 항목 재사용)"""
+        entries = {}
+        try:
+            items = os.scandir(app_dir)
+        except OSError:
+            return entries
+        with items:
+            for item in items:
+                if not item.name.endswith('.app'):
+                    continue
+                try:
+                    mtime = item.stat().st_mtime
+                except OSError:
+                    continue
+                old = previous.get(item.path)
+                if old is not None and old['mtime'] == mtime:
+                    entries[item.path] = old
+                    continue
+                entries[item.path] = {
+                    'name': normalize_name(item.name[:-4]),  # .app 제거
+                    'path': item.path,
+                    'executable': read_bundle_executable(item.path),
+                    'mtime': mtime,
+                }
+        return entries
+
+    def refresh(self):
+        """바뀐 폴더만 다시 읽어서 갱신 (변경 여부 반환)"""
+        with self.lock:
+            apps = {}
+            dir_mtimes = {}
+            changed = False
+            for app_dir in self.app_dirs:
+                try:
+                    mtime = os.stat(app_dir).st_mtime
+                except OSError:
+                    if self.dir_mtimes.get(app_dir) is not None:
+                        changed = True
+                    continue
+                dir_mtimes[app_dir] = mtime
+
+                previous = {path: entry for path, entry in self.apps.items()
+                            if os.path.dirname(path) == app_dir}
+                if self.dir_mtimes.get(app_dir) == mtime:
+                    apps.update(previous)
+                else:
+                    apps.update(self._scan_dir(app_dir, previous))
+                    changed = True
+
+            if changed:
+                # 읽는 쪽은 잠금 없이 참조만 하므로 통째로 교체
+                self.apps = apps
+                self.dir_mtimes = dir_mtimes
+                self.save()
+            self.ready.set()
+            return changed
+
+    def start_refresh(self):
+        """백그라운드에서 갱신"""
+        self.thread = threading.Thread(target=self.refresh, name="app-catalog", daemon=True)
+        self.thread.start()
+
+    def entries(self, timeout=None):
+        """설치된 앱 항목 목록 (캐시가 없으면 첫 갱신을 timeout까지 기다림)"""
+        self.ready.wait(timeout)
+        return list(self.apps.values())
+
+    def names(self, timeout=None):
+        """설치된 앱 이름 집합"""
+        return {entry['name'] for entry in self.entries(timeout)}
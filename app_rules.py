@@ -0,0 +1,226 @@
+"""차단 규칙 매처
+
+차단 목록을 감시 시작 시 한 번 컴파일해서 고정된 인덱스로 만든다.
+프로세스 하나를 검사하는 비용은 규칙 개수와 무관하다.
+
+규칙 문법 (차단 목록의 각 항목):
+- ``Slack``                          : 이름 정확히 일치
+- ``icase:slack``                    : 대소문자 무시 일치
+- ``glob:Google Chrome*``            : 글롭 패턴
+- ``re:Electron.*Helper$``           : 정규식 (이름 처음부터 일치)
+- ``path:/Applications/Slack.app``   : 실행 파일 경로 접두사
+- ``bundle:com.tinyspeck.slackmacgap`` : macOS 번들 ID (앱 이름을 바꿔도 유지됨)
+
+모든 이름과 패턴은 NFC로 정규화해서 비교한다.
+(macOS는 한글 파일명/프로세스명을 NFD로 반환)
+"""
+import fnmatch
+import re
+import unicodedata
+
+PREFIX_ICASE = 'icase:'
+PREFIX_GLOB = 'glob:'
+PREFIX_REGEX = 're:'
+PREFIX_PATH = 'path:'
+PREFIX_BUNDLE = 'bundle:'
+
+# Linux 프로세스 이름(comm) 최대 길이 - 이보다 긴 이름은 잘려서 보임
+TRUNCATED_NAME_LENGTH = 15
+
+# 정규식에서 리터럴 접두사를 끊는 문자
+_REGEX_META = set('.^$*+?{}[]\\|()')
+_GLOB_META = set('*?[')
+
+
+class RuleError(ValueError):
+    """잘못된 차단 규칙"""
+
+
+def normalize_name(name):
+    """앱 이름 유니코드 정규화 (NFD -> NFC)"""
+    return unicodedata.normalize('NFC', name)
+
+
+def _glob_prefix(pattern):
+    """글롭 패턴의 리터럴 접두사"""
+    for i, ch in enumerate(pattern):
+        if ch in _GLOB_META:
+            return pattern[:i]
+    return pattern
+
+
+def _regex_prefix(pattern):
+    """정규식의 리터럴 접두사 (확실하지 않으면 빈 문자열)"""
+    if '|' in pattern:
+        # 최상위 대안이 있을 수 있으므로 접두사를 쓰지 않음
+        return ''
+    for i, ch in enumerate(pattern):
+        if ch in _REGEX_META:
+            # 수량자가 붙은 마지막 문자는 접두사에서 제외
+            if ch in '*?{':
+                return pattern[:max(i - 1, 0)]
+            return pattern[:i]
+    return pattern
+
+
+def _can_wrap(source):
+    """그룹으로 감싸서 다른 패턴과 합쳐도 되는지 (전역 플래그 (?i) 등은 맨 앞에만 올 수 있음)"""
+    try:
+        re.compile(f'x|({source})')
+    except re.error:
+        return False
+    return True
+
+
+class _PatternGroup:
+    """같은 리터럴 접두사를 가진 패턴들을 합친 정규식"""
+    __slots__ = ('regex', 'group_rules')
+
+    def __init__(self, parts):
+        # 규칙마다 바깥 그룹을 두고, 일치한 그룹 번호(lastindex)로 규칙을 찾는다
+        # (사용자 정규식은 그룹이 없는 것만 들어옴)
+        group_rules = []
+        for source, rule in parts:
+            # 글롭 변환 결과 안의 그룹도 같은 규칙을 가리키도록 번호 채우기
+            group_rules.extend([rule] * (1 + re.compile(source).groups))
+        try:
+            self.regex = re.compile('|'.join(f'({source})' for source, _ in parts))
+        except re.error as e:
+            raise RuleError(f"패턴 결합 실패: {e}") from e
+        self.group_rules = tuple(group_rules)
+
+    def match(self, name):
+        m = self.regex.match(name)
+        if m is None:
+            return None
+        return self.group_rules[m.lastindex - 1]
+
+
+class RuleSet:
+    """컴파일된 차단 규칙 (불변)"""
+    __slots__ = ('rules', 'exact', 'folded', 'prefixed', 'prefix_lengths',
+                 'fallback', 'standalone', 'paths', 'bundles', 'truncated')
+
+    def __init__(self, rules, exact, folded, prefixed, fallback, paths, bundles=None,
+                 standalone=()):
+        self.rules = rules
+        self.exact = exact
+        self.folded = folded
+        self.prefixed = prefixed
+        self.prefix_lengths = tuple(sorted({len(prefix) for prefix in prefixed}))
+        self.fallback = fallback
+        self.standalone = standalone  # 합칠 수 없는 정규식 ((컴파일된 정규식, 규칙), ...)
+        self.paths = paths
+        self.bundles = bundles or {}
+        # 잘린 이름(comm)으로 보일 수 있는 긴 규칙 이름의 앞부분
+        self.truncated = frozenset(
+            [name[:TRUNCATED_NAME_LENGTH] for name in exact if len(name) > TRUNCATED_NAME_LENGTH]
+            + [name[:TRUNCATED_NAME_LENGTH] for name in folded if len(name) > TRUNCATED_NAME_LENGTH])
+
+    def __len__(self):
+        return len(self.rules)
+
+    def __bool__(self):
+        return bool(self.rules)
+
+    @property
+    def needs_exe(self):
+        """실행 파일 경로가 있어야 판정 가능한 규칙 존재 여부 (경로, 번들 ID)"""
+        return bool(self.paths or self.bundles)
+
+    def may_be_truncated(self, name):
+        """잘린 이름이 긴 규칙의 앞부분일 수 있는지 (명령줄을 읽어 볼 가치가 있는지)"""
+        if len(name) < TRUNCATED_NAME_LENGTH:
+            return False
+        if self.prefixed or self.fallback is not None or self.standalone:
+            return True  # 패턴은 접두사만으로 판정할 수 없음
+        name = normalize_name(name)
+        return name in self.truncated or name.casefold() in self.truncated
+
+    def match(self, name, exe=None, bundle_id=None):
+        """일치하는 규칙 반환 (없으면 None)"""
+        if name:
+            name = normalize_name(name)
+            rule = self.exact.get(name)
+            if rule is not None:
+                return rule
+            if self.folded:
+                rule = self.folded.get(name.casefold())
+                if rule is not None:
+                    return rule
+            # 이름의 접두사로 후보 패턴 묶음만 골라서 검사
+            for length in self.prefix_lengths:
+                if length > len(name):
+                    break
+                group = self.prefixed.get(name[:length])
+                if group is not None:
+                    rule = group.match(name)
+                    if rule is not None:
+                        return rule
+            if self.fallback is not None:
+                rule = self.fallback.match(name)
+                if rule is not None:
+                    return rule
+            for regex, rule in self.standalone:
+                if regex.match(name):
+                    return rule
+
+        if exe and self.paths:
+            # 경로의 상위 디렉터리를 차례로 확인 (깊이만큼만 조회)
+            path = normalize_name(exe)
+            while path:
+                rule = self.paths.get(path)
+                if rule is not None:
+                    return rule
+                path = path.rpartition('/')[0]
+
+        if bundle_id and self.bundles:
+            return self.bundles.get(bundle_id)
+        return None
+
+
+def compile_rules(rules):
+    """차단 목록을 RuleSet으로 컴파일 (잘못된 패턴이면 RuleError)"""
+    exact = {}
+    folded = {}
+    paths = {}
+    bundles = {}
+    buckets = {}  # 리터럴 접두사 -> [(정규식, 규칙)]
+    standalone = []  # 합치면 뜻이 바뀌는 정규식 [(컴파일된 정규식, 규칙)]
+
+    for rule in rules:
+        if rule.startswith(PREFIX_ICASE):
+            folded.setdefault(normalize_name(rule[len(PREFIX_ICASE):]).casefold(), rule)
+        elif rule.startswith(PREFIX_GLOB):
+            pattern = normalize_name(rule[len(PREFIX_GLOB):])
+            buckets.setdefault(_glob_prefix(pattern), []).append(
+                (fnmatch.translate(pattern), rule))
+        elif rule.startswith(PREFIX_REGEX):
+            source = normalize_name(rule[len(PREFIX_REGEX):])
+            try:
+                regex = re.compile(source)
+            except re.error as e:
+                raise RuleError(f"{rule}: {e}") from e
+            if regex.groups or not _can_wrap(source):
+                # 그룹 번호(역참조)/그룹 이름이 겹치거나 전역 플래그가 있으면 따로 검사
+                standalone.append((regex, rule))
+            else:
+                buckets.setdefault(_regex_prefix(source), []).append((source, rule))
+        elif rule.startswith(PREFIX_PATH):
+            path = normalize_name(rule[len(PREFIX_PATH):]).rstrip('/')
+            if path:
+                paths.setdefault(path, rule)
+        elif rule.startswith(PREFIX_BUNDLE):
+            bundle_id = rule[len(PREFIX_BUNDLE):].strip()
+            if bundle_id:
+                bundles.setdefault(bundle_id, rule)
+        else:
+            exact.setdefault(normalize_name(rule), rule)
+
+    # 글롭/정규식은 접두사별로 하나의 정규식으로 합쳐 한 번에 매칭
+    fallback_parts = buckets.pop('', None)
+    fallback = _PatternGroup(fallback_parts) if fallback_parts else None
+    prefixed = {prefix: _PatternGroup(parts) for prefix, parts in buckets.items()}
+
+    return RuleSet(tuple(rules), exact, folded, prefixed, fallback, paths, bundles,
+                   tuple(standalone))
@@ -0,0 +1,153 @@
+"""앱 선택 창 검색 인덱스
+
+- 대소문자, NFC/NFD, 악센트를 구분하지 않는다
+- 한글은 자모 단위로 비교해서 입력 중인 글자도 일치한다
+  ("카카ㅇ", "캌" -> "카카오톡"), 초성 검색도 지원한다 ("ㅋㅋㅇㅌ")
+- 글자별 포함 목록(1-gram 테이블)으로 후보를 좁힌 뒤 순위를 매긴다
+- 검색어가 이전 검색어에 이어서 길어지면 이전 결과 안에서만 찾는다
+"""
+import unicodedata
+
+_CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+_JONGSEONG = 'ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ'
+
+# 겹모음/겹받침은 입력 순서대로 풀어서 비교
+_COMPOUND = {
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ',
+    'ㄽ': 'ㄹㅅ', 'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+}
+
+
+def _build_jamo_map():
+    """조합형 자모(U+1100~)와 호환 자모(U+3131~)를 같은 문자열로 매핑"""
+    mapping = {}
+    for start, letters in ((0x1100, _CHOSEONG), (0x1161, _JUNGSEONG), (0x11A8, _JONGSEONG)):
+        for offset, letter in enumerate(letters):
+            mapping[chr(start + offset)] = _COMPOUND.get(letter, letter)
+    for letter, parts in _COMPOUND.items():
+        mapping[letter] = parts
+    return mapping
+
+
+_JAMO_MAP = _build_jamo_map()
+_CONSONANTS = set(_CHOSEONG)
+
+
+def search_key(text):
+    """검색 비교용 문자열 (자모 분해, 대소문자/악센트 무시)"""
+    out = []
+    for ch in unicodedata.normalize('NFD', text).casefold():
+        if unicodedata.category(ch) == 'Mn':
+            continue  # 악센트 등 결합 문자 제거
+        out.append(_JAMO_MAP.get(ch, ch))
+    return ''.join(out)
+
+
+def initials_key(text):
+    """초성 문자열 (한글이 아닌 글자는 그대로)"""
+    out = []
+    for ch in unicodedata.normalize('NFC', text).casefold():
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            out.append(_CHOSEONG[code // 588])
+        elif not ch.isspace():
+            out.append(ch)
+    return ''.join(out)
+
+
+def _subsequence_span(query, key):
+    """query 글자가 key에 순서대로 나오면 걸친 길이, 아니면 None"""
+    pos = -1
+    start = None
+    for ch in query:
+        pos = key.find(ch, pos + 1)
+        if pos < 0:
+            return None
+        if start is None:
+            start = pos
+    return pos - start + 1
+
+
+class SearchIndex:
+    """앱 이름 검색 인덱스"""
+
+    def __init__(self, names=()):
+        self.names = []
+        self.keys = []
+        self.initials = []
+        self.words = []  # 단어 시작 위치 집합
+        self.postings = {}  # 글자 -> 그 글자를 포함한 항목 번호 집합
+        self.last_query = None
+        self.last_ids = None
+        self.add(names)
+
+    def add(self, names):
+        """항목 추가 (스트리밍으로 도착하는 앱 목록용)"""
+        for name in names:
+            index = len(self.names)
+            key = search_key(name)
+            self.names.append(name)
+            self.keys.append(key)
+            self.initials.append(initials_key(name))
+            self.words.append({0} | {i + 1 for i, ch in enumerate(key) if not ch.isalnum()})
+            for ch in set(key) | set(self.initials[-1]):
+                self.postings.setdefault(ch, set()).add(index)
+        # 새 항목이 이전 결과에 빠져 있으므로 증분 검색 초기화
+        self.last_query = None
+        self.last_ids = None
+
+    def _candidates(self, query):
+        """후보 항목 번호 (이전 결과 또는 글자 포함 목록의 교집합)"""
+        if self.last_query is not None and query.startswith(self.last_query):
+            return self.last_ids
+        candidates = None
+        # 포함 목록이 작은 글자부터 교집합
+        for ch in sorted(set(query), key=lambda c: len(self.postings.get(c, ()))):
+            posting = self.postings.get(ch)
+            if not posting:
+                return set()
+            candidates = set(posting) if candidates is None else candidates & posting
+            if not candidates:
+                break
+        return candidates if candidates is not None else set(range(len(self.names)))
+
+    def _rank(self, query, index, is_initials):
+        """순위 (작을수록 앞) - 일치하지 않으면 None"""
+        key = self.keys[index]
+        if key == query:
+            return (0, 0)
+        if key.startswith(query):
+            return (1, len(key))
+        pos = key.find(query)
+        if pos >= 0:
+            if pos in self.words[index]:
+                return (2, pos)
+            return (3, pos)
+        if is_initials and query in self.initials[index]:
+            return (4, self.initials[index].find(query))
+        span = _subsequence_span(query, key)
+        if span is not None:
+            return (5, span)
+        return None
+
+    def search(self, text):
+        """검색어에 맞는 이름 목록 (순위순)"""
+        query = search_key(text.strip())
+        if not query:
+            self.last_query = None
+            self.last_ids = None
+            return list(self.names)
+
+        is_initials = all(ch in _CONSONANTS for ch in query)
+        ranked = []
+        for index in self._candidates(query):
+            rank = self._rank(query, index, is_initials)
+            if rank is not None:
+                ranked.append((rank, self.names[index], index))
+        ranked.sort()
+
+        self.last_query = query
+        self.last_ids = {index for _, _, index in ranked}
+        return [name for _, name, _ in ranked]
@@ -0,0 +1,325 @@
+"""감시 엔진 합성 벤치마크
+
+가짜 프로세스 테이블로 FocusEngine을 구동해서
+프로세스 수 / 규칙 수 / 생성 빈도에 따른 성능을 측정한다.
+tkinter나 디스플레이 없이 Linux 헤드리스 환경에서 실행 가능.
+
+측정 항목:
+- sweep_ms: 검사 1회 소요 시간 (cold_sweep_ms: 캐시가 빈 첫 검사)
+- latency_ms: 차단 앱 실행부터 종료 요청까지 걸린 시간
+- cpu_sec_per_hour: 감시 스레드 CPU 사용 시간 (1시간 환산)
+- alloc_peak_kib / alloc_blocks: 검사 1회당 임시 할당량 / 순증 메모리 블록 수
+
+사용법:
+    python benchmarks/bench_monitor.py --procs 100,1000,20000 --rules 10,500 \\
+        --churn 50 --duration 3 --output bench_output.json
+"""
+import argparse
+import json
+import os
+import platform
+import queue
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import psutil  # noqa: E402
+
+from app_rules import compile_rules  # noqa: E402
+from focus_engine import FocusEngine  # noqa: E402
+from process_watch import LaunchEventSource, PollingLaunchSource  # noqa: E402
+from session_clock import SessionClock  # noqa: E402
+
+# 차단 대상으로 생성되는 프로세스 비율
+BLOCKED_RATIO = 0.05
+
+
+class FakeProcessTable:
+    """메모리 위의 가짜 프로세스 테이블 (FocusEngine 제공자 인터페이스)"""
+    name = "fake"
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.procs = {}  # pid -> (create_time, name, 생성 시각)
+        self.next_pid = 1000
+        self.latencies = []
+        self.listeners = []
+
+    def pids(self):
+        with self.lock:
+            return list(self.procs)
+
+    def identify(self, pid):
+        try:
+            create_time, name, _ = self.procs[pid]
+        except KeyError:
+            raise psutil.NoSuchProcess(pid) from None
+        return create_time, name
+
+    def exe(self, pid):
+        try:
+            return f"/usr/bin/{self.procs[pid][1]}"
+        except KeyError:
+            raise psutil.NoSuchProcess(pid) from None
+
+    def cmdline(self, pid):
+        return [self.exe(pid)]
+
+    def spawn(self, name):
+        now = time.monotonic()
+        with self.lock:
+            pid = self.next_pid
+            self.next_pid += 1
+            self.procs[pid] = (time.time(), name, now)
+        for listener in self.listeners:
+            listener(pid)
+        return pid
+
+    def exit(self, pid):
+        with self.lock:
+            self.procs.pop(pid, None)
+
+    def suspend(self, pids, parents=False, before=None, allow_parent=None):
+        """FocusEngine suspender 인터페이스 - 재실행 폭주 대응도 종료로 처리"""
+        self.kill(pids)
+
+    def kill(self, pids):
+        """FocusEngine killer 인터페이스 - 종료하면서 지연 시간 기록"""
+        now = time.monotonic()
+        with self.lock:
+            for pid in pids:
+                entry = self.procs.pop(pid, None)
+                if entry is not None:
+                    self.latencies.append(now - entry[2])
+
+
+class FakeLaunchSource(LaunchEventSource):
+    """가짜 테이블의 생성 통지를 받는 이벤트 소스"""
+    name = "fake-event"
+
+    def __init__(self, table):
+        self.events = queue.Queue()
+        table.listeners.append(self.events.put)
+
+    def wait(self, timeout=1.0):
+        pids = []
+        try:
+            pids.append(self.events.get(timeout=timeout))
+            while True:
+                pids.append(self.events.get_nowait())
+        except queue.Empty:
+            pass
+        return [pid for pid in pids if pid is not None]
+
+    def wake(self):
+        self.events.put(None)
+
+
+def build_rules(count):
+    """규칙 목록 생성 (이름 60%, 글롭 20%, 정규식 20%)"""
+    rules = []
+    blocked_names = []
+    for i in range(count):
+        kind = i % 5
+        if kind < 3:
+            rules.append(f"App{i}")
+            blocked_names.append(f"App{i}")
+        elif kind == 3:
+            rules.append(f"glob:Helper{i} *")
+            blocked_names.append(f"Helper{i} (Renderer)")
+        else:
+            rules.append(f"re:Tool{i}-\\d+$")
+            blocked_names.append(f"Tool{i}-42")
+    return rules, blocked_names
+
+
+def percentiles(values, scale=1000.0):
+    """평균 / p50 / p95 / p99 / 최대 (기본 단위 ms)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+
+    def pick(q):
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * scale
+
+    return {
+        'count': len(ordered),
+        'mean': sum(ordered) / len(ordered) * scale,
+        'p50': pick(0.50),
+        'p95': pick(0.95),
+        'p99': pick(0.99),
+        'max': ordered[-1] * scale,
+    }
+
+
+def populate(table, procs):
+    for i in range(procs):
+        table.spawn(f"proc{i % 500}")
+
+
+def measure_allocations(procs, rules, churn, sweeps=20):
+    """검사 1회당 임시 할당량 / 순증 블록 수"""
+    rule_list, blocked_names = build_rules(rules)
+    table = FakeProcessTable()
+    populate(table, procs)
+    engine = FocusEngine(compile_rules(rule_list), SessionClock(3600),
+                         process_table=table, killer=table.kill, suspender=table.suspend)
+    engine.sweep()  # 캐시 채우기
+
+    rng = random.Random(1)
+    per_sweep = max(1, churn)
+    peaks = []
+    blocks = []
+    tracemalloc.start()
+    try:
+        for _ in range(sweeps):
+            for _ in range(per_sweep):
+                table.spawn(rng.choice(blocked_names) if rng.random() < BLOCKED_RATIO
+                            else f"proc{rng.randrange(500)}")
+            before_blocks = sys.getallocatedblocks()
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            engine.sweep()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - current)
+            blocks.append(sys.getallocatedblocks() - before_blocks)
+    finally:
+        tracemalloc.stop()
+    return sum(peaks) / len(peaks) / 1024, sum(blocks) / len(blocks)
+
+
+def run_scenario(procs, rules, churn, duration, mode, seed=0):
+    """한 가지 조건으로 엔진을 duration초 동안 구동"""
+    rng = random.Random(seed)
+    rule_list, blocked_names = build_rules(rules)
+    table = FakeProcessTable()
+    populate(table, procs)
+
+    if mode == 'event':
+        source_factory = lambda: FakeLaunchSource(table)  # noqa: E731
+    else:
+        source_factory = PollingLaunchSource
+
+    engine = FocusEngine(compile_rules(rule_list), SessionClock(duration),
+                         process_table=table, source_factory=source_factory,
+                         killer=table.kill, suspender=table.suspend)
+
+    # 검사 시간 측정을 위해 sweep 감싸기
+    sweep_times = []
+    original_sweep = engine.sweep
+
+    def timed_sweep(pids=None, recheck=False):
+        started = time.perf_counter()
+        try:
+            return original_sweep(pids, recheck=recheck)
+        finally:
+            sweep_times.append(time.perf_counter() - started)
+
+    engine.sweep = timed_sweep
+
+    cpu = {}
+
+    def engine_thread():
+        started = time.thread_time()
+        engine.run()
+        cpu['used'] = time.thread_time() - started
+
+    # 실제 프로세스처럼 생성/종료를 반복하는 스레드
+    stop = threading.Event()
+
+    def spawner():
+        interval = 1.0 / churn if churn > 0 else None
+        while interval and not stop.wait(interval):
+            if rng.random() < BLOCKED_RATIO:
+                table.spawn(rng.choice(blocked_names))
+            else:
+                table.spawn(f"proc{rng.randrange(500)}")
+                victims = table.pids()
+                table.exit(victims[rng.randrange(len(victims))])
+
+    wall_start = time.monotonic()
+    worker = threading.Thread(target=engine_thread)
+    worker.start()
+    spawn_thread = threading.Thread(target=spawner, daemon=True)
+    spawn_thread.start()
+    worker.join()
+    stop.set()
+    wall = time.monotonic() - wall_start
+
+    alloc_kib, alloc_blocks = measure_allocations(procs, rules, churn)
+
+    return {
+        'procs': procs,
+        'rules': rules,
+        'churn_per_sec': churn,
+        'mode': mode,
+        'duration_sec': round(wall, 3),
+        'cold_sweep_ms': sweep_times[0] * 1000 if sweep_times else None,
+        'sweep_ms': percentiles(sweep_times[1:]),
+        'latency_ms': percentiles(table.latencies),
+        'cpu_sec_per_hour': cpu.get('used', 0.0) / wall * 3600,
+        'alloc_peak_kib': alloc_kib,
+        'alloc_blocks': alloc_blocks,
+    }
+
+
+def format_row(result):
+    sweep = result['sweep_ms'] or {}
+    latency = result['latency_ms'] or {}
+    return (f"{result['mode']:>8} procs={result['procs']:>6} rules={result['rules']:>5} "
+            f"cold={result['cold_sweep_ms'] or 0:8.2f}ms "
+            f"sweep p50={sweep.get('p50', 0):7.3f}ms p99={sweep.get('p99', 0):7.3f}ms "
+            f"latency p50={latency.get('p50', 0):8.2f}ms p99={latency.get('p99', 0):8.2f}ms "
+            f"cpu={result['cpu_sec_per_hour']:7.2f}s/h "
+            f"alloc={result['alloc_peak_kib']:7.1f}KiB")
+
+
+def parse_list(text):
+    return [int(value) for value in text.split(',') if value]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="감시 엔진 합성 벤치마크")
+    parser.add_argument('--procs', type=parse_list, default=[100, 1000, 5000, 20000],
+                        help="프로세스 수 목록 (쉼표 구분)")
+    parser.add_argument('--rules', type=parse_list, default=[10, 500],
+                        help="규칙 수 목록 (쉼표 구분)")
+    parser.add_argument('--churn', type=int, default=50,
+                        help="초당 생성되는 프로세스 수")
+    parser.add_argument('--duration', type=float, default=3.0,
+                        help="조건별 구동 시간 (초)")
+    parser.add_argument('--modes', default='event,polling',
+                        help="실행 이벤트 소스 (event, polling)")
+    parser.add_argument('--output', help="결과 JSON 저장 경로 (기본: 표준 출력)")
+    args = parser.parse_args(argv)
+
+    results = []
+    for mode in args.modes.split(','):
+        for procs in args.procs:
+            for rules in args.rules:
+                result = run_scenario(procs, rules, args.churn, args.duration, mode)
+                print(format_row(result), file=sys.stderr)
+                results.append(result)
+
+    report = {
+        'benchmark': 'monitor',
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+"""프로세스 테이블 제공자 벤치마크 (Linux)
+
+실제 프로세스를 목표 개수까지 띄운 뒤 제공자별로
+PID 목록과 전체 프로세스 식별(생성 시각 + 이름)에 걸리는 시간을 비교한다.
+기준값으로 psutil.process_iter(['name', 'create_time'])도 함께 측정한다.
+
+측정 항목 (반복 측정의 p50, ms):
+- pids_ms: PID 목록
+- identify_ms: 모든 PID의 identify() (스캐너 첫 검사에 해당)
+- cold_scan_ms / warm_scan_ms: ProcessScanner 첫 검사 / 변화 없는 다음 검사
+- process_iter_ms: psutil.process_iter 기준값
+
+띄울 프로세스 수가 사용자 프로세스 한도(ulimit -u)나 pid_max를 넘으면 그 크기는 건너뛴다.
+
+사용법:
+    python benchmarks/bench_process_table.py --procs 1000,5000,20000 --output table.json
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import psutil  # noqa: E402
+
+from process_table import PROCESS_TABLES, ProcessScanner  # noqa: E402
+
+# 한도까지 띄우지 않도록 남겨 둘 프로세스 수
+SPARE_PROCS = 200
+
+
+def process_limit():
+    """더 띄울 수 있는 프로세스 수 (ulimit -u, pid_max 중 작은 값 기준)"""
+    limits = []
+    soft, _ = resource.getrlimit(resource.RLIMIT_NPROC)
+    if soft != resource.RLIM_INFINITY:
+        limits.append(soft)
+    try:
+        with open('/proc/sys/kernel/pid_max') as f:
+            limits.append(int(f.read()))
+    except OSError:
+        pass
+    if not limits:
+        return None
+    return min(limits) - len(psutil.pids()) - SPARE_PROCS
+
+
+class Population:
+    """벤치마크용 sleep 프로세스 묶음"""
+
+    def __init__(self):
+        self.children = []
+
+    def grow_to(self, total):
+        """시스템 전체 프로세스 수가 total이 될 때까지 띄움"""
+        missing = total - len(psutil.pids())
+        for _ in range(max(0, missing)):
+            self.children.append(subprocess.Popen(
+                ['sleep', '3600'], stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL))
+
+    def close(self):
+        for child in self.children:
+            child.kill()
+        for child in self.children:
+            child.wait()
+        self.children = []
+
+
+def timed(func, repeat):
+    """repeat번 실행한 소요 시간의 p50 (ms)"""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    times.sort()
+    return times[len(times) // 2] * 1000
+
+
+def identify_all(table):
+    pids = table.pids()
+    for pid in pids:
+        try:
+            table.identify(pid)
+        except psutil.Error:
+            pass
+
+
+def process_iter_all():
+    for _ in psutil.process_iter(['name', 'create_time']):
+        pass
+
+
+def measure(repeat):
+    """현재 프로세스 테이블에서 제공자별 측정"""
+    result = {'procs': len(psutil.pids())}
+    for kind, factory in PROCESS_TABLES.items():
+        table = factory()
+
+        def cold_scan():
+            ProcessScanner(table).scan()
+
+        scanner = ProcessScanner(table)
+        scanner.scan()
+        result[kind] = {
+            'pids_ms': timed(table.pids, repeat),
+            'identify_ms': timed(lambda: identify_all(table), repeat),
+            'cold_scan_ms': timed(cold_scan, repeat),
+            'warm_scan_ms': timed(scanner.scan, repeat),
+        }
+    psutil.process_iter.cache_clear()
+    result['process_iter_ms'] = timed(lambda: (psutil.process_iter.cache_clear(), process_iter_all()),
+                                      repeat)
+    result['speedup'] = result['psutil']['identify_ms'] / result['proc']['identify_ms']
+    return result
+
+
+def parse_list(text):
+    return [int(value) for value in text.split(',') if value]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="프로세스 테이블 제공자 벤치마크 (Linux)")
+    parser.add_argument('--procs', type=parse_list, default=[1000, 5000, 20000],
+                        help="시스템 전체 프로세스 수 목록 (쉼표 구분)")
+    parser.add_argument('--repeat', type=int, default=5, help="측정 반복 횟수")
+    parser.add_argument('--output', help="결과 JSON 저장 경로 (기본: 표준 출력)")
+    args = parser.parse_args(argv)
+
+    if not sys.platform.startswith('linux'):
+        print("/proc 제공자는 Linux에서만 측정할 수 있습니다.", file=sys.stderr)
+        return 1
+
+    limit = process_limit()
+    baseline = len(psutil.pids())
+    population = Population()
+    results = []
+    skipped = []
+    try:
+        for procs in sorted(args.procs):
+            if limit is not None and procs - baseline > limit:
+                print(f"procs={procs}: 프로세스 한도를 넘어서 건너뜀", file=sys.stderr)
+                skipped.append(procs)
+                continue
+            population.grow_to(procs)
+            result = measure(args.repeat)
+            print(f"procs={result['procs']:>6} "
+                  f"proc identify={result['proc']['identify_ms']:8.2f}ms "
+                  f"psutil identify={result['psutil']['identify_ms']:8.2f}ms "
+                  f"process_iter={result['process_iter_ms']:8.2f}ms "
+                  f"x{result['speedup']:.1f}", file=sys.stderr)
+            results.append(result)
+    finally:
+        population.close()
+
+    report = {
+        'benchmark': 'process_table',
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'psutil': psutil.__version__,
+        'skipped': skipped,
+        'results': results,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""시작 시간 벤치마크
+
+실행 경로별로 프로세스 시작부터 끝까지 걸린 시간과 모듈별 import 시간을 측정한다.
+디스플레이 없이 실행할 수 있도록 첫 번째 인스턴스는 창을 띄우기 전까지
+(모듈 import)만 측정한다.
+
+측정 경로:
+- python: 빈 인터프리터 (기준값)
+- second_instance: 이미 창이 떠 있을 때 app_blocker_gui.py 실행 (raise 요청 후 종료)
+- first_instance_import: 처음 실행할 때 창을 띄우기 전까지 불러오는 모듈 (focus_gui)
+- daemon_import: 창 없는 감시 데몬 (focus_daemon + control_server)
+
+cold는 매번 빈 바이트코드 캐시(PYTHONPYCACHEPREFIX)로, warm은 미리 채운 캐시로 실행한다.
+
+사용법:
+    python benchmarks/bench_startup.py --runs 20 --output startup.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from control_server import ControlServer  # noqa: E402
+
+# 두 번째 인스턴스 목표 시간 (ms)
+SECOND_INSTANCE_TARGET_MS = 50
+
+SCENARIOS = {
+    'python': ['-c', 'pass'],
+    'second_instance': [os.path.join(ROOT, 'app_blocker_gui.py')],
+    'first_instance_import': ['-c', 'import focus_gui'],
+    'daemon_import': ['-c', 'import focus_daemon, control_server'],
+}
+
+
+def run_once(args, env, importtime=False):
+    """한 번 실행해서 걸린 시간(초)과 stderr 반환"""
+    command = [sys.executable] + (['-X', 'importtime'] if importtime else []) + args
+    started = time.perf_counter()
+    result = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} 실패: {result.stderr.strip()[-500:]}")
+    return elapsed, result.stderr
+
+
+def parse_importtime(text, top=15):
+    """-X importtime 출력에서 누적 시간이 긴 모듈 (ms)"""
+    modules = []
+    for line in text.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_part, cumulative_us, name = line.split('|')
+        self_us = int(self_part.split(':')[1])
+        modules.append({
+            'module': name.strip(),
+            'depth': (len(name) - len(name.lstrip()) - 1) // 2,
+            'self_ms': self_us / 1000,
+            'cumulative_ms': int(cumulative_us) / 1000,
+        })
+    modules.sort(key=lambda m: m['cumulative_ms'], reverse=True)
+    return modules[:top]
+
+
+def summarize(values):
+    ordered = sorted(v * 1000 for v in values)
+    return {
+        'runs': len(ordered),
+        'min': ordered[0],
+        'p50': ordered[len(ordered) // 2],
+        'max': ordered[-1],
+    }
+
+
+def measure(name, runs, env):
+    args = SCENARIOS[name]
+    result = {}
+
+    # cold: 실행마다 빈 바이트코드 캐시
+    cold = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as cache:
+            cold.append(run_once(args, dict(env, PYTHONPYCACHEPREFIX=cache))[0])
+    result['cold_ms'] = summarize(cold)
+
+    # warm: 한 번 채운 캐시 재사용
+    with tempfile.TemporaryDirectory() as cache:
+        warm_env = dict(env, PYTHONPYCACHEPREFIX=cache)
+        run_once(args, warm_env)
+        result['warm_ms'] = summarize([run_once(args, warm_env)[0] for _ in range(runs)])
+        result['imports'] = parse_importtime(run_once(args, warm_env, importtime=True)[1])
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="시작 시간 벤치마크")
+    parser.add_argument('--runs', type=int, default=10, help="경로별 반복 횟수")
+    parser.add_argument('--output', help="결과 JSON 저장 경로 (기본: 표준 출력)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as home:
+        # 실제 설정/소켓을 건드리지 않도록 임시 HOME에서 실행
+        env = dict(os.environ, HOME=home)
+        env.pop('PYTHONDONTWRITEBYTECODE', None)  # warm 캐시를 채울 수 있도록
+        socket_path = os.path.join(home, '.focus_mode.sock')
+
+        # 두 번째 인스턴스가 붙을 "이미 떠 있는 창" 역할 (raise만 받음)
+        server = ControlServer(daemon=None, path=socket_path, on_raise=lambda: None)
+        server.start()
+        try:
+            results = {}
+            for name in SCENARIOS:
+                results[name] = measure(name, args.runs, env)
+                print(f"{name:>22} cold p50={results[name]['cold_ms']['p50']:7.1f}ms "
+                      f"warm p50={results[name]['warm_ms']['p50']:7.1f}ms", file=sys.stderr)
+        finally:
+            server.stop()
+
+    second = results['second_instance']['warm_ms']['p50']
+    report = {
+        'benchmark': 'startup',
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'second_instance_target_ms': SECOND_INSTANCE_TARGET_MS,
+        'second_instance_within_target': second < SECOND_INSTANCE_TARGET_MS,
+        'results': results,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,278 @@
+"""설정 저장소 (메모리에서 읽고, 모아서 원자적으로 기록)
+
+- 읽기는 메모리의 값만 참조한다
+- 변경은 SAVE_DELAY 동안 모았다가 한 번에 기록한다 (클릭마다 쓰지 않음)
+- 기록은 임시 파일 + fsync + rename으로 해서 중간에 끊겨도 파일이 깨지지 않는다
+- 파일에 스키마 버전을 두고, 예전 형식은 불러올 때 순서대로 변환한다
+- 차단 앱 목록은 이름 붙은 프로필별로 저장하고 활성 프로필 하나를 쓴다
+
+버전 2 형식:
+    {
+      "version": 2,
+      "active_profile": "기본",
+      "profiles": {"기본": {"blocked_apps": [...], "app_actions": {"Xcode": "freeze", "Slack": "throttle"}}, "업무": {...}},
+      "scheduler": {...},
+      "metrics_file": "..."   (선택)
+    }
+"""
+import copy
+import json
+import os
+import threading
+
+CONFIG_FILE = os.path.expanduser("~/.focus_mode_config.json")
+# CPU 제한 전 원래 값 기록 (비정상 종료 후 복원용, throttle.py)
+THROTTLED_FILE = os.path.expanduser("~/.focus_mode_throttled.json")
+SCHEMA_VERSION = 2
+DEFAULT_PROFILE = "기본"
+
+# 앱별 차단 방식 (app_actions에 없으면 block)
+ACTION_BLOCK = 'block'  # 프로세스 종료
+ACTION_FREEZE = 'freeze'  # 세션 동안 일시 정지, 끝나면 재개
+ACTION_THROTTLE = 'throttle'  # 종료하지 않고 CPU 사용만 제한, 끝나면 복원
+ACTIONS = (ACTION_BLOCK, ACTION_FREEZE, ACTION_THROTTLE)
+
+# 최상위 항목별 형식 (어긋나면 항목을 지워서 기본값을 쓰게 함)
+SECTION_TYPES = {
+    'scheduler': dict,
+    'respawn': dict,
+    'throttle': dict,
+    'metrics_file': str,
+    'process_table': str,
+}
+
+# 변경 후 기록까지 기다리는 시간 (초)
+SAVE_DELAY = 0.5
+
+
+def _migrate_v1(data):
+    """버전 1 (버전 표시 없음, blocked_apps 하나) -> 버전 2 (프로필)"""
+    rest = dict(data)
+    apps = rest.pop('blocked_apps', [])
+    return {
+        'version': 2,
+        'active_profile': DEFAULT_PROFILE,
+        'profiles': {DEFAULT_PROFILE: {'blocked_apps': apps}},
+        **rest,
+    }
+
+
+# 버전 -> 다음 버전으로 바꾸는 함수
+MIGRATIONS = {
+    1: _migrate_v1,
+}
+
+
+def migrate(data):
+    """저장된 설정을 현재 스키마 버전으로 변환"""
+    version = data.get('version', 1)
+    while version < SCHEMA_VERSION:
+        data = MIGRATIONS[version](data)
+        version = data['version']
+    return data
+
+
+def _default_data():
+    return {
+        'version': SCHEMA_VERSION,
+        'active_profile': DEFAULT_PROFILE,
+        'profiles': {DEFAULT_PROFILE: {'blocked_apps': []}},
+    }
+
+
+def _validate(data):
+    """형식이 어긋난 부분은 기본값으로 채움"""
+    profiles = data.get('profiles')
+    if not isinstance(profiles, dict) or not profiles:
+        profiles = {DEFAULT_PROFILE: {'blocked_apps': []}}
+    for name, profile in list(profiles.items()):
+        if not isinstance(profile, dict):
+            profile = profiles[name] = {}
+        apps = profile.get('blocked_apps')
+        profile['blocked_apps'] = [app for app in apps if isinstance(app, str)] \
+            if isinstance(apps, list) else []
+        actions = profile.get('app_actions')
+        if isinstance(actions, dict):
+            profile['app_actions'] = {app: action for app, action in actions.items()
+                                      if action in ACTIONS and action != ACTION_BLOCK}
+        else:
+            profile.pop('app_actions', None)
+    data['profiles'] = profiles
+    if data.get('active_profile') not in profiles:
+        data['active_profile'] = next(iter(profiles))
+    for key, kind in SECTION_TYPES.items():
+        if key in data and not isinstance(data[key], kind):
+            print(f"설정 항목 {key}의 형식이 올바르지 않아 기본값을 사용합니다.")
+            del data[key]
+    return data
+
+
+class ConfigStore:
+    """설정 파일 하나를 관리"""
+
+    def __init__(self, path=CONFIG_FILE, save_delay=SAVE_DELAY):
+        self.path = path
+        self.save_delay = save_delay
+        self.data = _default_data()
+        self.lock = threading.Lock()  # 메모리의 설정 (디스크 기록 중에는 잡지 않음)
+        self.write_lock = threading.Lock()  # 기록은 한 번에 하나씩
+        self.timer = None  # 예약된 기록
+        self.dirty = False
+
+    def load(self):
+        """파일에서 불러오기 (없으면 기본값, 깨졌으면 따로 보관하고 기본값)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("최상위 값이 객체가 아님")
+            if data.get('version', 1) > SCHEMA_VERSION:
+                print(f"설정 파일 버전({data['version']})이 더 새 버전입니다. 알 수 없는 항목은 유지합니다.")
+            migrated = data.get('version', 1) < SCHEMA_VERSION
+            data = _validate(migrate(data))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"설정 파일을 읽을 수 없어 기본값을 사용합니다: {e}")
+            try:
+                os.replace(self.path, self.path + '.broken')
+            except OSError:
+                pass
+            return
+        with self.lock:
+            self.data = data
+        if migrated:
+            self.schedule_save()
+
+    # 읽기 (메모리)
+
+    def get(self, key, default=None):
+        with self.lock:
+            return copy.deepcopy(self.data.get(key, default))
+
+    @property
+    def active_profile(self):
+        return self.data['active_profile']
+
+    def profiles(self):
+        """프로필 이름 목록"""
+        with self.lock:
+            return list(self.data['profiles'])
+
+    def blocked_apps(self, profile=None):
+        """프로필의 차단 앱 목록 (기본: 활성 프로필)"""
+        with self.lock:
+            name = profile or self.data['active_profile']
+            return list(self.data['profiles'].get(name, {}).get('blocked_apps', []))
+
+    def app_actions(self, profile=None):
+        """프로필의 앱별 차단 방식 {앱: 방식} (block은 생략)"""
+        with self.lock:
+            name = profile or self.data['active_profile']
+            return dict(self.data['profiles'].get(name, {}).get('app_actions', {}))
+
+    # 쓰기 (메모리 반영 후 기록 예약)
+
+    def set(self, key, value):
+        with self.lock:
+            if value is None:
+                self.data.pop(key, None)
+            else:
+                self.data[key] = copy.deepcopy(value)
+        self.schedule_save()
+
+    def set_blocked_apps(self, apps, profile=None):
+        with self.lock:
+            name = profile or self.data['active_profile']
+            self.data['profiles'].setdefault(name, {})['blocked_apps'] = list(apps)
+        self.schedule_save()
+
+    def set_app_actions(self, actions, profile=None):
+        with self.lock:
+            name = profile or self.data['active_profile']
+            entry = self.data['profiles'].setdefault(name, {})
+            actions = {app: action for app, action in actions.items() if action != ACTION_BLOCK}
+            if actions:
+                entry['app_actions'] = actions
+            else:
+                entry.pop('app_actions', None)
+        self.schedule_save()
+
+    def switch_profile(self, name):
+        """활성 프로필 변경 (없으면 빈 프로필로 만듦)"""
+        with self.lock:
+            self.data['profiles'].setdefault(name, {'blocked_apps': []})
+            self.data['active_profile'] = name
+        self.schedule_save()
+
+    def delete_profile(self, name):
+        """프로필 삭제 (마지막 남은 프로필은 삭제 불가)"""
+        with self.lock:
+            profiles = self.data['profiles']
+            if name not in profiles or len(profiles) == 1:
+                return False
+            del profiles[name]
+            if self.data['active_profile'] == name:
+                self.data['active_profile'] = next(iter(profiles))
+        self.schedule_save()
+        return True
+
+    # 기록
+
+    def schedule_save(self):
+        """SAVE_DELAY 뒤에 기록 (그 사이 변경은 한 번에 기록)"""
+        with self.lock:
+            self.dirty = True
+            if self.timer is not None:
+                return
+            self.timer = threading.Timer(self.save_delay, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def flush(self):
+        """예약된 변경을 바로 기록 (종료 시 호출)"""
+        # 기록 잠금 안에서 내용을 만들고 기록해서 늦게 시작한 기록(더 새 내용)이 항상 나중에 끝남
+        # 설정 잠금은 내용을 만드는 동안만 잡으므로 기록 중에도 읽기는 막히지 않음
+        with self.write_lock:
+            with self.lock:
+                if self.timer is not None:
+                    self.timer.cancel()
+                    self.timer = None
+                if not self.dirty:
+                    return
+                self.dirty = False
+                text = json.dumps(self.data, ensure_ascii=False, indent=2)
+            self._write(text)
+
+    def _write(self, text):
+        try:
+            write_atomic(self.path, text)
+        except OSError as e:
+            with self.lock:
+                self.dirty = True  # 다음 기록 때 다시 시도
+            print(f"설정 저장 실패: {e}")
+
+
+def write_atomic(path, text):
+    """임시 파일에 쓰고 fsync 후 이름을 바꿔서 기록 (실패하면 OSError)"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    _fsync_dir(path)
+
+
+def _fsync_dir(path):
+    """rename 결과까지 디스크에 남도록 폴더 fsync (지원하지 않으면 무시)"""
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,245 @@
+"""감시 데몬 제어 클라이언트
+
+데몬(또는 데몬을 품은 GUI)은 Unix 도메인 소켓(~/.focus_mode.sock)에서
+줄 단위 JSON 명령을 받는다. AF_UNIX가 없는 환경에서는 localhost TCP를 쓴다.
+
+요청: {"cmd": "status", "id": 1}
+응답: {"ok": true, "result": {...}, "id": 1}
+      {"ok": false, "error": "메시지", "error_type": "session" | "rule" | "invalid" | "no_ui" | "internal"}
+
+명령:
+- start {"minutes": 분} 또는 {"seconds": 초}, 선택 {"super_mode": true}
+- stop
+- status
+- stats
+- add_app {"app": 이름} / remove_app {"app": 이름} / set_apps {"apps": [...]}
+- set_action {"app": 이름, "action": "block" | "freeze" | "throttle"} - 앱별 차단 방식
+- profile (선택 {"action": "list" | "switch" | "delete", "name": 이름}) - 프로필 목록/변경/삭제
+- subscribe (선택 {"ui": true}) - 이후 같은 연결로 이벤트가 한 줄씩 옴
+- raise - 창을 앞으로 (창이 없으면 no_ui 오류)
+
+사용법 (스크립트/상태 표시줄용):
+    python control_client.py status
+    python control_client.py start 25
+    python control_client.py action Xcode freeze
+    python control_client.py profile switch 업무
+    python control_client.py subscribe
+"""
+import json
+import os
+import socket
+import sys
+import threading
+
+SOCKET_PATH = os.path.expanduser("~/.focus_mode.sock")
+FALLBACK_PORT = 47200  # AF_UNIX가 없을 때 쓰는 localhost 포트
+TIMEOUT = 2.0
+
+
+class ControlError(Exception):
+    """데몬이 오류 응답을 보냄"""
+
+    def __init__(self, message, error_type=None):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+def connect(path=SOCKET_PATH, timeout=TIMEOUT):
+    """데몬에 연결 (실행 중이 아니면 OSError)"""
+    if hasattr(socket, 'AF_UNIX'):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        address = path
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        address = ('127.0.0.1', FALLBACK_PORT)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(address)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _read_lines(sock):
+    """연결에서 한 줄씩 JSON 읽기"""
+    buffer = b''
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            return
+        buffer += chunk
+        while b'\n' in buffer:
+            line, buffer = buffer.split(b'\n', 1)
+            if line.strip():
+                yield json.loads(line)
+
+
+def _result(response):
+    if not response.get('ok'):
+        raise ControlError(response.get('error', '알 수 없는 오류'), response.get('error_type'))
+    return response.get('result')
+
+
+def request(cmd, path=SOCKET_PATH, timeout=TIMEOUT, **args):
+    """명령 하나 보내고 결과 반환 (오류 응답이면 ControlError)"""
+    with connect(path, timeout) as sock:
+        sock.sendall(json.dumps(dict(args, cmd=cmd), ensure_ascii=False).encode() + b'\n')
+        for response in _read_lines(sock):
+            return _result(response)
+    raise ConnectionError("응답 없이 연결이 끊어졌습니다.")
+
+
+class DaemonClient:
+    """다른 프로세스에서 실행 중인 데몬에 붙는 GUI용 클라이언트
+
+    FocusDaemon과 같은 메서드를 제공하므로 GUI는 어느 쪽인지 구분하지 않는다.
+    이벤트는 구독 연결을 읽는 스레드에서 콜백으로 전달되고,
+    연결이 끊어지면 {'event': 'disconnected'}가 전달된다.
+    """
+
+    def __init__(self, path=SOCKET_PATH):
+        self.path = path
+        self.subscribers = []
+        self.sock = None
+        self.thread = None
+
+    def open(self):
+        self.sock = connect(self.path)
+        self.sock.sendall(b'{"cmd": "subscribe", "ui": true}\n')
+        self.sock.settimeout(None)
+        self.thread = threading.Thread(target=self._read_events, name="control-events", daemon=True)
+        self.thread.start()
+
+    def close(self):
+        """연결만 끊음 (데몬과 진행 중인 세션은 그대로)"""
+        sock, self.sock = self.sock, None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+
+    def subscribe(self, callback):
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def _read_events(self):
+        sock = self.sock
+        try:
+            for message in _read_lines(sock):
+                if 'event' in message:
+                    self._emit(message)
+        except (OSError, ValueError):
+            pass
+        if self.sock is sock:  # close()로 끊은 게 아니면 알림
+            self._emit({'event': 'disconnected'})
+
+    def _emit(self, event):
+        for callback in list(self.subscribers):
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"이벤트 전달 실패: {e}")
+
+    def _call(self, cmd, **args):
+        try:
+            return request(cmd, self.path, **args)
+        except ControlError as e:
+            # 데몬 쪽 예외를 GUI가 처리하는 예외로 바꿈
+            if e.error_type == 'session':
+                from focus_daemon import SessionError
+                raise SessionError(str(e)) from None
+            if e.error_type == 'rule':
+                from app_rules import RuleError
+                raise RuleError(str(e)) from None
+            raise
+
+    def blocked_apps(self):
+        return self._call('status')['blocked_apps']
+
+    def set_blocked_apps(self, apps):
+        return self._call('set_apps', apps=list(apps))['changed']
+
+    def add_app(self, app_name):
+        return self._call('add_app', app=app_name)['added']
+
+    def remove_app(self, app_name):
+        return self._call('remove_app', app=app_name)['removed']
+
+    def app_actions(self):
+        return self._call('status')['app_actions']
+
+    def set_app_action(self, app_name, action):
+        return self._call('set_action', app=app_name, action=action)['changed']
+
+    def profiles(self):
+        return self._call('profile')
+
+    def switch_profile(self, name):
+        return self._call('profile', action='switch', name=name)['changed']
+
+    def delete_profile(self, name):
+        return self._call('profile', action='delete', name=name)['deleted']
+
+    def start_session(self, duration, super_mode=False):
+        self._call('start', seconds=duration, super_mode=super_mode)
+
+    def stop_session(self):
+        return self._call('stop')['stopped']
+
+    def status(self):
+        return self._call('status')
+
+    def stats(self):
+        return self._call('stats')
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("사용법: control_client.py status|stats|start 분 [super]|stop|"
+              "add 앱|remove 앱|action 앱 block|freeze|throttle|"
+              "profile [list|switch 이름|delete 이름]|subscribe")
+        return 2
+    command, rest = argv[0], argv[1:]
+    try:
+        if command == 'subscribe':
+            with connect() as sock:
+                sock.sendall(b'{"cmd": "subscribe"}\n')
+                sock.settimeout(None)
+                for message in _read_lines(sock):
+                    print(json.dumps(message, ensure_ascii=False), flush=True)
+            return 0
+        if command == 'start':
+            result = request('start', minutes=float(rest[0]), super_mode='super' in rest[1:])
+        elif command in ('add', 'remove'):
+            result = request(f'{command}_app', app=rest[0])
+        elif command == 'action':
+            result = request('set_action', app=rest[0], action=rest[1])
+        elif command == 'profile':
+            if rest and rest[0] != 'list':
+                result = request('profile', action=rest[0], name=rest[1])
+            else:
+                result = request('profile')
+        else:
+            result = request(command)
+    except OSError as e:
+        print(f"감시 데몬에 연결할 수 없습니다: {e}", file=sys.stderr)
+        return 1
+    except ControlError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+    except (IndexError, ValueError):
+        print("인자가 올바르지 않습니다.", file=sys.stderr)
+        return 2
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,297 @@
+"""감시 데몬 제어 서버 (asyncio, 줄 단위 JSON)
+
+전용 스레드의 이벤트 루프 하나에서 여러 클라이언트를 동시에 처리한다.
+Tk 메인 스레드나 감시 스레드는 기다리지 않는다.
+프로토콜은 control_client.py 참고.
+
+- 데몬 명령은 스레드 풀에서 실행해서 오래 걸리는 명령(중지 시 감시 스레드 대기 등)이
+  다른 클라이언트의 응답과 이벤트 전달을 막지 않는다
+- 연결마다 보낼 메시지 큐와 기록 작업 하나를 두어 응답과 이벤트가 섞여 깨지지 않는다
+- 구독자가 느려서 큐가 차면 그 구독자에게 가는 이벤트만 버린다
+- 소켓 파일은 소유자만 접근 가능 (0600)
+- 실행 중에는 옆의 잠금 파일(<소켓>.lock)에 배타 잠금을 잡아서, 동시에 실행한
+  두 번째 인스턴스가 소켓을 지우고 가로채지 못하게 한다
+"""
+import asyncio
+import json
+import math
+import os
+import socket
+import threading
+
+from app_rules import RuleError
+from control_client import FALLBACK_PORT, SOCKET_PATH, connect
+from focus_daemon import SessionError
+
+# 연결당 쌓아 둘 수 있는 보낼 메시지 수
+OUTBOX_SIZE = 256
+
+
+class NoWindowError(Exception):
+    """raise 요청을 받았지만 앞으로 가져올 창이 없음"""
+
+
+def acquire_instance_lock(path):
+    """단일 인스턴스 잠금 (잠금 파일 fd 반환, 다른 인스턴스가 잡고 있으면 OSError)
+
+    잠금은 fd를 닫거나 프로세스가 끝나면 풀리므로 비정상 종료해도 남지 않는다.
+    """
+    import fcntl
+
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        raise OSError(f"이미 실행 중인 인스턴스가 있습니다: {path}") from None
+    return fd
+
+
+def remove_stale_socket(path):
+    """응답하지 않는 소켓 파일 정리 (살아 있는 서버가 있으면 OSError)"""
+    if not os.path.exists(path):
+        return
+    try:
+        sock = connect(path, timeout=0.5)
+    except OSError:
+        os.unlink(path)  # 이전 실행이 비정상 종료하며 남긴 파일
+        return
+    sock.close()
+    raise OSError(f"이미 실행 중인 인스턴스가 있습니다: {path}")
+
+
+class ControlServer:
+    """daemon: FocusDaemon, on_raise: 창을 앞으로 가져오는 함수 (창이 없으면 None)"""
+
+    def __init__(self, daemon, path=SOCKET_PATH, on_raise=None):
+        self.daemon = daemon
+        self.path = path
+        self.on_raise = on_raise
+        self.loop = None
+        self.server = None
+        self.thread = None
+        self.error = None
+        self.lock_fd = None  # 단일 인스턴스 잠금 (서버가 살아 있는 동안 유지)
+        self.ui_outboxes = set()  # 창 역할로 구독한 연결
+
+        self.commands = {
+            'start': self._cmd_start,
+            'stop': self._cmd_stop,
+            'status': lambda request: self.daemon.status(),
+            'stats': lambda request: self.daemon.stats(),
+            'add_app': lambda request: {'added': self.daemon.add_app(self._app_arg(request))},
+            'remove_app': lambda request: {'removed': self.daemon.remove_app(self._app_arg(request))},
+            'set_apps': self._cmd_set_apps,
+            'set_action': lambda request: {'changed': self.daemon.set_app_action(
+                self._app_arg(request), request['action'])},
+            'profile': self._cmd_profile,
+            'raise': self._cmd_raise,
+        }
+        # 이벤트 루프의 상태(구독 연결)를 다루므로 루프 스레드에서 바로 실행하는 명령
+        self.loop_commands = {'raise'}
+
+    def start(self):
+        """서버 스레드 시작 (소켓을 열 수 없으면 OSError)"""
+        self.loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        self.thread = threading.Thread(target=self._run, args=(ready,), name="control", daemon=True)
+        self.thread.start()
+        ready.wait()
+        if self.error is not None:
+            raise self.error
+
+    def stop(self):
+        if self.loop is None or self.thread is None:
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(1.0)
+        self.thread = None
+
+    def _run(self, ready):
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.server = self.loop.run_until_complete(self._listen())
+        except OSError as e:
+            self.error = e
+            self._release_lock()
+            ready.set()
+            self.loop.close()
+            return
+        ready.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.server.close()
+            tasks = asyncio.all_tasks(self.loop)
+            for task in tasks:
+                task.cancel()
+            # 취소된 연결 작업의 정리(finally)가 끝날 때까지 돌림
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            self.loop.close()
+            if hasattr(socket, 'AF_UNIX'):
+                try:
+                    os.unlink(self.path)
+                except OSError:
+                    pass
+            self._release_lock()
+
+    def _release_lock(self):
+        if self.lock_fd is not None:
+            os.close(self.lock_fd)
+            self.lock_fd = None
+
+    async def _listen(self):
+        if hasattr(socket, 'AF_UNIX'):
+            # 잠금을 잡은 뒤에만 남은 소켓을 정리 (asyncio는 바인드 전에 기존 소켓 파일을 지움)
+            self.lock_fd = acquire_instance_lock(self.path + '.lock')
+            remove_stale_socket(self.path)
+            server = await asyncio.start_unix_server(self._handle, path=self.path)
+            os.chmod(self.path, 0o600)
+            return server
+        return await asyncio.start_server(self._handle, '127.0.0.1', FALLBACK_PORT)
+
+    # 연결 처리
+
+    async def _handle(self, reader, writer):
+        outbox = asyncio.Queue(OUTBOX_SIZE)
+        sender = asyncio.ensure_future(self._send_loop(outbox, writer))
+        callback = None
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError
+                except ValueError:
+                    await outbox.put({'ok': False, 'error': "잘못된 요청입니다.", 'error_type': 'invalid'})
+                    continue
+
+                if request.get('cmd') == 'subscribe':
+                    if callback is None:
+                        callback = self._subscribe(outbox, bool(request.get('ui')))
+                    response = {'ok': True, 'result': None}
+                else:
+                    response = await self._dispatch(request)
+                if 'id' in request:
+                    response['id'] = request['id']
+                await outbox.put(response)
+        except (ConnectionError, ValueError):
+            pass  # 연결 끊김, 너무 긴 줄
+        except asyncio.CancelledError:
+            pass  # 서버 종료 (취소된 채 끝나면 asyncio가 예외를 찍음)
+        finally:
+            if callback is not None:
+                self.daemon.unsubscribe(callback)
+                self.ui_outboxes.discard(outbox)
+            sender.cancel()
+            writer.close()
+
+    async def _send_loop(self, outbox, writer):
+        try:
+            while True:
+                message = await outbox.get()
+                writer.write(json.dumps(message, ensure_ascii=False).encode() + b'\n')
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+
+    def _subscribe(self, outbox, is_ui):
+        loop = self.loop
+
+        def push(event):
+            try:
+                outbox.put_nowait(event)
+            except asyncio.QueueFull:
+                pass  # 느린 구독자에게 가는 이벤트만 버림
+
+        def callback(event):
+            # 데몬 이벤트는 아무 스레드에서나 오므로 루프로 넘김
+            loop.call_soon_threadsafe(push, event)
+
+        self.daemon.subscribe(callback)
+        if is_ui:
+            self.ui_outboxes.add(outbox)
+        return callback
+
+    async def _dispatch(self, request):
+        cmd = request.get('cmd')
+        handler = self.commands.get(cmd)
+        if handler is None:
+            return {'ok': False, 'error': f"알 수 없는 명령입니다: {cmd}",
+                    'error_type': 'invalid'}
+        try:
+            if cmd in self.loop_commands:
+                result = handler(request)
+            else:
+                # 데몬 잠금/감시 스레드 대기로 막힐 수 있으므로 루프 밖에서 실행
+                result = await self.loop.run_in_executor(None, handler, request)
+            return {'ok': True, 'result': result}
+        except SessionError as e:
+            return {'ok': False, 'error': str(e), 'error_type': 'session'}
+        except RuleError as e:
+            return {'ok': False, 'error': str(e), 'error_type': 'rule'}
+        except NoWindowError as e:
+            return {'ok': False, 'error': str(e), 'error_type': 'no_ui'}
+        except (KeyError, TypeError, ValueError) as e:
+            return {'ok': False, 'error': f"인자가 올바르지 않습니다: {e}", 'error_type': 'invalid'}
+        except Exception as e:
+            print(f"명령 처리 실패: {e}")
+            return {'ok': False, 'error': str(e), 'error_type': 'internal'}
+
+    # 명령
+
+    @staticmethod
+    def _app_arg(request):
+        app = request['app']
+        if not isinstance(app, str) or not app:
+            raise ValueError("app은 앱 이름 문자열이어야 합니다")
+        return app
+
+    def _cmd_start(self, request):
+        if 'seconds' in request:
+            seconds = float(request['seconds'])
+        else:
+            seconds = float(request['minutes']) * 60
+        if not math.isfinite(seconds) or seconds <= 0:
+            raise ValueError("시간은 0보다 큰 유한한 값이어야 합니다")
+        self.daemon.start_session(seconds, bool(request.get('super_mode')))
+        return self.daemon.status()
+
+    def _cmd_stop(self, request):
+        return {'stopped': self.daemon.stop_session()}
+
+    def _cmd_set_apps(self, request):
+        apps = request['apps']
+        if not isinstance(apps, list) or not all(isinstance(app, str) for app in apps):
+            raise ValueError("apps는 앱 이름 목록이어야 합니다")
+        return {'changed': self.daemon.set_blocked_apps(apps)}
+
+    def _cmd_profile(self, request):
+        action = request.get('action', 'list')
+        if action == 'list':
+            return self.daemon.profiles()
+        name = request['name']
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError("name은 프로필 이름 문자열이어야 합니다")
+        if action == 'switch':
+            return {'changed': self.daemon.switch_profile(name.strip())}
+        if action == 'delete':
+            return {'deleted': self.daemon.delete_profile(name.strip())}
+        raise ValueError(f"알 수 없는 프로필 명령입니다: {action}")
+
+    def _cmd_raise(self, request):
+        """창을 앞으로 (이 프로세스에 창이 없으면 구독 중인 창에 전달)"""
+        if self.on_raise is not None:
+            self.on_raise()
+        elif self.ui_outboxes:
+            for outbox in self.ui_outboxes:
+                try:
+                    outbox.put_nowait({'event': 'raise'})
+                except asyncio.QueueFull:
+                    pass
+        else:
+            raise NoWindowError("열려 있는 창이 없습니다.")
+        return None
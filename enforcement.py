@@ -0,0 +1,154 @@
+"""차단 동작 (프로세스 트리 종료)
+
+Chrome/Electron 앱처럼 이름이 다른 헬퍼 프로세스를 거느린 앱도
+한 번에 정리하도록, 일치한 프로세스의 자손까지 모아서 종료한다.
+SIGTERM을 한꺼번에 보내고 psutil.wait_procs 한 번으로 회수한 뒤,
+남은 프로세스만 SIGKILL로 강제 종료한다.
+
+재실행 폭주 중인 앱은 종료 대신 일시 정지(SIGSTOP)하고,
+필요하면 부모 실행기까지 정지한 뒤 세션이 끝날 때 재개(SIGCONT)한다.
+"""
+from collections import namedtuple
+
+import psutil
+
+# SIGTERM 후 정상 종료를 기다리는 시간 (초)
+TERM_TIMEOUT = 0.5
+# SIGKILL 후 회수를 기다리는 시간 (초)
+KILL_TIMEOUT = 0.5
+
+# killed: 종료된 프로세스, denied: 권한 부족, survived: 끝까지 살아남은 프로세스
+# vanished: 신호를 보내기 전에 이미 사라진 프로세스
+KillResult = namedtuple('KillResult', ['killed', 'denied', 'survived', 'vanished'])
+# suspended: 일시 정지한 프로세스 (재개할 때 그대로 넘김)
+SuspendResult = namedtuple('SuspendResult', ['suspended', 'denied', 'vanished'])
+
+# 부모 실행기로 정지해도 되는 프로세스 (자식이 죽으면 다시 띄우는 감시/재시작 도구)
+# 그 밖의 부모(데스크톱 구성 요소, 터미널, 편집기, 셸 등)는 정지하지 않음
+KNOWN_SUPERVISORS = frozenset({
+    'supervisord', 'runsv', 'runsvdir', 's6-supervise', 'supervise', 'circusd',
+    'monit', 'immortal', 'pm2', 'PM2', 'forever', 'nodemon',
+})
+
+
+def is_known_supervisor(name):
+    """기본 부모 실행기 허용 조건 (알려진 감시/재시작 도구)"""
+    return name in KNOWN_SUPERVISORS
+
+
+def collect_trees(roots):
+    """루트 프로세스와 모든 자손 목록 (부모-자식 관계는 한 번만 조회)"""
+    children = {}
+    for proc in psutil.process_iter(['ppid']):
+        children.setdefault(proc.info['ppid'], []).append(proc)
+
+    found = {proc.pid: proc for proc in roots}
+    stack = list(roots)
+    while stack:
+        parent = stack.pop()
+        for child in children.get(parent.pid, ()):
+            if child.pid not in found:
+                found[child.pid] = child
+                stack.append(child)
+    return list(found.values())
+
+
+def _signal_all(procs, action):
+    """모든 프로세스에 신호 전송 (보낸 목록, 권한 부족, 이미 사라진 목록 반환)"""
+    sent = []
+    denied = []
+    vanished = []
+    for proc in procs:
+        try:
+            action(proc)
+            sent.append(proc)
+        except psutil.NoSuchProcess:
+            vanished.append(proc)
+        except psutil.AccessDenied:
+            denied.append(proc)
+    return sent, denied, vanished
+
+
+def kill_trees(roots, term_timeout=TERM_TIMEOUT, kill_timeout=KILL_TIMEOUT):
+    """루트 프로세스 트리들을 한 번에 종료 (SIGTERM -> SIGKILL)"""
+    if not roots:
+        return KillResult([], [], [], [])
+
+    procs = collect_trees(roots)
+
+    sent, denied, vanished = _signal_all(procs, psutil.Process.terminate)
+    killed, alive = psutil.wait_procs(sent, timeout=term_timeout)
+
+    survived = []
+    if alive:
+        # 정상 종료하지 않은 프로세스만 강제 종료
+        sent, more_denied, more_vanished = _signal_all(alive, psutil.Process.kill)
+        denied.extend(more_denied)
+        killed.extend(more_vanished)  # SIGTERM 이후 스스로 종료됨
+        more_killed, survived = psutil.wait_procs(sent, timeout=kill_timeout)
+        killed.extend(more_killed)
+
+    return KillResult(killed, denied, survived, vanished)
+
+
+def kill_pids(pids, term_timeout=TERM_TIMEOUT, kill_timeout=KILL_TIMEOUT):
+    """PID 목록의 프로세스 트리 종료 (이미 종료된 PID는 무시)"""
+    roots = []
+    vanished = []
+    for pid in pids:
+        try:
+            roots.append(psutil.Process(pid))
+        except psutil.NoSuchProcess:
+            vanished.append(pid)
+    result = kill_trees(roots, term_timeout, kill_timeout)
+    result.vanished.extend(vanished)
+    return result
+
+
+def launcher_parents(procs, allow=is_known_supervisor):
+    """일시 정지해도 되는 부모 실행기 목록
+
+    allow(이름)가 참인 부모만 고른다 (init, 감시 프로세스와 그 조상은 항상 제외).
+    """
+    me = psutil.Process()
+    protected = {me.pid} | {proc.pid for proc in me.parents()}
+    found = {}
+    for proc in procs:
+        try:
+            parent = proc.parent()
+            if parent is None or parent.pid <= 1 or parent.pid in protected:
+                continue
+            if not allow(parent.name()):
+                continue
+        except psutil.Error:
+            continue
+        found.setdefault(parent.pid, parent)
+    return list(found.values())
+
+
+def suspend_pids(pids, parents=False, before=None, allow_parent=is_known_supervisor):
+    """PID 목록의 프로세스 트리 일시 정지 (parents면 부모 실행기도)
+
+    before: 신호를 보내기 전에 정지할 프로세스 목록을 받는 함수 (재개 목록 기록용)
+    allow_parent: 정지해도 되는 부모 실행기인지 이름으로 판정하는 함수
+    """
+    roots = []
+    vanished = []
+    for pid in pids:
+        try:
+            roots.append(psutil.Process(pid))
+        except psutil.NoSuchProcess:
+            vanished.append(pid)
+    procs = collect_trees(roots) if roots else []
+    if parents:
+        procs.extend(launcher_parents(roots, allow_parent))
+    if before is not None and procs:
+        before(procs)
+    suspended, denied, more_vanished = _signal_all(procs, psutil.Process.suspend)
+    return SuspendResult(suspended, denied, vanished + more_vanished)
+
+
+def resume_procs(procs):
+    """일시 정지한 프로세스 재개 (정지한 역순, 이미 종료됐거나 PID가 재사용됐으면 무시)"""
+    resumed, denied, vanished = _signal_all(reversed(list(procs)), psutil.Process.resume)
+    return resumed, denied, vanished
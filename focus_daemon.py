@@ -0,0 +1,442 @@
+"""헤드리스 감시 데몬 (tkinter 없이 동작)
+
+차단 앱 목록(설정), 세션 시계, 감시 엔진, 알림, 계측을 한곳에서 관리한다.
+GUI는 이 데몬에 붙어서 명령을 보내고 이벤트를 받아 화면만 갱신한다.
+창 없이도 실행할 수 있어서 Linux 워크스테이션이나 systemd에서 돌릴 수 있다.
+
+이벤트 (subscribe로 등록한 콜백에 딕셔너리로 전달, 호출 스레드는 정해져 있지 않음):
+- {'event': 'started', 'remaining': 초, 'end_time': ISO 시각, 'super_mode': bool}
+- {'event': 'stopped', 'reason': 'stopped' | 'expired'}
+- {'event': 'blocked', 'app': 앱 이름, 'time': 유닉스 시각}
+- {'event': 'apps_changed', 'apps': [앱 이름, ...], 'actions': {앱 이름: 'freeze'}}
+  (프로필을 바꾸거나 지웠을 때는 'profile': 활성 프로필, 'profiles': [이름, ...]도 포함)
+- {'event': 'storm', 'app': 앱 이름, 'level': 'hold' | 'parent', 'count': 구간 내 차단 횟수, 'time': 유닉스 시각}
+
+사용법:
+    python focus_daemon.py [--minutes 분]
+    (실행 중에는 control_client.py나 GUI로 제어)
+"""
+import argparse
+import os
+import signal
+import sys
+import threading
+import time
+
+from app_rules import RuleError, compile_rules, normalize_name
+from config_store import (ACTION_BLOCK, ACTION_FREEZE, ACTION_THROTTLE, ACTIONS, THROTTLED_FILE,
+                          ConfigStore)
+from freeze_registry import FreezeRegistry
+from metrics import Metrics, MetricsFileExporter
+from notifier import NotificationDispatcher, create_default_sink
+from scheduler import load_scheduler_config
+from session_clock import SessionClock
+
+# 차단 방식의 강도 (슈퍼 감시 중에는 더 약한 방식으로 바꿀 수 없음)
+# 일시 정지한 프로세스는 다시 검사하지 않으므로 종료보다 약하게 본다
+ACTION_STRENGTH = {ACTION_THROTTLE: 0, ACTION_FREEZE: 1, ACTION_BLOCK: 2}
+
+
+class SessionError(RuntimeError):
+    """세션을 시작/중지할 수 없음 (메시지는 사용자에게 그대로 표시)"""
+
+
+class FocusDaemon:
+    """차단 세션 관리
+
+    config_store: 설정 저장소 (기본: ~/.focus_mode_config.json)
+    sink: 알림 표시 방식 (기본: 플랫폼 기본값)
+    registry: 일시 정지한 프로세스 목록 (기본: ~/.focus_mode_frozen.json)
+    throttled_file: CPU 제한 전 원래 값 기록 파일 (None이면 메모리에만 보관)
+    """
+
+    def __init__(self, config_store=None, sink=None, registry=None, throttled_file=THROTTLED_FILE):
+        self.config_store = config_store or ConfigStore()
+        self.sink = sink
+        self.registry = registry if registry is not None else FreezeRegistry()
+        self.throttled_file = throttled_file
+        self.lock = threading.RLock()
+        self.subscribers = []
+        self.scheduler_config = load_scheduler_config({})
+        self.process_table_kind = 'auto'
+        self.respawn_config = {}
+        self.throttle_config = {}
+
+        self.engine = None
+        self.previous = None  # 끝난 세션의 엔진 (감시 스레드가 아직 정리 중일 수 있음)
+        self.session = None  # 감시 중인 세션의 SessionClock
+        self.super_mode = False
+
+        # 계측값은 세션을 넘어 누적
+        self.metrics = Metrics()
+        self.metrics_exporter = None
+        self.notifier = None
+
+    def open(self):
+        """설정 불러오고 알림/계측 스레드 시작"""
+        self.config_store.load()
+        self.scheduler_config = load_scheduler_config(self.config_store.get('scheduler', {}))
+        self.process_table_kind = self.config_store.get('process_table', 'auto')
+        self.respawn_config = self.config_store.get('respawn', {})
+        self.throttle_config = self.config_store.get('throttle', {})
+
+        # 이전 실행이 비정상 종료하며 정지된 채 남긴 프로세스 재개
+        resumed = self.registry.recover()
+        if resumed:
+            print(f"일시 정지된 채 남아 있던 프로세스 {resumed}개를 재개했습니다.")
+        # CPU 제한도 되돌림 (기록이 남아 있을 때만 psutil을 불러옴)
+        if self.throttled_file and os.path.exists(self.throttled_file):
+            from throttle import Throttler
+            restored = Throttler(path=self.throttled_file).recover()
+            if restored:
+                print(f"CPU 제한이 걸린 채 남아 있던 프로세스 {restored}개를 복원했습니다.")
+
+        # 차단 알림은 전용 스레드에서 표시 (감시 스레드는 대기하지 않음)
+        self.notifier = NotificationDispatcher(self.sink or create_default_sink())
+        self.notifier.start()
+
+        metrics_file = self.config_store.get('metrics_file')
+        if metrics_file:
+            self.metrics_exporter = MetricsFileExporter(self.metrics, metrics_file)
+            self.metrics_exporter.start()
+
+    def close(self):
+        """세션을 끝내고 남은 설정/계측값 기록"""
+        self.stop_session(force=True)
+        self.config_store.flush()
+        if self.notifier:
+            self.notifier.stop()
+        if self.metrics_exporter:
+            self.metrics_exporter.stop()
+
+    # 이벤트
+
+    def subscribe(self, callback):
+        with self.lock:
+            self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        with self.lock:
+            if callback in self.subscribers:
+                self.subscribers.remove(callback)
+
+    def _emit(self, event):
+        for callback in list(self.subscribers):
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"이벤트 전달 실패: {e}")
+
+    # 차단 앱 목록
+
+    def blocked_apps(self):
+        return self.config_store.blocked_apps()
+
+    def app_actions(self):
+        return self.config_store.app_actions()
+
+    def set_blocked_apps(self, apps):
+        """차단 앱 목록 교체 (잘못된 규칙이면 저장하지 않고 RuleError)
+
+        감시 중이면 추가된 앱은 바로 적용하고, 뺀 앱은 세션이 끝날 때까지 계속 차단한다.
+        """
+        apps = list(dict.fromkeys(normalize_name(app) for app in apps))
+        with self.lock:
+            current = self.config_store.blocked_apps()
+            if apps == current:
+                return False
+            if not set(current) <= set(apps):
+                self._check_can_shrink()
+            rules = compile_rules(apps)  # 저장하기 전에 검증
+            added = []
+            if self.engine is not None:
+                # add_app과 같이 지금 감시 중인 규칙에 더함
+                live = list(self.engine.rules.rules)
+                added = [app for app in apps if app not in live]
+                if added:
+                    rules = compile_rules(live + added)
+            self.config_store.set_blocked_apps(apps)
+            if added:
+                self.engine.update_rules(rules=rules)
+            actions = self._prune_actions(apps)
+        self._emit({'event': 'apps_changed', 'apps': apps, 'actions': actions})
+        return True
+
+    def add_app(self, app_name):
+        """차단 앱 추가 (감시 중이면 이미 실행 중인 프로세스에도 바로 적용)"""
+        app_name = normalize_name(app_name)
+        with self.lock:
+            apps = self.config_store.blocked_apps()
+            if app_name in apps:
+                return False
+            # 진행 중인 세션은 지금 감시 중인 규칙에 더함
+            # (목록에서 먼저 뺀 앱도 세션이 끝날 때까지 계속 차단)
+            live = list(self.engine.rules.rules) if self.engine is not None else apps
+            rules = compile_rules(live + [app_name])  # 잘못된 규칙이면 RuleError
+            apps.append(app_name)
+            self.config_store.set_blocked_apps(apps)
+            if self.engine is not None and app_name not in live:
+                self.engine.update_rules(rules=rules)
+            actions = self.config_store.app_actions()
+        self._emit({'event': 'apps_changed', 'apps': apps, 'actions': actions})
+        return True
+
+    def remove_app(self, app_name):
+        """차단 앱 제거 (진행 중인 세션은 그대로 유지, 슈퍼 감시 중에는 SessionError)"""
+        app_name = normalize_name(app_name)
+        with self.lock:
+            apps = self.config_store.blocked_apps()
+            if app_name not in apps:
+                return False
+            self._check_can_shrink()
+            apps.remove(app_name)
+            self.config_store.set_blocked_apps(apps)
+            actions = self._prune_actions(apps)
+        self._emit({'event': 'apps_changed', 'apps': apps, 'actions': actions})
+        return True
+
+    def set_app_action(self, app_name, action):
+        """앱의 차단 방식 변경 (block: 종료, freeze: 일시 정지, throttle: CPU 제한)
+
+        감시 중이면 실행 중인 프로세스도 바로 다시 판정한다.
+        (이미 일시 정지한 프로세스는 세션이 끝날 때까지 그대로 둔다)
+        슈퍼 감시 중에는 더 약한 방식으로 바꿀 수 없다 (SessionError).
+        """
+        app_name = normalize_name(app_name)
+        if action not in ACTIONS:
+            raise ValueError(f"알 수 없는 차단 방식입니다: {action}")
+        with self.lock:
+            apps = self.config_store.blocked_apps()
+            if app_name not in apps:
+                raise ValueError(f"차단 목록에 없는 앱입니다: {app_name}")
+            actions = self.config_store.app_actions()
+            current = actions.get(app_name, ACTION_BLOCK)
+            if current == action:
+                return False
+            if self.super_mode and ACTION_STRENGTH[action] < ACTION_STRENGTH[current]:
+                raise SessionError("슈퍼 감시 중에는 차단 방식을 약하게 바꿀 수 없습니다.")
+            actions[app_name] = action
+            self.config_store.set_app_actions(actions)
+            actions = self.config_store.app_actions()
+            if self.engine is not None:
+                self.engine.update_rules(actions=actions)
+        self._emit({'event': 'apps_changed', 'apps': apps, 'actions': actions})
+        return True
+
+    def _check_can_shrink(self):
+        """슈퍼 감시 중이면 목록에서 앱을 뺄 수 없음 (잠금 안에서 호출)"""
+        if self.super_mode:
+            raise SessionError("슈퍼 감시 중에는 차단 앱을 뺄 수 없습니다.")
+
+    def _prune_actions(self, apps):
+        """목록에서 빠진 앱의 차단 방식 제거 (잠금 안에서 호출)"""
+        actions = self.config_store.app_actions()
+        kept = {app: action for app, action in actions.items() if app in apps}
+        if kept != actions:
+            self.config_store.set_app_actions(kept)
+        return kept
+
+    # 프로필
+
+    def profiles(self):
+        """{'active': 활성 프로필, 'profiles': [프로필 이름, ...]}"""
+        return {'active': self.config_store.active_profile, 'profiles': self.config_store.profiles()}
+
+    def switch_profile(self, name):
+        """활성 프로필 변경 (없으면 빈 프로필로 만듦, 진행 중인 세션에는 다음 세션부터 반영)
+
+        슈퍼 감시 중에는 차단 목록이 바뀌므로 SessionError.
+        """
+        with self.lock:
+            if name == self.config_store.active_profile:
+                return False
+            if self.super_mode:
+                raise SessionError("슈퍼 감시 중에는 프로필을 바꿀 수 없습니다.")
+            self.config_store.switch_profile(name)
+            event = self._profile_event()
+        self._emit(event)
+        return True
+
+    def delete_profile(self, name):
+        """프로필 삭제 (없거나 마지막 남은 프로필이면 False, 슈퍼 감시 중 활성 프로필이면 SessionError)"""
+        with self.lock:
+            if self.super_mode and name == self.config_store.active_profile:
+                raise SessionError("슈퍼 감시 중에는 사용 중인 프로필을 지울 수 없습니다.")
+            if not self.config_store.delete_profile(name):
+                return False
+            event = self._profile_event()
+        self._emit(event)
+        return True
+
+    def _profile_event(self):
+        """프로필이 바뀐 뒤 보낼 apps_changed 이벤트 (잠금 안에서 호출)"""
+        return {'event': 'apps_changed', 'apps': self.config_store.blocked_apps(),
+                'actions': self.config_store.app_actions(),
+                'profile': self.config_store.active_profile,
+                'profiles': self.config_store.profiles()}
+
+    # 세션
+
+    @property
+    def is_running(self):
+        return self.engine is not None
+
+    def start_session(self, duration, super_mode=False):
+        """duration초 동안 차단 시작"""
+        # 이전 세션의 감시 스레드가 끝난 뒤에 시작 (정리하면서 새 세션의 정지를 풀지 않도록)
+        previous = self.previous
+        if previous is not None and not previous.join():
+            raise SessionError("이전 감시를 정리하는 중입니다. 잠시 후 다시 시도해주세요.")
+        with self.lock:
+            if self.engine is not None:
+                raise SessionError("이미 감시 중입니다.")
+            apps = self.config_store.blocked_apps()
+            if not apps:
+                raise SessionError("차단할 앱을 추가해주세요.")
+            if duration <= 0:
+                raise SessionError("종료 시간을 설정해주세요.")
+
+            # 감시 엔진(psutil)은 첫 세션을 시작할 때 불러옴
+            from focus_engine import FocusEngine
+            from process_table import create_process_table
+            from throttle import Throttler
+
+            # 차단 규칙은 세션마다 한 번만 컴파일 (잘못된 규칙이면 RuleError)
+            rules = compile_rules(apps)
+            session = SessionClock(duration)
+            engine = FocusEngine(
+                rules, session,
+                on_block=self._on_block,
+                on_expire=lambda: self._finish(engine, 'expired'),
+                on_storm=self._on_storm,
+                scheduler_config=self.scheduler_config,
+                respawn_config=self.respawn_config,
+                actions=self.config_store.app_actions(),
+                registry=self.registry,
+                throttler=Throttler(self.throttle_config, path=self.throttled_file),
+                metrics=self.metrics,
+                process_table=create_process_table(self.process_table_kind),
+            )
+            self.engine = engine
+            self.previous = None
+            self.session = session
+            self.super_mode = bool(super_mode)
+            engine.start()
+            event = {
+                'event': 'started',
+                'remaining': session.remaining(),
+                'end_time': session.end_time.isoformat(timespec='seconds'),
+                'super_mode': self.super_mode,
+            }
+        self._emit(event)
+
+    def stop_session(self, force=False):
+        """감시 중지 (슈퍼 감시 중이면 force일 때만)"""
+        with self.lock:
+            engine = self.engine
+            if engine is None:
+                return False
+            if self.super_mode and not force:
+                raise SessionError("슈퍼 감시 중에는 중지할 수 없습니다.")
+        # 감시 스레드를 기다리는 동안 잠금을 잡고 있지 않도록 잠금 밖에서 정리
+        return self._finish(engine, 'stopped')
+
+    def _finish(self, engine, reason):
+        """세션 정리 (종료 시점 도달 시 감시 스레드에서도 호출됨)"""
+        with self.lock:
+            if self.engine is not engine:
+                return False  # 이미 끝난 세션
+            engine.stop()
+            # 감시 스레드를 기다리지 않고 일시 정지/CPU 제한을 바로 되돌림
+            # (스레드가 그 사이 정지/제한한 프로세스는 스레드가 끝나면서 되돌림)
+            engine.release()
+            self.engine = None
+            self.previous = engine
+            self.session = None
+            self.super_mode = False
+        self._emit({'event': 'stopped', 'reason': reason})
+        # 감시 스레드 안(종료 시점 도달)에서는 기다리지 않음
+        if threading.current_thread() is not engine.thread and not engine.join():
+            print("감시 스레드가 제때 끝나지 않았습니다. 다음 세션 시작 전에 다시 기다립니다.")
+        return True
+
+    def _on_block(self, app_name):
+        """앱 차단 시 호출 (감시 스레드)"""
+        print(f"차단됨: {app_name}")
+        self.notifier.notify(app_name)
+        self._emit({'event': 'blocked', 'app': app_name, 'time': time.time()})
+
+    def _on_storm(self, app_name, level, count):
+        """재실행 폭주로 대응 단계가 올라감 (감시 스레드)"""
+        if level == 'hold':
+            print(f"재실행 반복 감지: {app_name} ({count}회) - 종료 대신 일시 정지")
+        else:
+            print(f"재실행 반복 감지: {app_name} ({count}회) - 실행기까지 일시 정지")
+        self.notifier.notify(app_name)
+        self._emit({'event': 'storm', 'app': app_name, 'level': level, 'count': count,
+                    'time': time.time()})
+
+    def status(self):
+        with self.lock:
+            session = self.session
+            return {
+                'running': session is not None,
+                'remaining': session.remaining() if session else 0.0,
+                'end_time': session.end_time.isoformat(timespec='seconds') if session else None,
+                'super_mode': self.super_mode,
+                'profile': self.config_store.active_profile,
+                'blocked_apps': self.config_store.blocked_apps(),
+                'app_actions': self.config_store.app_actions(),
+                'frozen': len(self.registry),
+                'throttled': len(self.engine.throttler) if self.engine else 0,
+                'source': self.engine.source_name if self.engine else None,
+                'process_table': self.engine.scanner.process_table.name if self.engine else None,
+            }
+
+    def stats(self):
+        return self.metrics.snapshot()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="집중 모드 감시 데몬 (창 없이 실행)")
+    parser.add_argument('--minutes', type=float, help="바로 시작할 집중 시간 (분)")
+    args = parser.parse_args(argv)
+
+    # 제어 서버는 순환 import를 피하려고 여기서 불러옴
+    from control_server import ControlServer
+
+    daemon = FocusDaemon()
+    server = ControlServer(daemon)
+    try:
+        server.start()
+    except OSError as e:
+        print(f"감시 데몬을 시작할 수 없습니다: {e}")
+        return 1
+    daemon.open()
+
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda signum, frame: stop.set())
+
+    if args.minutes:
+        try:
+            daemon.start_session(args.minutes * 60)
+            print(f"감시 시작: {args.minutes:g}분")
+        except (SessionError, RuleError) as e:
+            print(f"감시를 시작할 수 없습니다: {e}")
+
+    print("감시 데몬 실행 중... (Ctrl+C로 종료)")
+    try:
+        while not stop.wait(1.0):
+            pass
+    finally:
+        daemon.close()
+        server.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    # __main__으로 실행하면 SessionError가 control_server가 불러온 것과 다른
+    # 클래스가 되므로 모듈 이름으로 다시 불러와서 실행
+    from focus_daemon import main as daemon_main
+    sys.exit(daemon_main())
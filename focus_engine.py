@@ -0,0 +1,329 @@
+"""감시 엔진 (tkinter 없이 동작)
+
+감시 루프, 차단 판정, 종료 처리를 GUI와 분리해서
+벤치마크나 다른 프론트엔드에서도 그대로 구동할 수 있게 한다.
+
+엔진 하나는 세션 하나에 해당하고 감시 스레드도 하나만 띄운다.
+중지와 규칙 변경은 이벤트 대기를 바로 깨워서 다음 검사를 기다리지 않고 반영된다.
+"""
+import threading
+import time
+from collections import namedtuple
+
+from config_store import ACTION_FREEZE, ACTION_THROTTLE
+from enforcement import is_known_supervisor, kill_pids, suspend_pids
+from freeze_registry import FreezeRegistry
+from metrics import Metrics
+from process_identity import IdentityResolver
+from process_table import ProcessScanner
+from process_watch import create_launch_source
+from respawn_guard import LEVEL_KILL, LEVEL_PARENT, RespawnTracker
+from scheduler import ScanScheduler
+from throttle import Throttler
+
+# 감시 스레드 종료를 기다리는 최대 시간 (초, 종료 처리 중인 프로세스 대기 포함)
+JOIN_TIMEOUT = 2.0
+
+# 한 번의 검사가 보는 규칙과 차단 방식 (통째로 바꿔 끼우고 고치지 않음)
+RuleSnapshot = namedtuple('RuleSnapshot', ['rules', 'actions'])
+
+
+class FocusEngine:
+    """차단 감시 루프
+
+    rules: 컴파일된 RuleSet
+    actions: 규칙별 차단 방식 {규칙: 'freeze' | 'throttle'} (없는 규칙은 종료)
+    clock: 남은 시간을 알려 주는 SessionClock
+    on_block: 앱 차단 시 호출 (앱 이름)
+    on_expire: 종료 시점 도달 시 호출 (감시 스레드에서 호출됨)
+    on_storm: 재실행 폭주로 대응 단계가 올라갈 때 호출 (앱 이름, 단계, 구간 내 차단 횟수)
+    metrics: 계측값 모음 (세션을 넘어 누적하려면 같은 객체를 넘김)
+    respawn_config: 재실행 폭주 감지 설정 (respawn_guard.DEFAULT_CONFIG)
+    registry: 일시 정지한 프로세스 목록 (기본: 메모리에만 보관)
+    throttler: throttle 앱의 CPU 제한/복원 (기본: throttle_config로 만든 Throttler)
+    process_table / source_factory / killer / suspender: 테스트·벤치마크용 교체 지점
+    """
+
+    def __init__(self, rules, clock, on_block=None, on_expire=None, on_storm=None,
+                 scheduler_config=None, metrics=None, process_table=None,
+                 source_factory=create_launch_source, killer=kill_pids,
+                 respawn_config=None, suspender=suspend_pids, actions=None, registry=None,
+                 throttle_config=None, throttler=None):
+        self.snapshot = RuleSnapshot(rules, dict(actions or {}))
+        self.clock = clock
+        self.on_block = on_block
+        self.on_expire = on_expire
+        self.on_storm = on_storm
+        self.scheduler_config = scheduler_config
+        self.process_table = process_table
+        self.source_factory = source_factory
+        self.killer = killer
+        self.suspender = suspender
+        self.respawns = RespawnTracker.from_config(respawn_config)
+        # 일시 정지한 프로세스 (freeze 앱, 재실행 폭주) - 세션 끝에 재개
+        self.registry = registry if registry is not None else FreezeRegistry(path=None)
+        # CPU를 제한한 프로세스 (throttle 앱) - 세션 끝에 복원
+        self.throttler = throttler if throttler is not None else Throttler(throttle_config)
+
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.rules_changed = threading.Event()
+        self.thread = None
+        self.source = None  # 감시 중인 이벤트 소스 (중지/규칙 변경 시 깨움)
+        self.scanner = ProcessScanner(process_table)
+        # 이름으로 일치하지 않은 새 프로세스만 실행 파일/명령줄 확인
+        self.identities = IdentityResolver(self.scanner.process_table)
+        self.source_name = None
+
+        # 감시 루프에서 쓸 계측 객체는 미리 받아 둠
+        self.metrics = metrics or Metrics()
+        m = self.metrics
+        self.sweeps = m.counter('focus_sweeps_total', '프로세스 검사 횟수')
+        self.inspected = m.counter('focus_processes_inspected_total', '이름을 확인한 프로세스 수')
+        self.matches = m.counter('focus_matches_total', '차단 규칙과 일치한 프로세스 수')
+        self.kills = m.counter('focus_kills_total', '종료된 프로세스 수 (자손 포함)')
+        self.kill_denied = m.counter('focus_kill_failures_total', '종료 실패 수',
+                                     {'reason': 'access_denied'})
+        self.kill_vanished = m.counter('focus_kill_failures_total', '종료 실패 수',
+                                       {'reason': 'no_such_process'})
+        self.kill_survived = m.counter('focus_kill_failures_total', '종료 실패 수',
+                                       {'reason': 'survived'})
+        self.sweep_seconds = m.histogram('focus_sweep_duration_seconds', '검사 1회 소요 시간')
+        self.kill_latency = m.histogram('focus_launch_to_kill_seconds', '실행부터 종료까지 걸린 시간')
+        self.hold_latency = m.histogram('focus_launch_to_hold_seconds', '실행부터 일시 정지까지 걸린 시간')
+        self.storms = {level: m.counter('focus_respawn_storms_total', '재실행 폭주로 단계를 올린 횟수',
+                                        {'level': level})
+                       for level in ('hold', 'parent')}
+        self.held_count = m.counter('focus_held_processes_total', '종료 대신 일시 정지한 프로세스 수')
+        self.throttled_count = m.counter('focus_throttled_processes_total', 'CPU 사용을 제한한 프로세스 수')
+        m.gauge('focus_tracked_pids', lambda: len(self.scanner), '스캐너가 추적 중인 PID 수')
+        m.gauge('focus_rules', lambda: len(self.rules), '차단 규칙 수')
+        m.gauge('focus_identity_cache', lambda: len(self.identities), '신원 캐시 크기')
+        m.gauge('focus_identity_lookups', lambda: self.identities.lookups,
+                '실행 파일/명령줄 조회 횟수')
+        m.gauge('focus_held_processes', lambda: len(self.registry), '일시 정지해 둔 프로세스 수')
+        m.gauge('focus_throttled_processes', lambda: len(self.throttler), 'CPU 사용을 제한 중인 프로세스 수')
+
+    @property
+    def rules(self):
+        return self.snapshot.rules
+
+    @property
+    def actions(self):
+        return self.snapshot.actions
+
+    def update_rules(self, rules=None, actions=None):
+        """규칙/차단 방식을 새 스냅샷으로 교체 (None이면 기존 값 유지)
+
+        감시 중이면 바로 깨어나서 이미 실행 중인 프로세스도 새 규칙으로 다시 판정한다.
+        """
+        with self.lock:
+            current = self.snapshot
+            self.snapshot = RuleSnapshot(current.rules if rules is None else rules,
+                                         current.actions if actions is None else dict(actions))
+            self.rules_changed.set()
+            if self.source is not None:
+                self.source.wake()
+
+    def start(self):
+        """감시 스레드 시작 (엔진마다 한 번만)"""
+        with self.lock:
+            if self.thread is not None:
+                raise RuntimeError("감시 스레드가 이미 시작되었습니다.")
+            self.thread = threading.Thread(target=self.run, name="focus-engine", daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        """감시 중지 요청 (대기 중인 감시 스레드를 바로 깨움)"""
+        with self.lock:
+            self.stop_event.set()
+            if self.source is not None:
+                self.source.wake()
+
+    def join(self, timeout=JOIN_TIMEOUT):
+        """감시 스레드 종료 대기 (끝났으면 True)
+
+        감시 스레드 안(on_expire 등)에서 부르면 기다리지 않고 False를 반환한다.
+        """
+        thread = self.thread
+        if thread is None:
+            return True
+        if thread is not threading.current_thread():
+            thread.join(timeout)
+        return not thread.is_alive()
+
+    def run(self):
+        """감시 스레드 본체"""
+        # 실행 이벤트 소스 (지원하지 않는 환경이면 폴링)
+        source = self.source_factory()
+        with self.lock:
+            self.source = source
+            self.source_name = source.name
+        # 차단 직후에는 촘촘히, 한가할 때는 느슨하게 검사
+        scheduler = ScanScheduler.from_config(self.scheduler_config)
+
+        pids = None  # 처음에는 전체 프로세스 검사
+        try:
+            while not self.stop_event.is_set():
+                # 종료 시간 체크 (대기 시간이 남은 시간으로 잘리므로 종료 시점에 정확히 깨어남)
+                remaining = self.clock.remaining()
+                if remaining <= 0:
+                    self.stop_event.set()
+                    if self.on_expire:
+                        self.on_expire()
+                    break
+
+                # 앱 차단 (새로 나타난 프로세스만, 규칙이 바뀌었으면 실행 중인 프로세스 전부)
+                recheck = self.rules_changed.is_set()
+                self.rules_changed.clear()
+                scheduler.record(self.sweep(pids, recheck=recheck))
+
+                # 새 프로세스 실행 대기 (폴링 백엔드는 대기 후 전체 검사)
+                pids = source.wait(scheduler.next_timeout(remaining))
+        finally:
+            with self.lock:
+                self.source = None
+            source.close()
+            self.release()
+
+    def release(self):
+        """일시 정지한 프로세스 재개, CPU 제한 복원 (세션 종료 시)"""
+        self.registry.resume_all()
+        self.throttler.restore_all()
+
+    def sweep(self, pids=None, recheck=False):
+        """한 번 검사해서 차단 대상 종료 (차단한 앱 수 반환)
+
+        recheck: 이미 확인한 프로세스도 다시 판정 (규칙이 바뀌었을 때)
+        """
+        started = time.perf_counter()
+        # 검사 도중 규칙이 바뀌어도 이번 검사는 같은 스냅샷으로 판정
+        rules, actions = self.snapshot
+        if recheck:
+            self.scanner.scan()  # 종료된 PID 정리, 새 프로세스 확인
+            found = self.scanner.known()
+        else:
+            found = self.scanner.scan(pids)
+        self.sweeps.inc()
+        self.inspected.inc(len(found))
+
+        matched = {}  # 앱 이름 -> 일치한 PID 목록
+        frozen = set()  # freeze 방식 앱 이름
+        throttled = []  # throttle 방식 앱의 PID (차단하지 않고 CPU만 제한)
+        registry = self.registry
+        for pid, name in found:
+            if pid in registry:
+                continue  # 이미 일시 정지해 둔 프로세스
+            rule = rules.match(name)
+            if rule is None:
+                name, rule = self.match_identity(pid, name, rules)
+                if rule is None:
+                    continue
+            action = actions.get(rule)
+            if action == ACTION_THROTTLE:
+                throttled.append(pid)
+                continue
+            matched.setdefault(name, []).append(pid)
+            if action == ACTION_FREEZE:
+                frozen.add(name)
+
+        if throttled:
+            self.throttled_count.inc(self.throttler.apply_pids(throttled))
+
+        if not matched:
+            self.sweep_seconds.observe(time.perf_counter() - started)
+            return 0
+
+        # freeze 앱과 재실행 폭주 중인 앱은 종료 대신 일시 정지
+        targets = []
+        holds = {}  # 부모 실행기까지 정지할지 -> PID 목록
+        for app_name, app_pids in matched.items():
+            if app_name in frozen:
+                holds.setdefault(False, []).extend(app_pids)
+                continue
+            level = self.respawns.level(app_name)
+            if level == LEVEL_KILL:
+                targets.extend(app_pids)
+            else:
+                holds.setdefault(level == LEVEL_PARENT, []).extend(app_pids)
+        self.matches.inc(sum(len(app_pids) for app_pids in matched.values()))
+
+        # 헬퍼 프로세스까지 한 번에 종료
+        if targets:
+            result = self.killer(targets)
+            self.record_kill(targets, result)
+        for parents, held_pids in holds.items():
+            self.hold(held_pids, parents=parents, rules=rules)
+        self.sweep_seconds.observe(time.perf_counter() - started)
+
+        for app_name in matched:
+            if app_name in frozen:
+                if self.on_block:
+                    self.on_block(app_name)
+                continue
+            escalated = self.respawns.record(app_name)
+            if escalated is not None:
+                level, count = escalated
+                self.storms[level].inc()
+                if self.on_storm:
+                    self.on_storm(app_name, level, count)
+            elif self.on_block and self.respawns.level(app_name) == LEVEL_KILL:
+                # 프로세스마다가 아니라 앱마다 한 번씩 알림 (붙잡아 둔 앱은 폭주 알림으로 대신)
+                self.on_block(app_name)
+        return len(matched)
+
+    def hold(self, pids, parents=False, rules=None):
+        """프로세스 트리 일시 정지 (parents면 부모 실행기도)
+
+        부모 실행기는 알려진 감시/재시작 도구이거나 그 자체가 규칙에 일치할 때만 정지한다.
+        """
+        added = []
+        rules = rules if rules is not None else self.rules
+
+        def record(procs):
+            # 정지하기 전에 기록 (그 사이 비정상 종료해도 다음 시작 때 재개됨)
+            added.extend(self.registry.add(procs))
+
+        def allow_parent(name):
+            return is_known_supervisor(name) or rules.match(name) is not None
+
+        result = self.suspender(pids, parents=parents, before=record, allow_parent=allow_parent)
+        self.observe_latency(self.hold_latency, pids)
+        if result is not None:
+            suspended = {proc.pid for proc in result.suspended}
+            self.registry.discard([proc for proc in added if proc.pid not in suspended])
+            self.held_count.inc(len(result.suspended))
+
+    def match_identity(self, pid, name, rules):
+        """실행 파일/번들/복원한 이름으로 다시 판정 ((표시할 앱 이름, 규칙), 없으면 규칙이 None)"""
+        create_time = self.scanner.cache.get(pid, (None,))[0]
+        identity = self.identities.resolve(pid, create_time, name, rules)
+        if identity is None:
+            return name, None  # 더 확인할 것이 없음 / 이미 종료됨
+        rule = rules.match(None, identity.exe, identity.bundle_id)
+        if rule is not None:
+            return identity.bundle_name or name, rule
+        for candidate in identity.names():
+            rule = rules.match(candidate)
+            if rule is not None:
+                return candidate, rule
+        return name, None
+
+    def record_kill(self, pids, result):
+        """종료 결과와 실행부터 종료까지의 지연 시간 기록"""
+        if result is not None:
+            self.kills.inc(len(result.killed))
+            self.kill_denied.inc(len(result.denied))
+            self.kill_vanished.inc(len(result.vanished))
+            self.kill_survived.inc(len(result.survived))
+
+        self.observe_latency(self.kill_latency, pids)
+
+    def observe_latency(self, histogram, pids):
+        """실행부터 지금까지 걸린 시간 기록 (프로세스 생성 시각은 스캐너 캐시에 이미 있음)"""
+        now = time.time()
+        cache = self.scanner.cache
+        for pid in pids:
+            create_time = cache.get(pid, (None,))[0]
+            if create_time:
+                histogram.observe(max(now - create_time, 0.0))
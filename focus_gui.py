@@ -0,0 +1,895 @@
+"""집중 모드 창 (tkinter)
+
+app_blocker_gui.py가 이미 실행 중인 인스턴스가 없을 때만 불러온다.
+"""
+import tkinter as tk  # messagebox는 대화상자를 처음 띄울 때 각 메서드에서 불러옴
+import subprocess
+import threading
+import queue
+import os
+import sys
+from datetime import datetime, timedelta
+
+from app_catalog import AppCatalog
+from app_rules import RuleError, normalize_name
+from app_search import SearchIndex
+from config_store import ACTION_BLOCK, ACTION_FREEZE, ACTION_THROTTLE, CONFIG_FILE, ConfigStore
+from control_client import ControlError, DaemonClient
+from control_server import ControlServer
+from focus_daemon import FocusDaemon, SessionError
+from notifier import create_default_sink
+from session_clock import SessionClock, seconds_to_next_tick
+from ui_queue import UiQueue
+from widgets import TagFlow, VirtualCheckList
+
+# macOS tkinter 경고 메시지 숨기기
+os.environ['TK_SILENCE_DEPRECATION'] = '1'
+
+# TSM/IMK 에러 메시지 숨기기
+if sys.platform == 'darwin':
+    os.environ['TK_LIBRARY'] = '/System/Library/Frameworks/Tk.framework/Versions/Current/Resources'
+
+# 정각 초보다 살짝 늦게 깨워서 이전 초를 다시 그리지 않도록 하는 여유 (ms)
+TICK_SLACK_MS = 5
+
+# 검색어 입력 후 목록을 갱신하기까지 기다리는 시간 (ms)
+SEARCH_DEBOUNCE_MS = 120
+
+# 데몬 이벤트 -> 화면 갱신 큐에서 합칠 키 (같은 키는 한 프레임에 마지막 것만 반영)
+# 화면에 표시하지 않는 이벤트(blocked, storm)는 큐에 넣지 않음
+# 프로필을 바꾼 apps_changed는 PROFILE_EVENT_KEY로 따로 합침 (목록만 바뀐 이벤트에 덮이지 않도록)
+EVENT_KEYS = {
+    'started': 'session',
+    'stopped': 'session',
+    'apps_changed': 'apps',
+    'raise': 'raise',
+    'disconnected': 'disconnected',
+}
+PROFILE_EVENT_KEY = 'profiles'
+
+# 앱 선택 목록에서 제외할 시스템 앱 및 자기 자신
+EXCLUDED_APPS = {'Automator', 'Boot Camp Assistant', 'Bluetooth File Exchange',
+                 'ColorSync Utility', 'Console', 'Digital Color Meter', 'Disk Utility',
+                 'DVD Player', 'Font Book', 'Grapher', 'Keychain Access',
+                 'Migration Assistant', 'Screenshot', 'Stickies', 'System Preferences',
+                 'System Information', 'Terminal', 'VoiceOver Utility', 'AirPort Utility',
+                 'Audio MIDI Setup', 'Directory Utility', 'Wireless Diagnostics',
+                 'loginwindow', 'WindowServer', 'Dock', 'SystemUIServer', 'Finder',
+                 'ControlCenter', 'NotificationCenter', 'Siri',
+                 '집중모드', 'Python', 'python3'}
+
+
+# 앱별 차단 방식 (태그 오른쪽 클릭 메뉴)
+ACTION_LABELS = {
+    ACTION_BLOCK: "종료",
+    ACTION_FREEZE: "일시 정지 (세션 끝나면 재개)",
+    ACTION_THROTTLE: "CPU 제한 (종료하지 않음)",
+}
+# 태그 이름 앞 표시
+ACTION_BADGES = {
+    ACTION_FREEZE: "❄",
+    ACTION_THROTTLE: "🐢",
+}
+
+
+class AppBlockerGUI:
+    # 설정 파일 경로
+    CONFIG_FILE = CONFIG_FILE
+
+    def __init__(self, root, daemon=None, ui=None):
+        self.root = root
+        self.root.title("맥북 집중 모드")
+
+        # 다른 스레드에서 오는 화면 갱신은 이 큐를 거쳐 메인 스레드에서 프레임마다 한 번에 반영
+        self.ui = ui or UiQueue(root)
+
+        # 창 크기는 내용에 맞게 자동, 사용자 조절 불가
+        self.root.resizable(False, False)
+
+        # 감시 상태 플래그
+        self.is_running = False
+        self.focus_duration = 0  # 총 집중 시간 (초)
+        self.session_clock = None  # 감시 중인 세션의 종료 시점
+        self.label_state = {}  # 레이블 -> 마지막으로 표시한 (내용, 색)
+        self.blocked_apps = []  # 차단할 앱 목록 (데몬 목록의 사본)
+        self.app_actions = {}  # 앱 -> 차단 방식 (block이 아닌 앱만)
+        self.profile = None  # 활성 프로필 이름
+        self.profile_names = []  # 프로필 이름 목록
+        self.super_mode = False  # 슈퍼 감시 모드
+
+        # 감시 데몬 (설정, 감시 엔진, 알림, 계측 담당) - 창은 명령과 표시만 맡음
+        # 다른 프로세스의 데몬에 붙을 때는 DaemonClient를 넘겨받음
+        if daemon is None:
+            daemon = FocusDaemon(ConfigStore(self.CONFIG_FILE), create_default_sink(self.ui))
+            daemon.open()
+        self.daemon = daemon
+        self.daemon.subscribe(self.on_daemon_event)
+
+        # 저장된 설정 불러오기
+        self.load_config()
+
+        # 설치된 앱 목록 캐시 (백그라운드에서 바뀐 폴더만 다시 읽음)
+        self.app_catalog = AppCatalog()
+        self.app_catalog.load()
+        self.app_catalog.start_refresh()
+
+        # UI 구성
+        self.create_widgets()
+
+        # 블록 표시 업데이트 (저장된 앱 표시)
+        self.update_blocks_display()
+
+        # 이미 진행 중인 세션이 있으면 (데몬에 붙은 경우) 감시 중 화면으로
+        status = self.daemon.status()
+        if status['running']:
+            self.show_session_started(status['remaining'], status['super_mode'])
+
+        # 화면 중앙 배치
+        self.center_window()
+
+        # 현재 시간 업데이트 시작
+        self.update_current_time()
+
+        # 창 닫을 때 설정 저장
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+
+    def center_window(self):
+        """창을 화면 중앙에 배치"""
+        self.root.update_idletasks()
+        width = self.root.winfo_width()
+        height = self.root.winfo_height()
+        screen_width = self.root.winfo_screenwidth()
+        screen_height = self.root.winfo_screenheight()
+        x = (screen_width - width) // 2
+        y = (screen_height - height) // 2
+        self.root.geometry(f"+{x}+{y}")
+
+    def load_config(self):
+        """저장된 차단 앱 목록 불러오기"""
+        self.blocked_apps = self.daemon.blocked_apps()
+        self.app_actions = self.daemon.app_actions()
+        profiles = self.daemon.profiles()
+        self.profile = profiles['active']
+        self.profile_names = profiles['profiles']
+
+    def save_config(self):
+        """차단 앱 목록을 데몬에 반영 (데몬이 모아서 저장)"""
+        from tkinter import messagebox
+        try:
+            self.daemon.set_blocked_apps(self.blocked_apps)
+        except (SessionError, RuleError, ControlError, OSError) as e:
+            messagebox.showwarning("경고", f"차단 앱 목록을 바꿀 수 없습니다: {e}")
+            # 데몬의 목록으로 되돌림
+            self.load_config()
+            self.update_blocks_display()
+
+    def on_closing(self):
+        """창 닫을 때 호출"""
+        self.daemon.unsubscribe(self.on_daemon_event)
+        self.daemon.close()
+        self.root.destroy()
+
+    def on_daemon_event(self, event):
+        """데몬 이벤트 수신 (임의의 스레드) - 화면 갱신 큐로 넘김"""
+        key = EVENT_KEYS.get(event.get('event'))
+        if key == 'apps' and 'profiles' in event:
+            key = PROFILE_EVENT_KEY
+        if key is not None:
+            self.ui.post(key, self.handle_daemon_event, event)
+
+    def handle_daemon_event(self, event):
+        """데몬 이벤트에 맞춰 화면 갱신 (메인 스레드)"""
+        from tkinter import messagebox
+        kind = event.get('event')
+        if kind == 'started':
+            self.show_session_started(event['remaining'], event['super_mode'])
+        elif kind == 'stopped':
+            self.show_session_stopped()
+        elif kind == 'apps_changed':
+            self.blocked_apps = list(event['apps'])
+            self.app_actions = dict(event.get('actions', {}))
+            self.update_blocks_display()
+            if 'profiles' in event:
+                self.profile = event['profile']
+                self.profile_names = list(event['profiles'])
+                self.update_profile_menu()
+        elif kind == 'raise':
+            bring_to_front(self.root)
+        elif kind == 'disconnected':
+            messagebox.showerror("오류", "감시 데몬과 연결이 끊어졌습니다.")
+            self.root.destroy()
+
+    def create_widgets(self):
+        # 1. 차단할 앱 선택
+        header_frame = tk.Frame(self.root)
+        header_frame.pack(pady=5)
+        tk.Label(header_frame, text="차단할 앱", font=("", 11)).pack(side=tk.LEFT)
+        self.select_btn = tk.Button(header_frame, text="+ 추가", command=self.open_app_selector)
+        self.select_btn.pack(side=tk.LEFT, padx=5)
+        self.clear_apps_btn = tk.Button(header_frame, text="초기화", command=self.clear_all_apps, fg="red")
+        self.clear_apps_btn.pack(side=tk.LEFT, padx=5)
+
+        # 프로필 선택 (프로필마다 차단 앱 목록이 따로 저장됨)
+        profile_frame = tk.Frame(self.root)
+        profile_frame.pack()
+        tk.Label(profile_frame, text="프로필", font=("", 10)).pack(side=tk.LEFT)
+        self.profile_var = tk.StringVar()
+        self.profile_menu = tk.OptionMenu(profile_frame, self.profile_var, '')
+        self.profile_menu.config(width=10)
+        self.profile_menu.pack(side=tk.LEFT, padx=5)
+        tk.Button(profile_frame, text="삭제", command=self.delete_profile).pack(side=tk.LEFT)
+        self.update_profile_menu()
+
+        # 블록 표시 영역
+        self.block_container = tk.Frame(self.root, relief=tk.SUNKEN, bd=1)
+        self.block_container.pack(pady=5, padx=20, fill=tk.X)
+
+        # 태그는 줄넘김 배치, 앱이 없을 때는 안내 문구 표시
+        # 오른쪽 클릭으로 앱별 차단 방식(종료/일시 정지/CPU 제한) 선택
+        self.tag_flow = TagFlow(self.block_container, on_remove=self.remove_blocked_app,
+                                on_menu=self.show_action_menu,
+                                empty_text="차단할 앱을 추가하세요")
+        self.tag_flow.pack(fill=tk.X, padx=5, pady=5)
+
+        # 2. 현재 시간 표시
+        time_frame = tk.Frame(self.root)
+        time_frame.pack(pady=10)
+
+        tk.Label(time_frame, text="현재 시간:", font=("", 14)).pack(side=tk.LEFT)
+        self.current_time_label = tk.Label(time_frame, text="--:--:--", font=("", 24, "bold"), fg="#00FF00", bg="black", padx=10, pady=5)
+        self.current_time_label.pack(side=tk.LEFT, padx=5)
+
+        # 3. 빠른 시간 설정 버튼
+        tk.Label(self.root, text="집중 시간 설정", font=("", 10)).pack(pady=(10, 5))
+
+        # 플러스 버튼
+        plus_btn_frame = tk.Frame(self.root)
+        plus_btn_frame.pack(pady=3)
+
+        tk.Button(plus_btn_frame, text="+5분", width=6,
+                  command=lambda: self.set_duration(5)).pack(side=tk.LEFT, padx=3)
+        tk.Button(plus_btn_frame, text="+10분", width=6,
+                  command=lambda: self.set_duration(10)).pack(side=tk.LEFT, padx=3)
+        tk.Button(plus_btn_frame, text="+30분", width=6,
+                  command=lambda: self.set_duration(30)).pack(side=tk.LEFT, padx=3)
+        tk.Button(plus_btn_frame, text="+1시간", width=6,
+                  command=lambda: self.set_duration(60)).pack(side=tk.LEFT, padx=3)
+
+        # 마이너스 버튼
+        minus_btn_frame = tk.Frame(self.root)
+        minus_btn_frame.pack(pady=3)
+
+        tk.Button(minus_btn_frame, text="-5분", width=6,
+                  command=lambda: self.set_duration(-5)).pack(side=tk.LEFT, padx=3)
+        tk.Button(minus_btn_frame, text="-10분", width=6,
+                  command=lambda: self.set_duration(-10)).pack(side=tk.LEFT, padx=3)
+        tk.Button(minus_btn_frame, text="-30분", width=6,
+                  command=lambda: self.set_duration(-30)).pack(side=tk.LEFT, padx=3)
+        tk.Button(minus_btn_frame, text="초기화", width=6, fg="red",
+                  command=self.reset_duration).pack(side=tk.LEFT, padx=3)
+
+        # 직접 입력 (시, 분)
+        direct_frame = tk.Frame(self.root)
+        direct_frame.pack(pady=5)
+
+        tk.Label(direct_frame, text="직접 입력:").pack(side=tk.LEFT)
+        self.hour_entry = tk.Entry(direct_frame, width=4)
+        self.hour_entry.insert(0, "0")
+        self.hour_entry.pack(side=tk.LEFT, padx=2)
+        tk.Label(direct_frame, text="시간").pack(side=tk.LEFT)
+        self.min_entry = tk.Entry(direct_frame, width=4)
+        self.min_entry.insert(0, "0")
+        self.min_entry.pack(side=tk.LEFT, padx=2)
+        tk.Label(direct_frame, text="분").pack(side=tk.LEFT)
+        tk.Button(direct_frame, text="설정", command=self.set_manual_duration).pack(side=tk.LEFT, padx=5)
+
+        # 4. 총 집중시간 표시
+        duration_frame = tk.Frame(self.root)
+        duration_frame.pack(pady=5)
+
+        tk.Label(duration_frame, text="총 집중시간:", font=("", 11)).pack(side=tk.LEFT)
+        self.duration_label = tk.Label(duration_frame, text="0분", font=("", 14, "bold"), fg="gray")
+        self.duration_label.pack(side=tk.LEFT, padx=5)
+
+        # 5. 종료 시간 표시
+        end_frame = tk.Frame(self.root)
+        end_frame.pack(pady=5)
+
+        tk.Label(end_frame, text="종료 시간:", font=("", 11)).pack(side=tk.LEFT)
+        self.end_time_label = tk.Label(end_frame, text="--:--:--", font=("", 14, "bold"), fg="gray")
+        self.end_time_label.pack(side=tk.LEFT, padx=5)
+
+        # 6. 상태 메시지
+        self.status_label = tk.Label(self.root, text="대기 중...", fg="gray")
+        self.status_label.pack(pady=20)
+
+        # 7. 슈퍼 감시 모드 체크박스
+        self.super_mode_var = tk.BooleanVar(value=False)
+        super_frame = tk.Frame(self.root)
+        super_frame.pack(pady=5)
+        self.super_checkbox = tk.Checkbutton(
+            super_frame,
+            text="슈퍼 감시 (중지 불가)",
+            variable=self.super_mode_var,
+            command=self.toggle_super_mode,
+            fg="#FF5555",
+            font=("", 11, "bold")
+        )
+        self.super_checkbox.pack()
+
+        # 8. 버튼 (시작/중지)
+        self.btn_frame = tk.Frame(self.root)
+        self.btn_frame.pack(pady=(10, 25))  # 하단 마진 추가
+
+        # 시작 버튼 (초록 배경)
+        self.start_frame = tk.Frame(self.btn_frame, bg="#4CAF50", padx=2, pady=2)
+        self.start_frame.pack(side=tk.LEFT, padx=10)
+        self.start_btn = tk.Label(self.start_frame, text="  감시 시작  ", bg="#4CAF50", fg="white",
+                                   font=("", 12, "bold"), cursor="hand2")
+        self.start_btn.pack()
+        self.start_btn.bind("<Button-1>", lambda e: self.start_blocking())
+
+        # 중지 버튼 (빨간 배경)
+        stop_frame = tk.Frame(self.btn_frame, bg="#FF5555", padx=2, pady=2)
+        stop_frame.pack(side=tk.LEFT, padx=10)
+        self.stop_btn = tk.Label(stop_frame, text="  감시 중지  ", bg="#CCCCCC", fg="gray",
+                                  font=("", 12, "bold"), cursor="hand2")
+        self.stop_btn.pack()
+        self.stop_frame = stop_frame
+
+    def set_label(self, label, text, fg=None):
+        """표시 내용이 바뀐 경우에만 레이블 갱신"""
+        state = (text, fg)
+        if self.label_state.get(label) == state:
+            return
+        self.label_state[label] = state
+        if fg is None:
+            label.config(text=text)
+        else:
+            label.config(text=text, fg=fg)
+
+    def update_current_time(self):
+        """현재 시간 업데이트 (매 정각 초마다)"""
+        now = datetime.now()
+        self.set_label(self.current_time_label, now.strftime("%H:%M:%S"))
+
+        # 감시 중이 아닐 때 종료 시간 실시간 업데이트
+        if not self.is_running and self.focus_duration > 0:
+            end_time = now + timedelta(seconds=self.focus_duration)
+            self.set_label(self.end_time_label, end_time.strftime("%H:%M:%S"), "green")
+
+        # 남은 시간 업데이트 (감시 중일 때, 종료는 감시 엔진이 종료 시점에 알려 줌)
+        if self.is_running and self.session_clock:
+            remaining = self.session_clock.remaining()
+            if remaining > 0:
+                mins, secs = divmod(int(remaining), 60)
+                hours, mins = divmod(mins, 60)
+                if self.super_mode:
+                    self.set_label(self.status_label,
+                                   f"슈퍼 감시 중! 남은 시간: {hours:02d}:{mins:02d}:{secs:02d}",
+                                   "#FF5555")
+                else:
+                    self.set_label(self.status_label,
+                                   f"감시 중! 남은 시간: {hours:02d}:{mins:02d}:{secs:02d}",
+                                   "red")
+
+        # 다음 정각 초에 맞춰 예약 (after(1000)처럼 지연이 누적되지 않음)
+        delay = int(seconds_to_next_tick() * 1000) + TICK_SLACK_MS
+        self.root.after(delay, self.update_current_time)
+
+    def set_duration(self, minutes):
+        """빠른 시간 설정 (누적 방식)"""
+        self.focus_duration += minutes * 60  # 초 단위로 누적
+
+        # 0 이하면 초기화
+        if self.focus_duration <= 0:
+            self.reset_duration()
+        else:
+            self.update_duration_display()
+
+    def update_duration_display(self):
+        """총 집중시간과 종료 시간 표시 업데이트"""
+        if self.focus_duration > 0:
+            # 총 집중시간 표시
+            hours = self.focus_duration // 3600
+            mins = (self.focus_duration % 3600) // 60
+            if hours > 0:
+                self.set_label(self.duration_label, f"{hours}시간 {mins}분", "green")
+            else:
+                self.set_label(self.duration_label, f"{mins}분", "green")
+
+            # 종료 시간 (현재 시간 + 집중 시간)
+            end_time = datetime.now() + timedelta(seconds=self.focus_duration)
+            self.set_label(self.end_time_label, end_time.strftime("%H:%M:%S"), "green")
+        else:
+            self.set_label(self.duration_label, "0분", "gray")
+            self.set_label(self.end_time_label, "--:--:--", "gray")
+
+    def reset_duration(self):
+        """시간 초기화"""
+        self.focus_duration = 0
+        self.session_clock = None
+        self.set_label(self.duration_label, "0분", "gray")
+        self.set_label(self.end_time_label, "--:--:--", "gray")
+
+    def toggle_super_mode(self):
+        """슈퍼 감시 모드 토글"""
+        if self.super_mode_var.get():
+            # 확인 대화상자 표시
+            self.show_super_mode_confirm()
+        else:
+            self.super_mode = False
+
+    def show_super_mode_confirm(self):
+        """슈퍼 감시 모드 확인 대화상자"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("슈퍼 감시 모드")
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        dialog.grab_set()
+
+        # 메시지
+        msg_frame = tk.Frame(dialog, padx=20, pady=20)
+        msg_frame.pack()
+
+        tk.Label(
+            msg_frame,
+            text="슈퍼 감시를 체크하는 순간부터\n집중 시작 후, 중간에 중지하는게 불가능합니다.\n\n반드시 설정한 집중시간을 마무리해야\n다시 차단한 앱을 사용할 수 있습니다.",
+            font=("", 12),
+            justify=tk.CENTER
+        ).pack()
+
+        # 버튼 프레임
+        btn_frame = tk.Frame(dialog, pady=15)
+        btn_frame.pack()
+
+        def on_confirm():
+            self.super_mode = True
+            dialog.destroy()
+
+        def on_cancel():
+            self.super_mode = False
+            self.super_mode_var.set(False)
+            dialog.destroy()
+
+        # 예, 알겠습니다 버튼 (Label 기반)
+        confirm_frame = tk.Frame(btn_frame, bg="#4CAF50", padx=2, pady=2)
+        confirm_frame.pack(side=tk.LEFT, padx=5)
+        confirm_btn = tk.Label(
+            confirm_frame,
+            text="  예, 알겠습니다  ",
+            bg="#4CAF50",
+            fg="white",
+            font=("", 11),
+            cursor="hand2"
+        )
+        confirm_btn.pack()
+        confirm_btn.bind("<Button-1>", lambda e: on_confirm())
+
+        # 취소 버튼 (Label 기반)
+        cancel_frame = tk.Frame(btn_frame, bg="#888888", padx=2, pady=2)
+        cancel_frame.pack(side=tk.LEFT, padx=5)
+        cancel_btn = tk.Label(
+            cancel_frame,
+            text="  취소  ",
+            bg="#888888",
+            fg="white",
+            font=("", 11),
+            cursor="hand2"
+        )
+        cancel_btn.pack()
+        cancel_btn.bind("<Button-1>", lambda e: on_cancel())
+
+        # 대화상자 중앙 배치
+        dialog.update_idletasks()
+        x = self.root.winfo_x() + (self.root.winfo_width() - dialog.winfo_width()) // 2
+        y = self.root.winfo_y() + (self.root.winfo_height() - dialog.winfo_height()) // 2
+        dialog.geometry(f"+{x}+{y}")
+
+        # X 버튼으로 닫을 때도 취소 처리
+        dialog.protocol("WM_DELETE_WINDOW", on_cancel)
+
+    def update_blocks_display(self):
+        """블록 UI 업데이트 (추가/삭제된 태그만 반영)"""
+        badges = {app: ACTION_BADGES[action] for app, action in self.app_actions.items()
+                  if action in ACTION_BADGES}
+        self.tag_flow.set_items(self.blocked_apps, badges)
+
+    def show_action_menu(self, app_name, event):
+        """태그 오른쪽 클릭 - 차단 방식 선택 메뉴"""
+        current = tk.StringVar(self.root, value=self.app_actions.get(app_name, ACTION_BLOCK))
+        menu = tk.Menu(self.root, tearoff=0)
+        for action, label in ACTION_LABELS.items():
+            menu.add_radiobutton(label=label, variable=current, value=action,
+                                 command=lambda a=action: self.set_app_action(app_name, a))
+        try:
+            menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            menu.grab_release()
+
+    def set_app_action(self, app_name, action):
+        """앱 차단 방식 변경 (감시 중이면 바로 적용)"""
+        from tkinter import messagebox
+        try:
+            self.daemon.set_app_action(app_name, action)
+        except (SessionError, ValueError, ControlError, OSError) as e:
+            messagebox.showwarning("경고", f"차단 방식을 바꿀 수 없습니다: {e}")
+
+    def update_profile_menu(self):
+        """프로필 선택 메뉴를 현재 목록으로 다시 채움"""
+        menu = self.profile_menu['menu']
+        menu.delete(0, tk.END)
+        for name in self.profile_names:
+            menu.add_command(label=name, command=lambda name=name: self.switch_profile(name))
+        menu.add_separator()
+        menu.add_command(label="새 프로필...", command=self.new_profile)
+        self.profile_var.set(self.profile)
+
+    def switch_profile(self, name):
+        """활성 프로필 변경 (화면은 apps_changed 이벤트로 갱신)"""
+        from tkinter import messagebox
+        try:
+            self.daemon.switch_profile(name)
+        except (SessionError, ControlError, OSError) as e:
+            messagebox.showwarning("경고", f"프로필을 바꿀 수 없습니다: {e}")
+        # 메뉴 표시는 실제로 바뀐 뒤 이벤트에서 맞춤
+        self.profile_var.set(self.profile)
+
+    def new_profile(self):
+        """이름을 입력받아 빈 프로필을 만들고 전환"""
+        from tkinter import simpledialog
+        name = simpledialog.askstring("새 프로필", "프로필 이름:", parent=self.root)
+        if name and name.strip():
+            self.switch_profile(name.strip())
+        else:
+            self.profile_var.set(self.profile)
+
+    def delete_profile(self):
+        """활성 프로필 삭제 (마지막 남은 프로필은 지울 수 없음)"""
+        from tkinter import messagebox
+        if not messagebox.askyesno("확인", f"'{self.profile}' 프로필을 삭제할까요?"):
+            return
+        try:
+            deleted = self.daemon.delete_profile(self.profile)
+        except (SessionError, ControlError, OSError) as e:
+            messagebox.showwarning("경고", f"프로필을 삭제할 수 없습니다: {e}")
+            return
+        if not deleted:
+            messagebox.showwarning("경고", "마지막 남은 프로필은 삭제할 수 없습니다.")
+
+    def remove_blocked_app(self, app_name):
+        """차단 앱 제거"""
+        if app_name in self.blocked_apps:
+            self.blocked_apps.remove(app_name)
+            self.update_blocks_display()
+            self.save_config()  # 자동 저장
+
+    def clear_all_apps(self):
+        """모든 차단 앱 초기화"""
+        if self.blocked_apps:
+            self.blocked_apps.clear()
+            self.update_blocks_display()
+            self.save_config()
+
+    def set_manual_duration(self):
+        """직접 입력한 시간 설정"""
+        from tkinter import messagebox
+        try:
+            hours = int(self.hour_entry.get() or 0)
+            mins = int(self.min_entry.get() or 0)
+            total_minutes = hours * 60 + mins
+
+            if total_minutes > 0:
+                self.set_duration(total_minutes)
+                self.hour_entry.delete(0, tk.END)
+                self.hour_entry.insert(0, "0")
+                self.min_entry.delete(0, tk.END)
+                self.min_entry.insert(0, "0")
+            else:
+                messagebox.showwarning("경고", "1분 이상 입력해주세요.")
+        except ValueError:
+            messagebox.showerror("오류", "숫자를 입력해주세요.")
+
+    def start_blocking(self):
+        from tkinter import messagebox
+        # 입력값 검증
+        if not self.blocked_apps:
+            messagebox.showwarning("경고", "차단할 앱을 추가해주세요.")
+            return
+
+        if self.focus_duration <= 0:
+            messagebox.showwarning("경고", "종료 시간을 설정해주세요.\n(+5분, +10분 등 버튼을 눌러주세요)")
+            return
+
+        # 감시는 데몬이 하고, 화면은 started 이벤트를 받아 바꿈
+        try:
+            self.daemon.start_session(self.focus_duration, self.super_mode)
+        except RuleError as e:
+            messagebox.showerror("오류", f"차단 규칙이 올바르지 않습니다.\n{e}")
+        except SessionError as e:
+            messagebox.showwarning("경고", str(e))
+
+    def stop_blocking(self):
+        from tkinter import messagebox
+        try:
+            self.daemon.stop_session()
+        except SessionError as e:
+            messagebox.showwarning("경고", str(e))
+
+    def show_session_started(self, remaining, super_mode):
+        """감시 중 화면으로 전환"""
+        # 종료 시점 계산 (벽시계가 바뀌거나 잠자기를 해도 세션 길이는 그대로)
+        self.session_clock = SessionClock(remaining)
+        self.set_label(self.end_time_label, self.session_clock.end_time.strftime("%H:%M:%S"), "red")
+        self.super_mode = super_mode
+        self.super_mode_var.set(super_mode)
+
+        # UI 상태 변경
+        self.is_running = True
+        # 시작 버튼 비활성화
+        self.start_btn.config(bg="#CCCCCC", fg="gray")
+        self.start_frame.config(bg="#CCCCCC")
+        self.start_btn.unbind("<Button-1>")
+        # 슈퍼 감시 체크박스 비활성화
+        self.super_checkbox.config(state=tk.DISABLED)
+
+        # 중지 버튼 (슈퍼 모드면 비활성화 유지)
+        if self.super_mode:
+            self.stop_btn.config(bg="#CCCCCC", fg="gray")
+            self.stop_frame.config(bg="#CCCCCC")
+            self.stop_btn.unbind("<Button-1>")
+            self.set_label(self.status_label, "슈퍼 감시 중! (중지 불가)", "#FF5555")
+        else:
+            self.stop_btn.config(bg="#FF5555", fg="white")
+            self.stop_frame.config(bg="#FF5555")
+            self.stop_btn.bind("<Button-1>", lambda e: self.stop_blocking())
+        self.select_btn.config(state=tk.DISABLED)
+
+    def show_session_stopped(self):
+        """대기 화면으로 전환"""
+        self.is_running = False
+        # 시작 버튼 활성화
+        self.start_btn.config(bg="#4CAF50", fg="white")
+        self.start_frame.config(bg="#4CAF50")
+        self.start_btn.bind("<Button-1>", lambda e: self.start_blocking())
+        # 중지 버튼 비활성화
+        self.stop_btn.config(bg="#CCCCCC", fg="gray")
+        self.stop_frame.config(bg="#CCCCCC")
+        self.stop_btn.unbind("<Button-1>")
+        self.select_btn.config(state=tk.NORMAL)
+        # 슈퍼 감시 모드 초기화
+        self.super_mode = False
+        self.super_mode_var.set(False)
+        self.super_checkbox.config(state=tk.NORMAL)
+        # 종료 시간만 초기화 (설정한 집중시간은 유지)
+        self.session_clock = None
+        self.set_label(self.status_label, "대기 중...", "gray")
+        # 종료 시간은 현재시간 기준으로 다시 표시
+        if self.focus_duration > 0:
+            end_time = datetime.now() + timedelta(seconds=self.focus_duration)
+            self.set_label(self.end_time_label, end_time.strftime("%H:%M:%S"), "green")
+
+    def open_app_selector(self):
+        """프로그램 선택 팝업 창 열기"""
+        # 새 팝업 창 생성
+        self.selector_window = tk.Toplevel(self.root)
+        self.selector_window.title("프로그램 선택")
+        self.selector_window.geometry("400x500")
+        self.selector_window.resizable(False, False)  # 크기 고정
+        self.selector_window.transient(self.root)  # 부모 창 위에 표시
+        self.selector_window.grab_set()  # 모달 창으로 설정
+
+        # 상단 영역 (제목 + 검색) - 고정
+        top_frame = tk.Frame(self.selector_window)
+        top_frame.pack(fill=tk.X)
+
+        tk.Label(top_frame, text="차단할 프로그램을 선택하세요",
+                 font=("", 12, "bold")).pack(pady=10)
+
+        search_frame = tk.Frame(top_frame)
+        search_frame.pack(fill=tk.X, padx=10, pady=5)
+
+        tk.Label(search_frame, text="검색:").pack(side=tk.LEFT)
+        self.search_var = tk.StringVar()
+        self.search_var.trace('w', self.filter_app_list)
+        search_entry = tk.Entry(search_frame, textvariable=self.search_var, width=30)
+        search_entry.pack(side=tk.LEFT, padx=5)
+
+        # 백그라운드 목록 로딩 표시
+        self.loading_label = tk.Label(top_frame, text="실행 중인 앱 불러오는 중...", fg="gray")
+        self.loading_label.pack()
+
+        # 하단 버튼 영역 - 먼저 pack (항상 보이게)
+        btn_frame = tk.Frame(self.selector_window)
+        btn_frame.pack(side=tk.BOTTOM, pady=10)
+
+        # 선택 완료 버튼 (Label로 구현)
+        confirm_frame = tk.Frame(btn_frame, bg="#4CAF50", padx=2, pady=2)
+        confirm_frame.pack(side=tk.LEFT, padx=5)
+        confirm_btn = tk.Label(confirm_frame, text="  선택 완료  ", bg="#4CAF50", fg="white",
+                               font=("", 11), cursor="hand2")
+        confirm_btn.pack()
+        confirm_btn.bind("<Button-1>", lambda e: self.confirm_selection())
+
+        # 취소 버튼
+        cancel_frame = tk.Frame(btn_frame, bg="#888888", padx=2, pady=2)
+        cancel_frame.pack(side=tk.LEFT, padx=5)
+        cancel_btn = tk.Label(cancel_frame, text="  취소  ", bg="#888888", fg="white",
+                              font=("", 11), cursor="hand2")
+        cancel_btn.pack()
+        cancel_btn.bind("<Button-1>", lambda e: self.selector_window.destroy())
+
+        # 중간 영역 (스크롤 가능한 앱 목록) - 나머지 공간 차지
+        # 체크 상태는 app_checkboxes(앱 이름 -> 체크 여부)에 저장
+        self.app_checkboxes = {}
+        self.app_list = VirtualCheckList(self.selector_window, self.app_checkboxes)
+        self.app_list.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        # 목록은 비워 둔 채로 창을 먼저 띄우고 도착하는 대로 채움
+        self.running_apps = []
+        self.search_index = SearchIndex()
+        self.search_after_id = None
+
+        # 캐시된 설치 앱은 바로 표시 (메모리에서 읽으므로 대기 없음)
+        include_installed = not self.app_catalog.ready.is_set()
+        if not include_installed:
+            self.add_selector_apps(self.get_installed_apps())
+
+        # 실행 중인 앱(osascript)과 첫 실행 시 설치 앱 목록은 백그라운드에서
+        app_queue = queue.Queue()
+        threading.Thread(target=self.load_selector_apps, args=(app_queue, include_installed),
+                         daemon=True).start()
+        self.poll_selector_apps(self.selector_window, app_queue)
+
+    def display_app_list(self, apps, keep_position=False):
+        """앱 목록을 체크박스로 표시 (보이는 줄만 위젯 생성)"""
+        self.app_list.set_items(apps, keep_position)
+
+    def filtered_apps(self):
+        """검색어에 맞는 앱 목록 (검색어가 있으면 순위순)"""
+        search_text = self.search_var.get()
+
+        if search_text.strip():
+            return self.search_index.search(search_text)
+        return self.running_apps
+
+    def filter_app_list(self, *args):
+        """검색어로 앱 목록 필터링 (입력이 멈출 때까지 잠시 대기)"""
+        if self.search_after_id is not None:
+            self.root.after_cancel(self.search_after_id)
+        self.search_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self.apply_search)
+
+    def apply_search(self):
+        self.search_after_id = None
+        if self.selector_window.winfo_exists():
+            self.display_app_list(self.filtered_apps())
+
+    def get_installed_apps(self):
+        """설치된 앱 목록 (디스크 캐시, 첫 실행이면 목록을 읽을 때까지 대기)"""
+        return sorted(self.app_catalog.names() - EXCLUDED_APPS)
+
+    def get_running_apps(self):
+        """실행 중인 GUI 앱 목록 (macOS, osascript 호출로 느릴 수 있음)"""
+        apps = set()
+        try:
+            result = subprocess.run(
+                ['osascript', '-e',
+                 'tell application "System Events" to get name of every process whose background only is false'],
+                capture_output=True, text=True, timeout=5
+            )
+
+            if result.returncode == 0:
+                app_list = result.stdout.strip().split(', ')
+                for app in app_list:
+                    app = app.strip()
+                    # macOS NFD -> NFC 정규화 (한글 비교 문제 해결)
+                    app = normalize_name(app)
+                    if app and app not in EXCLUDED_APPS:
+                        apps.add(app)
+        except Exception:
+            pass
+
+        return sorted(apps)
+
+    def load_selector_apps(self, app_queue, include_installed):
+        """앱 목록을 읽어서 큐로 전달 (백그라운드 스레드)"""
+        if include_installed:
+            app_queue.put(self.get_installed_apps())
+        app_queue.put(self.get_running_apps())
+        app_queue.put(None)  # 완료 표시
+
+    def poll_selector_apps(self, window, app_queue):
+        """큐에 도착한 앱 목록을 선택 창에 반영 (메인 스레드)"""
+        if window is not self.selector_window or not window.winfo_exists():
+            return  # 창이 닫혔거나 새로 열림
+
+        finished = False
+        while True:
+            try:
+                batch = app_queue.get_nowait()
+            except queue.Empty:
+                break
+            if batch is None:
+                finished = True
+            else:
+                self.add_selector_apps(batch)
+
+        if finished:
+            self.loading_label.pack_forget()
+        else:
+            self.root.after(50, self.poll_selector_apps, window, app_queue)
+
+    def add_selector_apps(self, apps):
+        """선택 창 목록에 앱 추가 (기존 체크 상태 유지)"""
+        new_apps = [app for app in apps if app not in self.app_checkboxes]
+        if not new_apps:
+            return
+        for app_name in new_apps:
+            self.app_checkboxes[app_name] = app_name in self.blocked_apps
+        self.search_index.add(new_apps)
+        self.running_apps = sorted(self.app_checkboxes)
+        self.display_app_list(self.filtered_apps(), keep_position=True)
+
+    def confirm_selection(self):
+        """선택한 앱들을 블록 리스트에 추가/제거"""
+        selected_apps = [name for name, checked in self.app_checkboxes.items() if checked]
+        unselected_apps = [name for name, checked in self.app_checkboxes.items() if not checked]
+
+        # 새로 선택한 앱 추가 (중복 제거)
+        for app in selected_apps:
+            if app not in self.blocked_apps:
+                self.blocked_apps.append(app)
+
+        # 체크 해제한 앱 제거
+        for app in unselected_apps:
+            if app in self.blocked_apps:
+                self.blocked_apps.remove(app)
+
+        # 블록 UI 업데이트
+        self.update_blocks_display()
+        self.save_config()  # 자동 저장
+
+        self.selector_window.destroy()
+
+
+def bring_to_front(root):
+    """창을 최상위로 가져옴"""
+    root.deiconify()  # 최소화되어 있으면 복원
+    root.lift()  # 창을 위로
+    root.focus_force()  # 포커스
+    # macOS에서 확실히 앞으로 가져오기
+    if sys.platform == 'darwin':
+        subprocess.run([
+            'osascript', '-e',
+            'tell application "System Events" to set frontmost of process "Python" to true'
+        ], capture_output=True)
+
+
+def run(attach=False):
+    """창 실행 (attach면 창 없이 실행 중인 데몬에 붙고, 아니면 데몬을 품음)"""
+    root = tk.Tk()
+    ui = UiQueue(root)
+    server = None
+    if attach:
+        # 창을 닫아도 감시는 데몬에서 계속됨
+        daemon = DaemonClient()
+        daemon.open()
+    else:
+        # 첫 번째 인스턴스 - 데몬을 품고 제어 소켓 열기
+        daemon = FocusDaemon(ConfigStore(AppBlockerGUI.CONFIG_FILE), create_default_sink(ui))
+        server = ControlServer(daemon, on_raise=lambda: ui.post('raise', bring_to_front, root))
+        try:
+            server.start()
+        except OSError as e:
+            print(f"제어 소켓을 열 수 없습니다: {e}")
+            root.destroy()
+            return 0
+        daemon.open()
+
+    AppBlockerGUI(root, daemon, ui)
+    root.mainloop()
+
+    # 종료 시 소켓 정리
+    if server is not None:
+        server.stop()
+    return 0
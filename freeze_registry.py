@@ -0,0 +1,127 @@
+"""일시 정지한 프로세스 목록 (비정상 종료 후에도 재개)
+
+일시 정지(SIGSTOP)한 프로세스는 감시 프로세스가 죽으면 아무도 재개해 주지 않는다.
+그래서 정지하기 전에 (pid, create_time) 목록을 파일에 먼저 기록해 두고
+(기록 후 정지 전에 죽어도 실행 중인 프로세스에 SIGCONT를 보낼 뿐이라 무해),
+세션이 끝날 때와 데몬이 다시 시작될 때 목록의 프로세스를 한꺼번에 재개한다.
+create_time이 다르면 PID가 재사용된 다른 프로세스이므로 건드리지 않는다.
+
+파일 형식 (~/.focus_mode_frozen.json):
+    {"processes": [{"pid": 1234, "create_time": 1700000000.12}, ...]}
+
+데몬이 시작할 때 불러오므로 psutil은 실제로 프로세스를 다룰 때 불러온다.
+(남은 기록이 없으면 창/데몬 시작 시 psutil을 불러오지 않음)
+"""
+import json
+import os
+import threading
+
+from config_store import write_atomic
+
+FROZEN_FILE = os.path.expanduser("~/.focus_mode_frozen.json")
+# create_time 비교 허용 오차 (초, 제공자마다 반올림이 다름)
+CREATE_TIME_TOLERANCE = 0.05
+
+
+class FreezeRegistry:
+    """일시 정지한 프로세스 관리 (path가 None이면 메모리에만 보관)"""
+
+    def __init__(self, path=FROZEN_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.procs = {}  # pid -> psutil.Process (정지한 순서 유지)
+
+    def __len__(self):
+        return len(self.procs)
+
+    def __contains__(self, pid):
+        return pid in self.procs
+
+    def add(self, procs):
+        """정지할 프로세스 등록 (신호를 보내기 전에 호출, 파일에 바로 기록)
+
+        새로 등록한 프로세스 목록을 반환한다.
+        """
+        with self.lock:
+            added = []
+            for proc in procs:
+                if proc.pid not in self.procs:
+                    self.procs[proc.pid] = proc
+                    added.append(proc)
+            if added:
+                self._save()
+        return added
+
+    def discard(self, procs):
+        """정지하지 못한 프로세스를 목록에서 뺌"""
+        with self.lock:
+            removed = [proc for proc in procs if self.procs.pop(proc.pid, None) is not None]
+            if removed:
+                self._save()
+
+    def resume_all(self):
+        """등록된 프로세스를 정지한 역순으로 재개 (재개한 수 반환)"""
+        import psutil
+        with self.lock:
+            procs = list(self.procs.values())
+            self.procs.clear()
+            resumed = 0
+            for proc in reversed(procs):
+                try:
+                    proc.resume()  # psutil이 PID 재사용 여부를 확인
+                    resumed += 1
+                except psutil.Error:
+                    pass  # 이미 종료됨 / 권한 없음
+            self._save()
+        return resumed
+
+    def recover(self):
+        """이전 실행이 남긴 목록의 프로세스 재개 (데몬 시작 시)"""
+        if self.path is None:
+            return 0
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f).get('processes', [])
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"일시 정지 목록을 읽을 수 없습니다: {e}")
+            entries = []
+
+        import psutil
+        procs = []
+        for entry in entries:
+            try:
+                proc = psutil.Process(int(entry['pid']))
+                if abs(proc.create_time() - float(entry['create_time'])) > CREATE_TIME_TOLERANCE:
+                    continue  # PID가 재사용됨
+            except (psutil.Error, KeyError, TypeError, ValueError):
+                continue
+            procs.append(proc)
+        with self.lock:
+            for proc in procs:
+                self.procs.setdefault(proc.pid, proc)
+        return self.resume_all()
+
+    def _save(self):
+        if self.path is None:
+            return
+        if not self.procs:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"일시 정지 목록 삭제 실패: {e}")
+            return
+        import psutil
+        entries = []
+        for proc in self.procs.values():
+            try:
+                entries.append({'pid': proc.pid, 'create_time': proc.create_time()})
+            except psutil.Error:
+                pass
+        try:
+            write_atomic(self.path, json.dumps({'processes': entries}))
+        except OSError as e:
+            print(f"일시 정지 목록 저장 실패: {e}")
@@ -0,0 +1,192 @@
+"""감시 엔진 계측 (카운터 / 히스토그램 / 게이지)
+
+감시 루프에서는 미리 받아 둔 Counter/Histogram 객체의 값만 바꾸므로
+잠금이나 딕셔너리 조회 없이 기록된다 (기록은 감시 스레드 하나만 한다).
+게이지는 값을 읽을 때 콜백으로 계산한다.
+
+읽는 방법:
+- snapshot(): JSON으로 바꿀 수 있는 딕셔너리
+- to_prometheus(): Prometheus 텍스트 형식
+- MetricsFileExporter: 주기적으로 파일에 기록 (.prom 이면 Prometheus 형식)
+"""
+import bisect
+import json
+import os
+import threading
+import time
+
+# 초 단위 히스토그램 기본 구간 (100µs ~ 10s)
+DEFAULT_BOUNDS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+                  0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 파일 기록 주기 (초)
+FLUSH_INTERVAL = 10.0
+
+
+class Counter:
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+
+class Histogram:
+    __slots__ = ('bounds', 'buckets', 'count', 'sum')
+
+    def __init__(self, bounds=DEFAULT_BOUNDS):
+        self.bounds = tuple(bounds)
+        self.buckets = [0] * (len(self.bounds) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """구간 상한 기준 근사 분위수 (관측값 없으면 None)"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                return self.bounds[i] if i < len(self.bounds) else float('inf')
+        return float('inf')
+
+
+class Metrics:
+    """이름으로 등록된 계측값 모음"""
+
+    def __init__(self):
+        self.started = time.time()
+        self.counters = {}  # (이름, 라벨) -> (Counter, 설명)
+        self.histograms = {}  # 이름 -> (Histogram, 설명)
+        self.gauges = {}  # 이름 -> (콜백, 설명)
+
+    def counter(self, name, help_text='', labels=None):
+        key = (name, tuple(sorted((labels or {}).items())))
+        if key not in self.counters:
+            self.counters[key] = (Counter(), help_text)
+        return self.counters[key][0]
+
+    def histogram(self, name, help_text='', bounds=DEFAULT_BOUNDS):
+        if name not in self.histograms:
+            self.histograms[name] = (Histogram(bounds), help_text)
+        return self.histograms[name][0]
+
+    def gauge(self, name, func, help_text=''):
+        """읽을 때 func()로 값을 계산하는 게이지 등록 (같은 이름이면 교체)"""
+        self.gauges[name] = (func, help_text)
+
+    def _gauge_values(self):
+        values = {}
+        for name, (func, _) in self.gauges.items():
+            try:
+                values[name] = func()
+            except Exception:
+                values[name] = None
+        return values
+
+    def snapshot(self):
+        counters = {}
+        for (name, labels), (counter, _) in self.counters.items():
+            if labels:
+                key = name + '{' + ','.join(f'{k}="{v}"' for k, v in labels) + '}'
+            else:
+                key = name
+            counters[key] = counter.value
+
+        histograms = {}
+        for name, (hist, _) in self.histograms.items():
+            histograms[name] = {
+                'count': hist.count,
+                'sum': hist.sum,
+                'p50': hist.quantile(0.5),
+                'p99': hist.quantile(0.99),
+                'buckets': dict(zip([str(b) for b in hist.bounds] + ['+Inf'], hist.buckets)),
+            }
+
+        return {
+            'timestamp': time.time(),
+            'uptime_sec': time.time() - self.started,
+            'counters': counters,
+            'histograms': histograms,
+            'gauges': self._gauge_values(),
+        }
+
+    def to_prometheus(self):
+        lines = []
+        described = set()
+        for (name, labels), (counter, help_text) in self.counters.items():
+            if name not in described:
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} counter')
+                described.add(name)
+            label_text = ','.join(f'{k}="{v}"' for k, v in labels)
+            lines.append(f'{name}{{{label_text}}} {counter.value}' if labels
+                         else f'{name} {counter.value}')
+
+        for name, (hist, help_text) in self.histograms.items():
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} histogram')
+            cumulative = 0
+            for bound, n in zip(list(hist.bounds) + ['+Inf'], hist.buckets):
+                cumulative += n
+                lines.append(f'{name}_bucket{{le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_sum {hist.sum}')
+            lines.append(f'{name}_count {hist.count}')
+
+        values = self._gauge_values()
+        for name, (_, help_text) in self.gauges.items():
+            if values[name] is None:
+                continue
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} gauge')
+            lines.append(f'{name} {values[name]}')
+        return '\n'.join(lines) + '\n'
+
+
+class MetricsFileExporter:
+    """계측값을 주기적으로 파일에 기록 (임시 파일 + rename으로 원자적 교체)"""
+
+    def __init__(self, metrics, path, interval=FLUSH_INTERVAL):
+        self.metrics = metrics
+        self.path = os.path.expanduser(path)
+        self.interval = interval
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name="metrics", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """스레드 종료 후 마지막 값 기록"""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(1.0)
+            self.thread = None
+        self.flush()
+
+    def flush(self):
+        if self.path.endswith('.prom'):
+            text = self.metrics.to_prometheus()
+        else:
+            text = json.dumps(self.metrics.snapshot(), ensure_ascii=False, indent=2)
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"계측값 기록 실패: {e}")
+
+    def _run(self):
+        while not self.stop_event.wait(self.interval):
+            self.flush()
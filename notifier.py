@@ -0,0 +1,185 @@
+"""차단 알림 디스패처
+
+감시 스레드는 notify()로 알림을 큐에 넣기만 하고 바로 돌아간다.
+실제 표시는 전용 스레드가 담당하며, 같은 앱의 알림은 합쳐서
+("[Slack] 최근 1분 동안 7번 차단됨") 앱별 최소 간격마다 한 번만 표시한다.
+"""
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+# 큐 최대 길이 (대기 중인 앱 수)
+QUEUE_SIZE = 64
+# 같은 앱 알림 최소 간격 (초)
+MIN_INTERVAL = 60.0
+
+_STOP = object()
+
+
+def format_message(app_name, count, elapsed):
+    """알림 문구 생성 (합쳐진 알림이면 횟수 표시)"""
+    if count <= 1:
+        return f"[{app_name}] 차단됨!\n\n1분 1초가 아깝다!\n하던 일을 마무리 하세요!"
+    if elapsed >= 60:
+        period = f"{int(elapsed // 60)}분"
+    else:
+        period = f"{max(int(elapsed), 1)}초"
+    return (f"[{app_name}] 최근 {period} 동안 {count}번 차단됨!\n\n"
+            f"1분 1초가 아깝다!\n하던 일을 마무리 하세요!")
+
+
+class NotificationSink:
+    """알림 표시 방식 공통 인터페이스"""
+
+    def show(self, app_name, message):
+        raise NotImplementedError
+
+
+class OsascriptSink(NotificationSink):
+    """macOS 네이티브 다이얼로그"""
+
+    def show(self, app_name, message):
+        message = message.replace('"', '\\"').replace('\n', '\\n')
+        subprocess.run([
+            'osascript', '-e',
+            f'display dialog "{message}" with title "집중 모드" buttons {{"확인"}} default button "확인" with icon caution'
+        ], capture_output=True)
+
+
+class NotifySendSink(NotificationSink):
+    """Linux 데스크톱 알림 (notify-send)"""
+
+    def show(self, app_name, message):
+        subprocess.run(['notify-send', '-a', '집중 모드', '집중 모드', message],
+                       capture_output=True)
+
+
+class ToastSink(NotificationSink):
+    """앱 창 위에 잠시 표시되는 토스트 (tkinter)
+
+    ui: 화면 갱신 큐 (ui_queue.UiQueue) - 알림 스레드에서 Tk를 직접 부르지 않고 큐로 넘김
+    """
+    DURATION_MS = 3000
+
+    def __init__(self, ui):
+        self.ui = ui
+        self.root = ui.root
+
+    def show(self, app_name, message):
+        # Tk 위젯은 메인 스레드에서만 생성 (다른 화면 갱신과 같은 프레임에 모아서)
+        self.ui.post(None, self._show, message)
+
+    def _show(self, message):
+        import tkinter as tk
+
+        toast = tk.Toplevel(self.root)
+        toast.overrideredirect(True)
+        toast.attributes('-topmost', True)
+        tk.Label(toast, text=message, bg="#333333", fg="white",
+                 font=("", 11), padx=15, pady=10, justify=tk.LEFT).pack()
+        toast.update_idletasks()
+        x = self.root.winfo_x() + (self.root.winfo_width() - toast.winfo_width()) // 2
+        y = self.root.winfo_y() + 40
+        toast.geometry(f"+{x}+{y}")
+        toast.after(self.DURATION_MS, toast.destroy)
+
+
+class NullSink(NotificationSink):
+    """표시하지 않고 기록만 (테스트/헤드리스용)"""
+
+    def __init__(self):
+        self.shown = []
+
+    def show(self, app_name, message):
+        self.shown.append((app_name, message))
+
+
+def create_default_sink(ui=None):
+    """플랫폼에 맞는 기본 알림 방식 선택 (ui: 창이 있으면 화면 갱신 큐)"""
+    if sys.platform == 'darwin':
+        return OsascriptSink()
+    if shutil.which('notify-send'):
+        return NotifySendSink()
+    if ui is not None:
+        return ToastSink(ui)
+    return NullSink()
+
+
+class NotificationDispatcher:
+    """알림 전용 스레드 + 앱별 합치기/속도 제한"""
+
+    def __init__(self, sink, queue_size=QUEUE_SIZE, min_interval=MIN_INTERVAL):
+        self.sink = sink
+        self.min_interval = min_interval
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.lock = threading.Lock()
+        self.pending = {}  # 앱 이름 -> [횟수, 첫 차단 시각]
+        self.dropped = 0  # 큐가 가득 차서 버린 알림 수
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name="notifier", daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout=1.0):
+        """스레드 종료 (표시 중인 다이얼로그는 기다리지 않음)"""
+        if self.thread is None:
+            return
+        try:
+            self.queue.put_nowait(_STOP)
+        except queue.Full:
+            pass
+        self.thread.join(timeout)
+        self.thread = None
+
+    def notify(self, app_name):
+        """차단 알림 요청 (절대 대기하지 않음)"""
+        with self.lock:
+            entry = self.pending.get(app_name)
+            if entry is not None:
+                # 이미 대기 중인 앱이면 횟수만 증가
+                entry[0] += 1
+                return
+            try:
+                self.queue.put_nowait(app_name)
+            except queue.Full:
+                self.dropped += 1
+                return
+            self.pending[app_name] = [1, time.monotonic()]
+
+    def _run(self):
+        last_shown = {}  # 앱 이름 -> 마지막 표시 시각
+        deferred = {}  # 앱 이름 -> 표시 예정 시각
+
+        while True:
+            timeout = None
+            if deferred:
+                timeout = max(0.0, min(deferred.values()) - time.monotonic())
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                break
+
+            now = time.monotonic()
+            if item is not None:
+                due = last_shown.get(item, now - self.min_interval) + self.min_interval
+                deferred[item] = max(due, now)
+
+            for app_name, due in list(deferred.items()):
+                if due > now:
+                    continue
+                del deferred[app_name]
+                with self.lock:
+                    count, first = self.pending.pop(app_name, (0, now))
+                if not count:
+                    continue
+                try:
+                    self.sink.show(app_name, format_message(app_name, count, now - first))
+                except Exception as e:
+                    print(f"알림 표시 실패: {e}")
+                last_shown[app_name] = time.monotonic()
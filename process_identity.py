@@ -0,0 +1,138 @@
+"""프로세스 실행 파일 / 번들 ID / 명령줄 확인 (후보 PID만, 캐시)
+
+프로세스 이름만으로는 놓치는 경우가 있다.
+- Linux 프로세스 이름(comm)은 15자에서 잘림 ("Google Chrome H...")
+- 실행 중에 이름을 바꾸거나(setproctitle) 실행 파일 이름을 바꾼 앱
+
+이름으로 일치하지 않은 새 프로세스 중에서도
+- 실행 파일 경로는 경로/번들 ID 규칙이 있거나 이름이 잘렸을 수 있을 때만
+- 명령줄은 잘린 이름이 규칙의 앞부분일 수 있을 때만
+조회한다.
+결과는 (pid, create_time, 이름)마다 한 번만 구해서 LRU로 보관하므로
+이미 본 프로세스에는 검사마다 시스템 호출이 늘지 않는다.
+"""
+import functools
+import os
+import plistlib
+from collections import OrderedDict
+
+import psutil
+
+# 보관할 프로세스 신원 수 (넘으면 가장 오래 안 쓴 것부터 버림)
+IDENTITY_CACHE_SIZE = 4096
+# 번들 ID를 기억할 .app 폴더 수
+BUNDLE_CACHE_SIZE = 256
+
+_APP_SUFFIX = '.app'
+_BUNDLE_MARKER = _APP_SUFFIX + '/Contents/'
+
+
+def bundle_path(exe):
+    """실행 파일이 속한 가장 바깥 .app 폴더 (없으면 None)"""
+    index = exe.find(_BUNDLE_MARKER) if exe else -1
+    if index < 0:
+        return None
+    return exe[:index + len(_APP_SUFFIX)]
+
+
+@functools.lru_cache(maxsize=BUNDLE_CACHE_SIZE)
+def read_bundle_id(path):
+    """.app 폴더의 CFBundleIdentifier (읽을 수 없으면 None)"""
+    try:
+        with open(os.path.join(path, 'Contents', 'Info.plist'), 'rb') as f:
+            bundle_id = plistlib.load(f).get('CFBundleIdentifier')
+    except (OSError, ValueError, plistlib.InvalidFileException):
+        return None
+    return bundle_id if isinstance(bundle_id, str) else None
+
+
+class Identity:
+    """프로세스 하나의 확인된 신원
+
+    exe: 실행 파일 경로 (조회하지 않았으면 None, 알 수 없으면 '')
+    bundle_id: macOS 번들 ID (없으면 None)
+    full_name: 명령줄로 복원한 전체 이름 (읽지 않았으면 None, 없으면 '')
+    """
+    __slots__ = ('exe', 'bundle_id', 'bundle_name', 'full_name')
+
+    def __init__(self):
+        self.exe = None
+        self.bundle_id = None
+        self.bundle_name = None
+        self.full_name = None
+
+    def set_exe(self, exe):
+        self.exe = exe or ''
+        path = bundle_path(exe)
+        self.bundle_id = read_bundle_id(path) if path else None
+        self.bundle_name = os.path.basename(path)[:-len(_APP_SUFFIX)] if path else None
+
+    def names(self):
+        """규칙과 비교해 볼 이름들 (프로세스 이름 외)"""
+        names = []
+        if self.full_name:
+            names.append(self.full_name)
+        if self.exe:
+            names.append(os.path.basename(self.exe))
+        if self.bundle_name:
+            names.append(self.bundle_name)
+        return names
+
+
+def restore_name(name, cmdline):
+    """잘린 이름을 명령줄 첫 인자로 복원 (앞부분이 같을 때만)"""
+    if not cmdline:
+        return ''
+    # 크롬 계열은 인자를 공백으로 이어 붙여 argv[0] 하나로 바꾸기도 함
+    full_name = os.path.basename(cmdline[0].split(' -', 1)[0])
+    return full_name if full_name.startswith(name) else ''
+
+
+class IdentityResolver:
+    """후보 PID의 신원을 한 번만 조회해서 LRU로 보관"""
+
+    def __init__(self, process_table, cache_size=IDENTITY_CACHE_SIZE):
+        self.process_table = process_table
+        self.cache_size = cache_size
+        self.cache = OrderedDict()  # (pid, create_time, 이름) -> Identity
+        self.truncates_names = getattr(process_table, 'truncates_names', False)
+        self.lookups = 0  # 실제로 시스템 호출을 한 횟수
+
+    def __len__(self):
+        return len(self.cache)
+
+    def resolve(self, pid, create_time, name, rules):
+        """Identity 반환 (규칙상 더 확인할 것이 없거나 프로세스가 이미 종료됐으면 None)"""
+        truncated = self.truncates_names and rules.may_be_truncated(name)
+        if not truncated and not rules.needs_exe:
+            return None  # 이름만으로 판정 끝
+
+        key = (pid, create_time, name)
+        identity = self.cache.get(key)
+        if identity is None:
+            identity = self.cache[key] = Identity()
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        else:
+            self.cache.move_to_end(key)
+
+        # 실행 파일은 한 번만 조회 (잘린 이름은 실행 파일 이름으로도 확인)
+        if identity.exe is None:
+            try:
+                identity.set_exe(self.process_table.exe(pid))
+            except psutil.NoSuchProcess:
+                return None
+            except psutil.AccessDenied:
+                identity.set_exe('')
+            self.lookups += 1
+
+        # 명령줄은 잘린 이름이 규칙과 관련 있을 때만 읽음
+        if identity.full_name is None and truncated:
+            try:
+                identity.full_name = restore_name(name, self.process_table.cmdline(pid))
+            except psutil.NoSuchProcess:
+                return None
+            except psutil.AccessDenied:
+                identity.full_name = ''
+            self.lookups += 1
+        return identity
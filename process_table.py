@@ -0,0 +1,247 @@
+"""프로세스 테이블 제공자와 증분 스캐너
+
+매 검사마다 모든 PID의 이름을 다시 조회하지 않도록
+(pid, create_time) 기준 캐시를 두고, 이전 검사 이후 새로 나타난
+PID만 이름을 조회한다. 종료된 PID는 캐시에서 제거한다.
+전체 검사(폴링)에서는 이미 확인한 PID도 RECHECK_INTERVAL마다 한 바퀴씩
+나눠서 다시 조회해서, 재사용된 PID와 확인 후 다른 프로그램으로 exec한
+프로세스(셸 래퍼, snap/flatpak 실행기)를 놓치지 않는다.
+
+프로세스 정보는 제공자(process table)를 통해서만 읽으므로
+벤치마크에서는 가짜 제공자로 바꿔 끼울 수 있다.
+제공자는 pids(), identify(pid), exe(pid), cmdline(pid)를 구현하고
+실패 시 psutil.NoSuchProcess / psutil.AccessDenied를 발생시킨다.
+
+제공자 종류 (설정 파일 process_table 항목):
+- proc: Linux /proc 직접 읽기 (stat 한 번 읽어서 생성 시각과 이름을 얻음)
+- psutil: psutil.Process 사용 (모든 플랫폼)
+- auto: Linux면 proc, 아니면 psutil (기본값)
+"""
+import math
+import os
+import sys
+import time
+from collections import deque
+
+import psutil
+
+# 이벤트 기반 검사에서 종료된 PID를 정리하는 주기 (초)
+PRUNE_INTERVAL = 30.0
+# 전체 검사에서 이미 확인한 프로세스를 모두 한 번씩 다시 조회하는 주기 (초)
+RECHECK_INTERVAL = 5.0
+
+
+class PsutilProcessTable:
+    """psutil 기반 프로세스 테이블"""
+    name = "psutil"
+    truncates_names = False  # psutil은 잘린 이름을 명령줄로 복원해서 반환
+
+    def pids(self):
+        return psutil.pids()
+
+    def identify(self, pid):
+        """(create_time, name) 반환"""
+        proc = psutil.Process(pid)
+        with proc.oneshot():
+            return proc.create_time(), proc.name()
+
+    def exe(self, pid):
+        return psutil.Process(pid).exe()
+
+    def cmdline(self, pid):
+        return psutil.Process(pid).cmdline()
+
+
+class ProcProcessTable:
+    """Linux /proc 직접 읽기 프로세스 테이블
+
+    PID마다 Process 객체를 만들지 않고 /proc/<pid>/stat 하나만 읽는다.
+    읽기 버퍼는 재사용하므로 한 스레드(감시 스레드)에서만 사용해야 한다.
+    """
+    name = "proc"
+    truncates_names = True  # stat의 comm은 15자에서 잘림
+    BUFFER_SIZE = 4096  # stat 한 줄 (comm 최대 16바이트 + 숫자 50여 개)
+
+    def __init__(self, proc_root='/proc'):
+        self.proc_root = proc_root
+        self.buffer = bytearray(self.BUFFER_SIZE)
+        self.clock_ticks = os.sysconf('SC_CLK_TCK')
+        self.boot_time = self._read_boot_time()
+
+    def _read_boot_time(self):
+        with open(os.path.join(self.proc_root, 'stat'), 'rb') as f:
+            for line in f:
+                if line.startswith(b'btime'):
+                    return float(line.split()[1])
+        raise RuntimeError("/proc/stat에 btime이 없습니다")
+
+    def pids(self):
+        # scandir는 항목마다 DirEntry를 만들어서 bytes 이름 목록보다 느림
+        return [int(name) for name in os.listdir(os.fsencode(self.proc_root)) if name.isdigit()]
+
+    def _read_stat(self, pid):
+        """/proc/<pid>/stat 내용을 재사용 버퍼에 읽어서 memoryview 반환"""
+        try:
+            fd = os.open(f'{self.proc_root}/{pid}/stat', os.O_RDONLY)
+        except (FileNotFoundError, ProcessLookupError):
+            raise psutil.NoSuchProcess(pid) from None
+        except PermissionError:
+            raise psutil.AccessDenied(pid) from None
+        try:
+            size = os.readv(fd, [self.buffer])
+        except ProcessLookupError:
+            raise psutil.NoSuchProcess(pid) from None
+        finally:
+            os.close(fd)
+        if not size:
+            raise psutil.NoSuchProcess(pid)
+        return memoryview(self.buffer)[:size]
+
+    def identify(self, pid):
+        """(create_time, name) 반환"""
+        data = self._read_stat(pid)
+        # 형식: pid (comm) state ppid ... - comm에 공백/괄호가 있을 수 있어 마지막 ')' 기준
+        raw = bytes(data)
+        close = raw.rfind(b')')
+        name = raw[raw.find(b'(') + 1:close].decode('utf-8', 'surrogateescape')
+        # ')' 뒤 19번째 값이 부팅 후 시작 시각 (starttime, 클록 틱)
+        start_ticks = int(raw[close + 2:].split(None, 20)[19])
+        return self.boot_time + start_ticks / self.clock_ticks, name
+
+    def exe(self, pid):
+        try:
+            path = os.readlink(f'{self.proc_root}/{pid}/exe')
+        except FileNotFoundError:
+            if os.path.exists(f'{self.proc_root}/{pid}'):
+                return ''  # 커널 스레드는 실행 파일이 없음 (psutil과 같게)
+            raise psutil.NoSuchProcess(pid) from None
+        except ProcessLookupError:
+            raise psutil.NoSuchProcess(pid) from None
+        except PermissionError:
+            raise psutil.AccessDenied(pid) from None
+        # 실행 파일이 지워졌거나 바뀐 경우 커널이 붙이는 표시 제거
+        if path.endswith(' (deleted)') and not os.path.exists(path):
+            path = path[:-len(' (deleted)')]
+        return path
+
+    def cmdline(self, pid):
+        try:
+            with open(f'{self.proc_root}/{pid}/cmdline', 'rb') as f:
+                data = f.read()
+        except (FileNotFoundError, ProcessLookupError):
+            raise psutil.NoSuchProcess(pid) from None
+        except PermissionError:
+            raise psutil.AccessDenied(pid) from None
+        return [arg.decode('utf-8', 'surrogateescape') for arg in data.split(b'\0') if arg]
+
+
+PROCESS_TABLES = {
+    'proc': ProcProcessTable,
+    'psutil': PsutilProcessTable,
+}
+
+
+def create_process_table(kind='auto'):
+    """설정값에 맞는 프로세스 테이블 (proc을 쓸 수 없으면 psutil)"""
+    if kind == 'auto':
+        kind = 'proc' if sys.platform.startswith('linux') else 'psutil'
+    if kind == 'proc':
+        try:
+            return ProcProcessTable()
+        except (OSError, RuntimeError, ValueError):
+            pass
+    return PsutilProcessTable()
+
+
+class ProcessScanner:
+    """PID 비교 기반 증분 스캐너
+
+    캐시 형태: {pid: (create_time, name)}
+    """
+
+    def __init__(self, process_table=None, prune_interval=PRUNE_INTERVAL,
+                 recheck_interval=RECHECK_INTERVAL):
+        self.process_table = process_table or create_process_table()
+        self.cache = {}
+        self.prune_interval = prune_interval
+        self.last_prune = time.monotonic()
+        self.recheck_interval = recheck_interval
+        self.recheck_queue = deque()  # 이번 바퀴에 아직 다시 조회하지 않은 PID
+        self.last_full_scan = None
+
+    def __len__(self):
+        return len(self.cache)
+
+    def known(self):
+        """이미 확인한 프로세스의 (pid, name) 목록 (조회 없이 캐시에서, 규칙이 바뀌었을 때 다시 판정용)"""
+        return [(pid, name) for pid, (_, name) in self.cache.items() if name is not None]
+
+    def _resolve(self, pid):
+        """PID의 (create_time, name) 조회
+
+        종료된 프로세스면 None, 권한이 없으면 (None, None)을 반환한다.
+        """
+        try:
+            return self.process_table.identify(pid)
+        except psutil.NoSuchProcess:
+            return None
+        except psutil.AccessDenied:
+            # 다음 검사에서 다시 조회하지 않도록 이름 없이 캐시
+            return None, None
+
+    def _prune(self, current_pids):
+        """종료된 PID 캐시 제거"""
+        for pid in self.cache.keys() - current_pids:
+            del self.cache[pid]
+        self.last_prune = time.monotonic()
+
+    def _recheck_batch(self):
+        """이번 전체 검사에서 다시 조회할 캐시의 PID (지난 검사 이후 흐른 시간만큼)"""
+        now = time.monotonic()
+        elapsed = now - self.last_full_scan if self.last_full_scan is not None else 0.0
+        self.last_full_scan = now
+        if not self.cache or elapsed <= 0:
+            return []
+        count = min(len(self.cache), math.ceil(len(self.cache) * elapsed / self.recheck_interval))
+        batch = []
+        while len(batch) < count:
+            if not self.recheck_queue:
+                self.recheck_queue.extend(self.cache.keys())  # 새 바퀴 시작
+            pid = self.recheck_queue.popleft()
+            if pid in self.cache:
+                batch.append(pid)
+        return batch
+
+    def scan(self, pids=None):
+        """새로 확인된 프로세스의 (pid, name) 목록 반환
+
+        pids가 None이면 전체 PID 목록과 캐시를 비교하고,
+        PID 목록이 주어지면(exec 이벤트) 해당 PID를 다시 조회한다.
+        (pid, create_time)이나 이름이 캐시와 달라진 프로세스도 새로 확인된 것으로 본다.
+        """
+        found = []
+
+        if pids is None:
+            current = set(self.process_table.pids())
+            self._prune(current)
+            targets = list(current - self.cache.keys())
+            targets.extend(self._recheck_batch())
+        else:
+            # exec 이후에는 이름이 바뀌므로 캐시 여부와 무관하게 재조회
+            targets = pids
+            if time.monotonic() - self.last_prune >= self.prune_interval:
+                self._prune(set(self.process_table.pids()))
+
+        for pid in targets:
+            identity = self._resolve(pid)
+            if identity is None:
+                self.cache.pop(pid, None)
+                continue
+            # 같은 (pid, create_time)에 같은 이름이면 이미 분류된 프로세스
+            if self.cache.get(pid) == identity:
+                continue
+            self.cache[pid] = identity
+            if identity[1] is not None:
+                found.append((pid, identity[1]))
+
+        return found
@@ -0,0 +1,297 @@
+"""프로세스 실행 이벤트 소스
+
+감시 루프가 매초 전체 프로세스 테이블을 훑지 않도록,
+새 프로세스 실행(exec)을 OS에서 직접 통지받는 백엔드를 제공한다.
+
+- Linux: netlink proc connector (root / CAP_NET_ADMIN 필요)
+- macOS: kqueue EVFILT_PROC (fork/exec 통지)
+- 그 외 / 실패 시: 기존 1초 폴링 방식
+"""
+import os
+import select
+import socket
+import struct
+import sys
+import threading
+import time
+
+import psutil
+
+# 기본 대기 시간 (초) - 이벤트가 없어도 이 주기로 종료 시간 등을 확인
+DEFAULT_TIMEOUT = 1.0
+
+
+class LaunchEventSource:
+    """실행 이벤트 소스 공통 인터페이스
+
+    wait()는 새로 실행된 PID 목록을 반환한다.
+    None을 반환하면 전체 프로세스 검사가 필요하다는 뜻이다.
+    """
+    name = "base"
+
+    def start(self):
+        """이벤트 수신 시작 (실패 시 OSError)"""
+
+    def wait(self, timeout=DEFAULT_TIMEOUT):
+        """timeout 동안 이벤트 대기 후 후보 PID 목록 반환 (wake()로 깨우면 바로 반환)"""
+        raise NotImplementedError
+
+    def wake(self):
+        """대기 중인 wait()를 바로 반환시킴 (다른 스레드에서 호출)
+
+        대기 중이 아닐 때 부르면 다음 wait()가 기다리지 않고 반환한다.
+        """
+
+    def close(self):
+        """리소스 정리"""
+
+
+class Waker:
+    """select/kqueue 대기를 다른 스레드에서 깨우는 self-pipe
+
+    threading.Event는 select로 기다릴 수 없으므로 파이프에 1바이트를 써서 깨운다.
+    """
+
+    def __init__(self):
+        self.read_fd, self.write_fd = os.pipe()
+        os.set_blocking(self.read_fd, False)
+        os.set_blocking(self.write_fd, False)
+
+    def fileno(self):
+        return self.read_fd
+
+    def wake(self):
+        try:
+            os.write(self.write_fd, b'\0')
+        except BlockingIOError:
+            pass  # 이미 깨울 신호가 쌓여 있음
+
+    def drain(self):
+        """쌓인 신호 비우기 (깨어난 뒤 호출)"""
+        try:
+            while os.read(self.read_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self):
+        os.close(self.read_fd)
+        os.close(self.write_fd)
+
+
+class PollingLaunchSource(LaunchEventSource):
+    """기존 방식: 일정 주기마다 전체 검사 요청"""
+    name = "polling"
+
+    def __init__(self):
+        self.woken = threading.Event()
+
+    def wait(self, timeout=DEFAULT_TIMEOUT):
+        self.woken.wait(timeout)
+        self.woken.clear()
+        return None
+
+    def wake(self):
+        self.woken.set()
+
+
+class NetlinkLaunchSource(LaunchEventSource):
+    """Linux netlink proc connector 기반 exec 이벤트 소스"""
+    name = "netlink"
+
+    NETLINK_CONNECTOR = 11
+    CN_IDX_PROC = 1
+    CN_VAL_PROC = 1
+    NLMSG_DONE = 3
+    PROC_CN_MCAST_LISTEN = 1
+    PROC_CN_MCAST_IGNORE = 2
+    PROC_EVENT_NONE = 0
+    PROC_EVENT_EXEC = 0x00000002
+
+    # nlmsghdr(16) + cn_msg(20) 이후 proc_event 시작 위치
+    _EVENT_OFFSET = 36
+    # proc_event 헤더(what, cpu, timestamp) 이후 event_data 위치
+    _DATA_OFFSET = _EVENT_OFFSET + 16
+
+    def __init__(self):
+        self.sock = None
+        self.waker = None
+
+    def _control_message(self, op):
+        payload = struct.pack('=I', op)
+        cn_msg = struct.pack('=IIIIHH', self.CN_IDX_PROC, self.CN_VAL_PROC,
+                             0, 0, len(payload), 0) + payload
+        header = struct.pack('=IHHII', 16 + len(cn_msg), self.NLMSG_DONE,
+                             0, 0, os.getpid())
+        return header + cn_msg
+
+    def start(self):
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, self.NETLINK_CONNECTOR)
+        try:
+            # 멀티캐스트 그룹 가입은 CAP_NET_ADMIN 없으면 EPERM
+            sock.bind((0, self.CN_IDX_PROC))
+            sock.send(self._control_message(self.PROC_CN_MCAST_LISTEN))
+
+            # 커널 ACK 확인 (권한 부족 시 err 필드로 거부됨)
+            readable, _, _ = select.select([sock], [], [], 0.5)
+            if readable:
+                data = sock.recv(65536)
+                if len(data) >= self._DATA_OFFSET + 4:
+                    what, = struct.unpack_from('=I', data, self._EVENT_OFFSET)
+                    err, = struct.unpack_from('=I', data, self._DATA_OFFSET)
+                    if what == self.PROC_EVENT_NONE and err:
+                        raise OSError(err, os.strerror(err))
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+        self.waker = Waker()
+
+    def _parse(self, data):
+        """수신 버퍼에서 exec 이벤트의 PID(tgid) 추출"""
+        pids = []
+        offset = 0
+        while offset + 16 <= len(data):
+            msg_len, = struct.unpack_from('=I', data, offset)
+            if msg_len < 16:
+                break
+            base = offset + self._EVENT_OFFSET
+            if offset + msg_len >= base + 24:
+                what, = struct.unpack_from('=I', data, base)
+                if what == self.PROC_EVENT_EXEC:
+                    _, tgid = struct.unpack_from('=II', data, base + 16)
+                    pids.append(tgid)
+            offset += (msg_len + 3) & ~3  # NLMSG_ALIGN
+        return pids
+
+    def wait(self, timeout=DEFAULT_TIMEOUT):
+        pids = []
+        deadline = time.monotonic() + timeout
+        remaining = timeout
+        while True:
+            readable, _, _ = select.select([self.sock, self.waker], [], [], remaining)
+            if not readable:
+                break
+            if self.waker in readable:
+                # 중지/규칙 변경 요청 - 받은 이벤트까지만 반환
+                self.waker.drain()
+                if self.sock not in readable:
+                    break
+            try:
+                pids.extend(self._parse(self.sock.recv(65536)))
+            except OSError:
+                # ENOBUFS 등 이벤트 유실 - 전체 검사로 보정
+                return None
+            # 이벤트를 받으면 남은 버퍼만 비우고 즉시 반환
+            remaining = 0
+            if time.monotonic() >= deadline:
+                break
+        return pids
+
+    def close(self):
+        if self.sock is not None:
+            try:
+                self.sock.send(self._control_message(self.PROC_CN_MCAST_IGNORE))
+            except OSError:
+                pass
+            self.sock.close()
+            self.sock = None
+        if self.waker is not None:
+            self.waker.close()
+            self.waker = None
+
+    def wake(self):
+        if self.waker is not None:
+            self.waker.wake()
+
+
+class KqueueLaunchSource(LaunchEventSource):
+    """macOS kqueue 기반 실행 이벤트 소스
+
+    macOS에는 시스템 전역 exec 통지가 없으므로, 알려진 프로세스마다
+    EVFILT_PROC(fork/exec)를 등록하고 통지가 오면 PID 목록을 비교해
+    새 프로세스를 찾는다. 등록하지 못한 부모에서 생긴 프로세스는
+    timeout 마다 수행하는 PID 비교로 보완한다.
+    """
+    name = "kqueue"
+
+    def __init__(self):
+        self.kq = None
+        self.waker = None
+        self.known_pids = set()
+
+    def start(self):
+        self.kq = select.kqueue()
+        self.waker = Waker()
+        self.kq.control([select.kevent(self.waker.fileno(), filter=select.KQ_FILTER_READ,
+                                       flags=select.KQ_EV_ADD)], 0, 0)
+        self.known_pids = set(psutil.pids())
+        self._register(self.known_pids)
+
+    def _register(self, pids):
+        fflags = select.KQ_NOTE_FORK | select.KQ_NOTE_EXEC
+        for pid in pids:
+            event = select.kevent(pid, filter=select.KQ_FILTER_PROC,
+                                  flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                                  fflags=fflags)
+            try:
+                self.kq.control([event], 0, 0)
+            except OSError:
+                # 권한 없음 / 이미 종료된 프로세스
+                pass
+
+    def wait(self, timeout=DEFAULT_TIMEOUT):
+        exec_pids = []
+        try:
+            events = self.kq.control(None, 64, timeout)
+        except OSError:
+            return None
+        for event in events:
+            if event.filter == select.KQ_FILTER_READ:
+                self.waker.drain()  # 중지/규칙 변경 요청
+            elif event.fflags & select.KQ_NOTE_EXEC:
+                exec_pids.append(event.ident)
+
+        # 새로 생긴 PID 찾기 (exit된 PID는 kqueue가 자동 해제)
+        current = set(psutil.pids())
+        new_pids = current - self.known_pids
+        self.known_pids = current
+        self._register(new_pids)
+
+        candidates = set(new_pids)
+        candidates.update(pid for pid in exec_pids if pid in current)
+        return list(candidates)
+
+    def close(self):
+        if self.kq is not None:
+            self.kq.close()
+            self.kq = None
+        if self.waker is not None:
+            self.waker.close()
+            self.waker = None
+
+    def wake(self):
+        if self.waker is not None:
+            self.waker.wake()
+
+
+def create_launch_source():
+    """플랫폼에 맞는 이벤트 소스 생성 (실패 시 폴링으로 대체)"""
+    candidates = []
+    if sys.platform.startswith('linux'):
+        candidates.append(NetlinkLaunchSource)
+    elif hasattr(select, 'kqueue'):
+        candidates.append(KqueueLaunchSource)
+
+    for source_class in candidates:
+        source = source_class()
+        try:
+            source.start()
+            return source
+        except (OSError, AttributeError):
+            source.close()
+
+    source = PollingLaunchSource()
+    source.start()
+    return source
+
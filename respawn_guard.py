@@ -0,0 +1,86 @@
+"""재실행 폭주(respawn storm) 감지
+
+launchd KeepAlive, systemd Restart=, 자체 감시 프로세스가 있는 앱은
+종료하자마자 다시 실행되어 종료 -> 재실행 -> 종료가 끝없이 반복되고
+양쪽 모두 앱 시작 비용을 계속 치른다.
+앱마다 최근 window초 동안 차단한 횟수를 세어 threshold번에 이르면
+대응 단계를 한 단계 올린다.
+
+단계:
+- kill: 프로세스 트리 종료 (기본)
+- hold: 종료 대신 일시 정지(SIGSTOP)해서 세션 끝까지 붙잡아 둠
+  (살아 있는 것으로 보이므로 실행기가 다시 띄우지 않음)
+- parent: 붙잡아 둬도 계속 새로 실행되면 부모 실행기까지 일시 정지
+"""
+import time
+from collections import deque
+
+LEVEL_KILL = 'kill'
+LEVEL_HOLD = 'hold'
+LEVEL_PARENT = 'parent'
+LEVELS = (LEVEL_KILL, LEVEL_HOLD, LEVEL_PARENT)
+
+DEFAULT_CONFIG = {
+    'window': 60.0,  # 재실행 횟수를 세는 구간 (초)
+    'threshold': 3,  # 구간 안에서 이 횟수만큼 차단되면 단계를 올림
+}
+
+
+def load_respawn_config(config):
+    """설정 파일의 respawn 항목을 기본값과 합쳐 검증"""
+    merged = dict(DEFAULT_CONFIG)
+    try:
+        window = float(config.get('window', merged['window']))
+        if window > 0:
+            merged['window'] = window
+    except (TypeError, ValueError):
+        pass
+    try:
+        threshold = int(config.get('threshold', merged['threshold']))
+        if threshold >= 2:
+            merged['threshold'] = threshold
+    except (TypeError, ValueError):
+        pass
+    return merged
+
+
+class RespawnTracker:
+    """앱별 차단 시각을 슬라이딩 윈도로 세어 대응 단계 결정"""
+
+    def __init__(self, window=DEFAULT_CONFIG['window'], threshold=DEFAULT_CONFIG['threshold'],
+                 clock=time.monotonic):
+        self.window = window
+        self.threshold = threshold
+        self.clock = clock
+        self.launches = {}  # 앱 이름 -> 최근 차단 시각 deque
+        self.levels = {}  # 앱 이름 -> 단계 번호 (LEVELS 인덱스)
+
+    @classmethod
+    def from_config(cls, config=None):
+        return cls(**load_respawn_config(config or {}))
+
+    def level(self, app_name):
+        return LEVELS[self.levels.get(app_name, 0)]
+
+    def record(self, app_name):
+        """차단 한 번 기록 (단계가 올라가면 (단계, 구간 내 횟수), 아니면 None)"""
+        now = self.clock()
+        launches = self.launches.get(app_name)
+        if launches is None:
+            launches = self.launches[app_name] = deque()
+        launches.append(now)
+        while launches[0] <= now - self.window:
+            launches.popleft()
+
+        index = self.levels.get(app_name, 0)
+        if len(launches) < self.threshold or index == len(LEVELS) - 1:
+            return None
+        # 다음 단계로 올리고, 그 단계에서도 다시 threshold번 실행되어야 또 올림
+        count = len(launches)
+        launches.clear()
+        self.levels[app_name] = index + 1
+        return LEVELS[index + 1], count
+
+    def storming(self):
+        """kill 단계를 넘은 앱 {이름: 단계}"""
+        return {name: LEVELS[index] for name, index in self.levels.items() if index}
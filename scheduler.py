@@ -0,0 +1,85 @@
+"""적응형 검사 주기 스케줄러
+
+- 버스트: 차단(실행 시도)이 있으면 burst_window 동안 min_interval로 촘촘히 검사
+- 백오프: 아무것도 없으면 base_interval부터 max_interval까지 2배씩 늘림
+- CPU 예산: 검사에 쓴 CPU 시간 비율이 cpu_budget을 넘지 않도록 간격 확대
+- 종료 시각: 남은 시간보다 오래 자지 않아 종료 시각에 정확히 깨어남
+"""
+import time
+
+DEFAULT_CONFIG = {
+    'min_interval': 0.1,  # 버스트 중 검사 간격 (초)
+    'base_interval': 1.0,  # 기본 검사 간격 (초)
+    'max_interval': 5.0,  # 백오프 최대 간격 (초)
+    'burst_window': 10.0,  # 차단 후 촘촘히 검사하는 시간 (초)
+    'cpu_budget': 0.005,  # 감시 스레드 CPU 사용 상한 (코어 비율)
+}
+
+
+def load_scheduler_config(config):
+    """설정 파일의 scheduler 항목을 기본값과 합쳐 검증"""
+    merged = dict(DEFAULT_CONFIG)
+    for key, default in DEFAULT_CONFIG.items():
+        try:
+            value = float(config.get(key, default))
+        except (TypeError, ValueError):
+            continue
+        if value > 0:
+            merged[key] = value
+    # 최소 <= 기본 <= 최대 순서 보장
+    merged['base_interval'] = max(merged['base_interval'], merged['min_interval'])
+    merged['max_interval'] = max(merged['max_interval'], merged['base_interval'])
+    return merged
+
+
+class ScanScheduler:
+    """검사 결과에 따라 다음 대기 시간을 결정"""
+
+    def __init__(self, min_interval, base_interval, max_interval, burst_window, cpu_budget):
+        self.min_interval = min_interval
+        self.base_interval = base_interval
+        self.max_interval = max_interval
+        self.burst_window = burst_window
+        self.cpu_budget = cpu_budget
+
+        self.idle_sweeps = 0  # 연속으로 아무것도 차단하지 않은 검사 수
+        self.burst_until = 0.0
+        self.budget_floor = 0.0  # CPU 예산을 지키기 위한 최소 대기 시간
+        self.last_cpu = time.thread_time()
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(**load_scheduler_config(config or {}))
+
+    def record(self, matched):
+        """검사 한 번의 결과 기록 (감시 스레드에서 호출)
+
+        matched: 차단한 프로세스 수
+        """
+        now = time.monotonic()
+        cpu = time.thread_time()
+        cpu_used = cpu - self.last_cpu
+        self.last_cpu = cpu
+
+        if matched:
+            # 재실행에 대비해 일정 시간 촘촘히 검사
+            self.burst_until = now + self.burst_window
+            self.idle_sweeps = 0
+        elif now >= self.burst_until:
+            self.idle_sweeps += 1
+
+        # CPU 예산: 이번 검사 비용 / 예산 만큼은 쉬어야 함 (최대 간격까지만)
+        self.budget_floor = min(cpu_used / self.cpu_budget, self.max_interval)
+
+    def next_timeout(self, remaining=None):
+        """다음 검사까지 대기할 시간 (remaining: 세션 종료까지 남은 초)"""
+        if time.monotonic() < self.burst_until:
+            timeout = self.min_interval
+        else:
+            # 첫 대기는 기본 간격, 이후 한가할 때마다 2배씩
+            backoff = 2 ** min(max(self.idle_sweeps - 1, 0), 16)
+            timeout = min(self.base_interval * backoff, self.max_interval)
+        timeout = max(timeout, self.budget_floor)
+        if remaining is not None:
+            timeout = min(timeout, max(remaining, 0.0))
+        return timeout
@@ -0,0 +1,55 @@
+"""세션 시계 (벽시계 변경에 영향받지 않는 남은 시간 계산)
+
+datetime.now()로 남은 시간을 계산하면 NTP 보정이나 수동 시각 변경에
+세션이 줄거나 늘어난다. 세션 시계는 단조 시계를 쓰되, 잠자기 시간도
+포함하는 시계를 골라서 덮개를 닫았다 열어도 종료 시각이 그대로 지켜진다.
+- Linux: CLOCK_BOOTTIME (잠자기 포함)
+- macOS: CLOCK_MONOTONIC (잠자기 포함, time.monotonic은 잠자기 제외)
+- 그 외: time.monotonic
+"""
+import sys
+import time
+from datetime import datetime, timedelta
+
+
+def _pick_clock():
+    if sys.platform.startswith('linux') and hasattr(time, 'CLOCK_BOOTTIME'):
+        clock_id = time.CLOCK_BOOTTIME
+    elif sys.platform == 'darwin' and hasattr(time, 'CLOCK_MONOTONIC'):
+        clock_id = time.CLOCK_MONOTONIC
+    else:
+        return time.monotonic
+    try:
+        time.clock_gettime(clock_id)
+    except OSError:
+        return time.monotonic
+    return lambda: time.clock_gettime(clock_id)
+
+
+session_time = _pick_clock()
+
+
+def seconds_to_next_tick(now=None):
+    """다음 정각 초까지 남은 시간 (초)"""
+    now = time.time() if now is None else now
+    return 1.0 - (now % 1.0)
+
+
+class SessionClock:
+    """집중 세션 하나의 종료 시점
+
+    deadline: 세션 시계 기준 종료 시점
+    end_time: 화면 표시용 종료 시각 (시작할 때 한 번만 계산)
+    """
+
+    def __init__(self, duration):
+        self.duration = duration
+        self.deadline = session_time() + duration
+        self.end_time = datetime.now() + timedelta(seconds=duration)
+
+    def remaining(self):
+        """남은 시간 (초, 0 이상)"""
+        return max(self.deadline - session_time(), 0.0)
+
+    def expired(self):
+        return self.remaining() <= 0
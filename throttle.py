@@ -0,0 +1,411 @@
+"""CPU 사용 제한 (throttle 방식 앱)
+
+업무상 끌 수 없는 앱(당직용 메신저 등)은 종료하지 않고 CPU만 덜 쓰게 한다.
+- nice: 우선순위를 낮춤 (되돌릴 권한이 있을 때만 - root, 또는 Linux RLIMIT_NICE 범위 안)
+- 백그라운드 정책: macOS taskpolicy -b (일반 사용자도 되돌릴 수 있음)
+- CPU 묶기: 지정한 CPU에서만 실행 (Linux/Windows, CPU가 2개 이상일 때)
+- cgroup v2 cpu.max: CPU 사용량 상한 (Linux, cpu 컨트롤러를 쓸 수 있을 때만)
+
+바꾸기 전 값을 프로세스마다 기억해 두고 세션이 끝나면 모두 되돌린다.
+원래 값은 바꾸기 전에 파일(~/.focus_mode_throttled.json)에도 기록해서
+감시 프로세스가 비정상 종료하면 다음에 시작할 때 되돌린다.
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+
+import psutil
+
+from config_store import write_atomic
+from enforcement import collect_trees
+from freeze_registry import CREATE_TIME_TOLERANCE
+
+DEFAULT_CONFIG = {
+    'nice': 19,  # 낮출 우선순위 (Unix nice 값, 클수록 양보)
+    'cpus': 1,  # 묶어 둘 CPU 개수 (마지막 CPU부터)
+    'cpu_max': 0.25,  # cgroup v2 CPU 상한 (코어 비율)
+}
+
+CGROUP_NAME = 'focus-mode-throttle'
+# 감시 프로세스가 옮겨 가는 leaf 그룹 (CGROUP_NAME과 같은 부모 아래)
+DAEMON_CGROUP = 'focus-mode-daemon'
+CPU_MAX_PERIOD = 100000  # cpu.max 주기 (마이크로초)
+
+
+def load_throttle_config(config):
+    """설정 파일의 throttle 항목을 기본값과 합쳐 검증"""
+    merged = dict(DEFAULT_CONFIG)
+    for key, cast in (('nice', int), ('cpus', int), ('cpu_max', float)):
+        try:
+            value = cast(config.get(key, merged[key]))
+        except (TypeError, ValueError):
+            continue
+        if key == 'nice':
+            merged[key] = max(-20, min(value, 19))
+        elif value > 0:
+            merged[key] = value
+    return merged
+
+
+def _cgroup2_mount():
+    """cgroup v2가 마운트된 경로 (없으면 None)"""
+    try:
+        with open('/proc/self/mounts', 'r') as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) > 2 and fields[2] == 'cgroup2':
+                    return fields[1]
+    except OSError:
+        pass
+    return None
+
+
+def _cgroup_of(pid):
+    """프로세스가 속한 cgroup v2 경로 (/proc/<pid>/cgroup의 0:: 항목)"""
+    with open(f'/proc/{pid}/cgroup', 'r') as f:
+        for line in f:
+            if line.startswith('0::'):
+                return line[3:].strip()
+    return None
+
+
+def _move_to_cgroup(mount, group, pid):
+    """프로세스를 cgroup으로 옮김 (group은 마운트 기준 경로, 실패하면 False)"""
+    try:
+        with open(os.path.join(mount, group.lstrip('/'), 'cgroup.procs'), 'w') as f:
+            f.write(str(pid))
+    except OSError:
+        return False  # 이미 종료됨 / 권한 없음
+    return True
+
+
+class CgroupQuota:
+    """cgroup v2 하위 그룹 하나에 cpu.max를 걸고 프로세스를 옮김
+
+    cgroup v2는 프로세스가 들어 있는 그룹의 하위 그룹에 컨트롤러를 켤 수 없다
+    (no internal processes 규칙, EBUSY). 그래서 감시 프로세스를 먼저 하위
+    leaf 그룹(DAEMON_CGROUP)으로 옮긴 뒤 원래 그룹에서 cpu 컨트롤러를 켜고,
+    제한 그룹(CGROUP_NAME)은 leaf 옆에 만든다.
+
+    원래 그룹에 다른 프로세스가 남아 있지 않고 cpu 컨트롤러를 쓸 수 있을 때만
+    동작한다 (systemd Delegate=yes 서비스, root 실행 등).
+    중간에 실패하면 옮기고 만든 것을 모두 되돌려서 cgroup 구조를 바꾸지 않는다.
+    """
+
+    def __init__(self, cpu_max):
+        self.cpu_max = cpu_max
+        self.mount = None
+        self.path = None
+
+    @staticmethod
+    def locate():
+        """(마운트 경로, 감시 프로세스의 원래 그룹 경로) (cgroup v2가 없으면 None)"""
+        mount = _cgroup2_mount()
+        if mount is None:
+            return None
+        try:
+            own = _cgroup_of(os.getpid())
+        except OSError:
+            return None
+        if own is None:
+            return None
+        if os.path.basename(own) == DAEMON_CGROUP:
+            own = os.path.dirname(own)  # 이전 세션에서 이미 leaf로 옮겨 둠
+        return mount, os.path.join(mount, own.lstrip('/'))
+
+    def open(self):
+        """그룹 생성 (쓸 수 없으면 False)"""
+        located = self.locate()
+        if located is None:
+            return False
+        mount, parent = located
+        leaf = os.path.join(parent, DAEMON_CGROUP)
+        path = os.path.join(parent, CGROUP_NAME)
+        done = []  # 되돌릴 단계 (실패하면 역순으로 되돌림)
+        try:
+            with open(os.path.join(parent, 'cgroup.controllers'), 'r') as f:
+                if 'cpu' not in f.read().split():
+                    return False
+            # 다른 프로세스가 남아 있으면 컨트롤러를 켤 수 없으므로(EBUSY) 아무것도 옮기지 않음
+            with open(os.path.join(parent, 'cgroup.procs'), 'r') as f:
+                if any(int(pid) != os.getpid() for pid in f.read().split()):
+                    return False
+            with open(os.path.join(parent, 'cgroup.subtree_control'), 'r') as f:
+                cpu_enabled = 'cpu' in f.read().split()
+
+            # 감시 프로세스를 leaf로 옮겨 원래 그룹을 비운 뒤 컨트롤러 켜기
+            if not os.path.isdir(leaf):
+                os.mkdir(leaf)
+                done.append('leaf')
+            if os.path.basename(_cgroup_of(os.getpid()) or '') != DAEMON_CGROUP:
+                with open(os.path.join(leaf, 'cgroup.procs'), 'w') as f:
+                    f.write(str(os.getpid()))
+                done.append('moved')
+            if not cpu_enabled:
+                with open(os.path.join(parent, 'cgroup.subtree_control'), 'w') as f:
+                    f.write('+cpu')
+                done.append('cpu')
+            if not os.path.isdir(path):
+                os.mkdir(path)
+                done.append('group')
+            quota = max(1000, int(self.cpu_max * CPU_MAX_PERIOD))
+            with open(os.path.join(path, 'cpu.max'), 'w') as f:
+                f.write(f'{quota} {CPU_MAX_PERIOD}')
+        except (OSError, ValueError):
+            self._undo(parent, done)  # 권한 없음 / 그 사이 다른 프로세스가 들어옴(EBUSY)
+            return False
+        self.mount = mount
+        self.path = path
+        return True
+
+    @staticmethod
+    def _undo(parent, done):
+        """open()에서 바꾼 것을 역순으로 되돌림 (되돌리다 실패한 단계는 건너뜀)"""
+        for step in reversed(done):
+            try:
+                if step == 'group':
+                    os.rmdir(os.path.join(parent, CGROUP_NAME))
+                elif step == 'cpu':
+                    with open(os.path.join(parent, 'cgroup.subtree_control'), 'w') as f:
+                        f.write('-cpu')
+                elif step == 'moved':
+                    with open(os.path.join(parent, 'cgroup.procs'), 'w') as f:
+                        f.write(str(os.getpid()))
+                elif step == 'leaf':
+                    os.rmdir(os.path.join(parent, DAEMON_CGROUP))
+            except OSError as e:
+                print(f"cgroup 되돌리기 실패 ({step}): {e}")
+
+    def move(self, pid):
+        """프로세스를 제한 그룹으로 옮김 (실패하면 False)"""
+        return _move_to_cgroup(self.path, '', pid)
+
+    def close(self):
+        """제한 그룹 삭제 (감시 프로세스는 leaf에 그대로 둠)"""
+        if self.path is not None:
+            try:
+                os.rmdir(self.path)
+            except OSError:
+                pass  # 아직 남은 프로세스가 있음 (종료되면 비워짐)
+            self.path = None
+
+
+def _nice_floor():
+    """이 프로세스가 설정할 수 있는 가장 낮은 nice 값"""
+    if hasattr(os, 'geteuid') and os.geteuid() == 0:
+        return -20
+    if sys.platform.startswith('linux'):
+        import resource
+        soft, _ = resource.getrlimit(resource.RLIMIT_NICE)
+        if soft == resource.RLIM_INFINITY:
+            return -20
+        return 20 - soft  # RLIMIT_NICE는 20 - nice 형식
+    return 20  # 일반 사용자는 nice를 되돌릴 수 없음
+
+
+def _taskpolicy(pid, flag):
+    """macOS 백그라운드 정책 설정(-b)/해제(-B) (성공 여부)"""
+    try:
+        result = subprocess.run(['taskpolicy', flag, '-p', str(pid)], capture_output=True)
+    except OSError:
+        return False
+    return result.returncode == 0
+
+
+class Throttler:
+    """throttle 방식 앱의 프로세스 제한과 복원 (path가 None이면 원래 값을 메모리에만 보관)"""
+
+    def __init__(self, config=None, path=None):
+        self.config = load_throttle_config(config or {})
+        self.path = path
+        self.lock = threading.Lock()
+        self.saved = {}  # pid -> (psutil.Process, 원래 nice, 원래 CPU 목록, 원래 cgroup, taskpolicy 여부)
+        self.cgroup = None  # 처음 제한할 때 준비 (쓸 수 없으면 False)
+        self.cpus = self._pick_cpus()
+        self.nice_floor = _nice_floor()
+        self.taskpolicy = sys.platform == 'darwin' and shutil.which('taskpolicy') is not None
+
+    def __len__(self):
+        return len(self.saved)
+
+    def _pick_cpus(self):
+        """묶어 둘 CPU 목록 (묶을 수 없거나 의미가 없으면 None)"""
+        if not hasattr(psutil.Process, 'cpu_affinity'):
+            return None  # macOS는 지원하지 않음
+        try:
+            available = psutil.Process().cpu_affinity()
+        except psutil.Error:
+            return None
+        if len(available) <= self.config['cpus']:
+            return None
+        return available[-self.config['cpus']:]
+
+    def apply_pids(self, pids):
+        """PID 목록의 프로세스 트리 제한 (헬퍼 프로세스 포함)"""
+        roots = []
+        for pid in pids:
+            try:
+                roots.append(psutil.Process(pid))
+            except psutil.NoSuchProcess:
+                pass
+        return self.apply(collect_trees(roots)) if roots else 0
+
+    def apply(self, procs):
+        """프로세스 제한 (제한한 수 반환, 이미 제한한 프로세스는 건너뜀)"""
+        with self.lock:
+            if self.cgroup is None:
+                quota = CgroupQuota(self.config['cpu_max'])
+                self.cgroup = quota if quota.open() else False
+
+            # 원래 값을 먼저 모아서 기록 (바꾼 뒤 기록하기 전에 죽으면 되돌릴 수 없음)
+            planned = {}
+            for proc in procs:
+                if proc.pid in self.saved or proc.pid in planned:
+                    continue
+                try:
+                    nice = proc.nice()
+                    cpus = proc.cpu_affinity() if self.cpus else None
+                    cgroup = _cgroup_of(proc.pid) if self.cgroup else None
+                except (psutil.Error, OSError):
+                    continue
+                # 되돌릴 수 있을 때만 낮춤 (이미 더 낮으면 그대로)
+                if not self.nice_floor <= nice < self.config['nice']:
+                    nice = None
+                planned[proc.pid] = (proc, nice, cpus, cgroup, self.taskpolicy)
+            if not planned:
+                return 0
+            self.saved.update(planned)
+            self._save()
+
+            failed = 0
+            changed = False  # 기록과 실제 적용 결과가 달라짐
+            for pid, (proc, nice, cpus, cgroup, background) in planned.items():
+                try:
+                    if nice is not None:
+                        proc.nice(self.config['nice'])
+                except psutil.Error:
+                    del self.saved[pid]
+                    failed += 1
+                    continue
+                try:
+                    if cpus is not None:
+                        proc.cpu_affinity(self.cpus)
+                except psutil.Error:
+                    # 이미 낮춘 nice는 되돌리고 제외
+                    if nice is not None:
+                        try:
+                            proc.nice(nice)
+                        except psutil.Error:
+                            pass
+                    del self.saved[pid]
+                    failed += 1
+                    continue
+                # 옮기지 못한 cgroup, 적용하지 못한 정책은 되돌릴 대상에서 뺌
+                if cgroup is not None and not self.cgroup.move(pid):
+                    cgroup = None
+                if background and not _taskpolicy(pid, '-b'):
+                    background = False
+                if (cgroup, background) != planned[pid][3:]:
+                    self.saved[pid] = (proc, nice, cpus, cgroup, background)
+                    changed = True
+            if failed or changed:
+                self._save()
+            return len(planned) - failed
+
+    def restore_all(self):
+        """제한한 프로세스를 원래대로 (세션 종료 시, 되돌린 수 반환)"""
+        with self.lock:
+            saved, self.saved = self.saved, {}
+            mount = self.cgroup.mount if self.cgroup else _cgroup2_mount()
+            restored = 0
+            for pid, (proc, nice, cpus, cgroup, background) in saved.items():
+                # psutil이 PID 재사용 여부를 확인 (다른 프로세스면 NoSuchProcess)
+                # 항목마다 따로 되돌려서 하나가 실패해도 나머지는 되돌림
+                try:
+                    if nice is not None:
+                        proc.nice(nice)
+                except psutil.NoSuchProcess:
+                    continue
+                except psutil.Error as e:
+                    print(f"우선순위 복원 실패 ({pid}): {e}")
+                try:
+                    if cpus is not None:
+                        proc.cpu_affinity(cpus)
+                except psutil.NoSuchProcess:
+                    continue
+                except psutil.Error as e:
+                    print(f"CPU 묶기 복원 실패 ({pid}): {e}")
+                if not proc.is_running():
+                    continue  # 그 사이 종료됨 / PID가 재사용됨
+                if cgroup is not None and mount is not None:
+                    _move_to_cgroup(mount, cgroup, pid)
+                if background:
+                    _taskpolicy(pid, '-B')
+                restored += 1
+            if self.cgroup:
+                self.cgroup.close()
+            self.cgroup = None
+            self._save()
+        return restored
+
+    def recover(self):
+        """이전 실행이 남긴 기록의 프로세스를 원래대로 (데몬 시작 시, 되돌린 수 반환)"""
+        if self.path is None:
+            return 0
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                entries = json.load(f).get('processes', [])
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"CPU 제한 목록을 읽을 수 없습니다: {e}")
+            entries = []
+
+        with self.lock:
+            for entry in entries:
+                try:
+                    proc = psutil.Process(int(entry['pid']))
+                    if abs(proc.create_time() - float(entry['create_time'])) > CREATE_TIME_TOLERANCE:
+                        continue  # PID가 재사용됨
+                    self.saved.setdefault(proc.pid, (
+                        proc, entry.get('nice'), entry.get('cpus'), entry.get('cgroup'),
+                        bool(entry.get('background'))))
+                except (psutil.Error, KeyError, TypeError, ValueError):
+                    continue
+        restored = self.restore_all()
+
+        # 이전 실행이 남긴 빈 제한 그룹 정리
+        located = CgroupQuota.locate()
+        if located is not None:
+            try:
+                os.rmdir(os.path.join(located[1], CGROUP_NAME))
+            except OSError:
+                pass
+        return restored
+
+    def _save(self):
+        """원래 값 기록 (잠금 안에서 호출, 비었으면 파일 삭제)"""
+        if self.path is None:
+            return
+        if not self.saved:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"CPU 제한 목록 삭제 실패: {e}")
+            return
+        entries = []
+        for pid, (proc, nice, cpus, cgroup, background) in self.saved.items():
+            try:
+                entries.append({'pid': pid, 'create_time': proc.create_time(), 'nice': nice,
+                                'cpus': cpus, 'cgroup': cgroup, 'background': background})
+            except psutil.Error:
+                pass
+        try:
+            write_atomic(self.path, json.dumps({'processes': entries}))
+        except OSError as e:
+            print(f"CPU 제한 목록 저장 실패: {e}")
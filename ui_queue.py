@@ -0,0 +1,62 @@
+"""메인 스레드 화면 갱신 큐 (tkinter)
+
+Tk 위젯은 메인 스레드에서만 건드릴 수 있으므로 백그라운드 스레드
+(감시 엔진, 제어 서버, 데몬 연결)는 갱신 작업을 이 큐에 넣고,
+Tk 메인 루프가 프레임마다 한 번씩 모아서 실행한다.
+
+- 같은 키의 작업이 한 프레임 안에 여러 번 들어오면 마지막 것만 실행 (합치기)
+- 큐가 비어 있으면 아무것도 예약하지 않으므로 한가할 때는 깨어나지 않음
+- 실행 간격은 1/fps초 이상으로 제한되어 차단 이벤트가 몰려도 창이 멈추지 않음
+"""
+import itertools
+import threading
+import time
+import tkinter as tk
+
+# 화면 갱신 최대 빈도 (초당 프레임)
+MAX_FPS = 30
+
+
+class UiQueue:
+    """스레드 안전 갱신 큐 (Tk 메인 루프가 비움)"""
+
+    def __init__(self, root, fps=MAX_FPS):
+        self.root = root
+        self.interval = 1.0 / fps
+        self.lock = threading.Lock()
+        self.pending = {}  # 키 -> (함수, 인자) (처음 들어온 순서대로 실행)
+        self.scheduled = False  # 메인 루프에 비우기가 예약되어 있는지
+        self.last_drain = 0.0
+        self.sequence = itertools.count()  # 합치지 않을 작업의 고유 키
+
+    def post(self, key, callback, *args):
+        """메인 스레드에서 실행할 작업 추가 (아무 스레드에서나 호출, key가 None이면 합치지 않음)"""
+        if key is None:
+            key = (None, next(self.sequence))
+        with self.lock:
+            self.pending[key] = (callback, args)
+            if self.scheduled:
+                return  # 이번 프레임에 함께 실행됨
+            self.scheduled = True
+            delay = max(0.0, self.last_drain + self.interval - time.monotonic())
+        try:
+            # 프레임마다 예약은 한 번만 (작업 수와 무관)
+            self.root.after(int(delay * 1000), self._drain)
+        except (RuntimeError, tk.TclError):
+            # 창이 이미 닫힘 / 메인 루프가 끝남 - 실행될 수 없는 작업은 버림
+            # (남겨 두면 다음 post가 올 때까지 쌓여 있다가 엉뚱한 때 실행됨)
+            with self.lock:
+                self.pending.clear()
+                self.scheduled = False
+
+    def _drain(self):
+        """쌓인 작업 실행 (메인 스레드)"""
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            self.scheduled = False
+            self.last_drain = time.monotonic()
+        for callback, args in pending.values():
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"화면 갱신 실패: {e}")
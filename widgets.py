@@ -0,0 +1,225 @@
+"""재사용 tkinter 위젯"""
+import sys
+import tkinter as tk
+import tkinter.font as tkfont
+
+
+class VirtualCheckList(tk.Frame):
+    """보이는 줄만 위젯을 만드는 체크박스 목록
+
+    항목이 수천 개여도 화면에 보이는 줄(+ 여유분)만큼의 Checkbutton을
+    만들어 두고, 스크롤/필터링 시 위젯을 다시 만들지 않고 내용만 바꿔 끼운다.
+    체크 상태는 위젯이 아니라 checked 딕셔너리(모델)에 저장된다.
+    """
+    ROW_HEIGHT = 26
+    OVERSCAN = 3  # 위아래로 미리 만들어 두는 줄 수
+    HIDDEN_Y = -1000  # 쓰지 않는 줄 위젯을 두는 위치
+
+    def __init__(self, master, checked, **kwargs):
+        super().__init__(master, **kwargs)
+        self.checked = checked  # 항목 이름 -> 체크 여부 (모델)
+        self.items = []
+        self.rows = []  # [Checkbutton, BooleanVar, 캔버스 아이템 id, 표시 중인 항목 번호]
+
+        self.canvas = tk.Canvas(self, highlightthickness=0,
+                                yscrollincrement=self.ROW_HEIGHT)
+        self.scrollbar = tk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.canvas.bind("<Configure>", lambda e: self._render())
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+
+    def set_items(self, items, keep_position=False):
+        """표시할 항목 교체 (keep_position이면 스크롤 위치 유지)"""
+        self.items = items
+        self.canvas.configure(scrollregion=(0, 0, 0, len(items) * self.ROW_HEIGHT))
+        if not keep_position:
+            self.canvas.yview_moveto(0)
+        # 같은 줄에 다른 항목이 올 수 있으므로 모든 줄을 다시 그리도록 표시
+        for row in self.rows:
+            row[3] = -1
+        self._render()
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._render()
+
+    def _on_mousewheel(self, event):
+        """마우스 휠 스크롤 처리 (macOS)"""
+        # macOS에서는 delta 값이 다름
+        if sys.platform == 'darwin':
+            self.canvas.yview_scroll(int(-1 * event.delta), "units")
+        else:
+            self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+
+    def _make_row(self):
+        var = tk.BooleanVar()
+        cb = tk.Checkbutton(self.canvas, variable=var, anchor="w")
+        cb.bind("<MouseWheel>", self._on_mousewheel)  # 휠 스크롤 바인딩
+        item_id = self.canvas.create_window(0, self.HIDDEN_Y, window=cb, anchor="nw")
+        row = [cb, var, item_id, None]
+        cb.configure(command=lambda: self._on_toggle(row))
+        self.rows.append(row)
+
+    def _on_toggle(self, row):
+        index = row[3]
+        if index is not None and index < len(self.items):
+            self.checked[self.items[index]] = row[1].get()
+
+    def _render(self):
+        """현재 보이는 범위에 줄 위젯 배치"""
+        height = max(self.canvas.winfo_height(), self.ROW_HEIGHT)
+        width = self.canvas.winfo_width()
+        first = max(int(self.canvas.canvasy(0) // self.ROW_HEIGHT) - self.OVERSCAN, 0)
+        count = height // self.ROW_HEIGHT + 2 * self.OVERSCAN + 1
+
+        while len(self.rows) < min(count, len(self.items)):
+            self._make_row()
+
+        for i, row in enumerate(self.rows):
+            cb, var, item_id, shown = row
+            index = first + i
+            if index >= len(self.items):
+                if shown is not None:
+                    # 남는 줄은 스크롤 영역 밖으로 치움
+                    self.canvas.coords(item_id, 0, self.HIDDEN_Y)
+                    row[3] = None
+                continue
+            if shown != index:
+                # 재활용: 위젯은 그대로 두고 내용과 위치만 교체
+                name = self.items[index]
+                cb.configure(text=name)
+                var.set(self.checked.get(name, False))
+                self.canvas.coords(item_id, 0, index * self.ROW_HEIGHT)
+                self.canvas.itemconfigure(item_id, width=width)
+                row[3] = index
+            elif width > 1:
+                self.canvas.itemconfigure(item_id, width=width)
+
+
+class TagFlow(tk.Frame):
+    """줄넘김되는 태그(이름 + 삭제 버튼) 목록
+
+    항목마다 태그 위젯을 하나씩 유지하고, 목록이 바뀌면 추가/삭제된 태그만
+    만들거나 없앤다. 태그 너비는 실제 글꼴로 잰 값(문자열별 캐시)으로 계산하고,
+    위치가 바뀐 태그만 다시 배치한다.
+    badges로 이름 앞에 표시(예: 일시 정지 앱의 ❄)를 붙일 수 있고,
+    on_menu가 있으면 태그를 오른쪽 클릭했을 때 (이름, 이벤트)로 호출한다.
+    """
+    MAX_WIDTH = 340  # 창에 배치되기 전 기본 줄 너비
+    TAG_PADX = 2
+    TAG_PADY = 2
+    EMPTY_HEIGHT = 50  # 안내 문구만 있을 때 높이
+    BG = "#E3F2FD"
+
+    def __init__(self, master, on_remove=None, on_menu=None, empty_text="", **kwargs):
+        super().__init__(master, **kwargs)
+        self.on_remove = on_remove
+        self.on_menu = on_menu
+        self.names = []
+        self.badges = {}  # 이름 -> 이름 앞 표시
+        self.tags = {}  # 이름 -> 태그 Frame
+        self.positions = {}  # 이름 -> 현재 배치된 (x, y)
+        self.widths = {}  # 문자열 -> 태그 너비 (글꼴 측정 캐시)
+        self.layout_width = 0
+
+        self.label_font = tkfont.Font(self, font=("", 10))
+
+        # 글꼴 너비를 뺀 고정 여백(padx, 테두리)은 견본 위젯으로 한 번만 잰다
+        probe = self._make_tag("")
+        probe.update_idletasks()
+        label, close = probe.winfo_children()
+        self.label_extra = label.winfo_reqwidth() - self.label_font.measure("")
+        self.close_width = close.winfo_reqwidth()
+        self.border = int(probe.cget("bd")) * 2
+        self.row_height = probe.winfo_reqheight() + 2 * self.TAG_PADY
+        probe.destroy()
+
+        self.empty_label = tk.Label(self, text=empty_text, fg="gray")
+        self.configure(width=self.MAX_WIDTH, height=self.EMPTY_HEIGHT)
+        self.empty_label.place(relx=0.5, rely=0.5, anchor="center")
+
+        self.bind("<Configure>", self._on_configure)
+
+    def _label_text(self, name):
+        badge = self.badges.get(name)
+        return f"{badge} {name}" if badge else name
+
+    def _make_tag(self, name):
+        tag = tk.Frame(self, bg=self.BG, relief=tk.RAISED, bd=1)
+        label = tk.Label(tag, text=self._label_text(name), bg=self.BG, fg="#1976D2",
+                         font=self.label_font, padx=5, pady=2)
+        label.pack(side=tk.LEFT)
+        close_btn = tk.Label(tag, text="✕", bg=self.BG, fg="#666",
+                             font=("", 9), cursor="hand2", padx=3)
+        close_btn.pack(side=tk.LEFT)
+        close_btn.bind("<Button-1>", lambda e: self._on_close(name))
+        if self.on_menu:
+            # macOS 트랙패드는 Button-2로 오는 경우가 있음
+            for sequence in ("<Button-3>", "<Button-2>"):
+                label.bind(sequence, lambda e: self.on_menu(name, e))
+        return tag
+
+    def _on_close(self, name):
+        if self.on_remove:
+            self.on_remove(name)
+
+    def _tag_width(self, name):
+        text = self._label_text(name)
+        width = self.widths.get(text)
+        if width is None:
+            width = (self.label_font.measure(text) + self.label_extra
+                     + self.close_width + self.border + 2 * self.TAG_PADX)
+            self.widths[text] = width
+        return width
+
+    def set_items(self, names, badges=None):
+        """표시할 이름 목록 반영 (바뀐 부분만 적용)"""
+        names = list(dict.fromkeys(names))  # 중복 제거 (순서 유지)
+        badges = dict(badges or {})
+        wanted = set(names)
+        # 표시가 바뀐 태그는 새로 만듦
+        changed = {name for name in self.tags if badges.get(name) != self.badges.get(name)}
+        self.badges = badges
+        for name in [name for name in self.tags if name not in wanted or name in changed]:
+            self.tags.pop(name).destroy()
+            self.positions.pop(name, None)
+        for name in names:
+            if name not in self.tags:
+                self.tags[name] = self._make_tag(name)
+        self.names = names
+        self._reflow()
+
+    def _reflow(self):
+        """줄넘김 위치 계산 후 위치가 바뀐 태그만 다시 배치"""
+        max_width = self.layout_width or self.MAX_WIDTH
+        x = y = 0
+        for name in self.names:
+            width = self._tag_width(name)
+            if x + width > max_width and x > 0:
+                x = 0
+                y += self.row_height
+            position = (x + self.TAG_PADX, y + self.TAG_PADY)
+            if self.positions.get(name) != position:
+                self.tags[name].place(x=position[0], y=position[1])
+                self.positions[name] = position
+            x += width
+
+        if self.names:
+            self.empty_label.place_forget()
+            height = y + self.row_height
+        else:
+            self.empty_label.place(relx=0.5, rely=0.5, anchor="center")
+            height = self.EMPTY_HEIGHT
+        if int(self.cget("height")) != height:
+            # 요청 크기가 바뀌면 창은 내용에 맞게 자동으로 커지고 줄어든다
+            self.configure(height=height)
+
+    def _on_configure(self, event):
+        # 실제 너비가 바뀐 경우에만 다시 배치 (높이 변경으로 인한 호출은 무시)
+        if event.width > 1 and event.width != self.layout_width:
+            self.layout_width = event.width
+            self._reflow()